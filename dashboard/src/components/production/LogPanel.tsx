@@ -16,6 +16,7 @@ function eventColor(event: PipelineEvent) {
     case "phase_error":
       return "text-red-400";
     case "pause":
+    case "events_dropped":
       return "text-amber-400";
     case "pipeline_done":
       return "text-emerald-400";
@@ -43,6 +44,10 @@ function formatEvent(event: PipelineEvent): string {
       return `● Pipeline terminé`;
     case "no_run":
       return `-- Aucun pipeline en cours`;
+    case "events_dropped":
+      return `… ${event.dropped ?? "?"} lignes de log plus anciennes non disponibles`;
+    case "image_job":
+      return `◆ image ${event.job?.model ?? ""} : ${event.job?.status ?? "?"}${event.job?.stage ? ` (${event.job.stage})` : ""}${event.job?.error ? ` — ${event.job.error}` : ""}`;
     case "log":
       return event.text ?? event.line ?? "";
     default:
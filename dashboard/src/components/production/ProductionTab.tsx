@@ -12,6 +12,7 @@ import { PHASE_ORDER } from "@/lib/types";
 import { Button } from "@/components/ui/button";
 import { Stepper } from "./Stepper";
 import { StepLauncher } from "./StepLauncher";
+import { RunsPanel } from "./RunsPanel";
 import { StepProgress } from "./StepProgress";
 import { StepEditor } from "./StepEditor";
 import { StepDeploy } from "./StepDeploy";
@@ -207,6 +208,15 @@ export function ProductionTab() {
           }
           break;
 
+        case "events_dropped":
+          // Missed phase events were evicted server-side: resync from status
+          api.getPipelineStatus().then((status) => {
+            setPhaseStatus(status.phase_status as Record<PhaseName, PhaseStatus>);
+            setPhaseTimes(status.phase_times);
+            setCurrentPhase(status.current_phase as PhaseName | null);
+          }).catch((err) => console.error("Failed to resync pipeline status", err));
+          break;
+
         case "pipeline_done":
           setRunning(false);
           setCurrentPhase(null);
@@ -238,6 +248,8 @@ export function ProductionTab() {
       skip_collect: boolean;
       no_linkedin: boolean;
       no_deploy: boolean;
+      force: boolean;
+      debug: boolean;
     }) => {
       // Reset state
       setPhaseStatus(initialPhaseStatus());
@@ -390,7 +402,12 @@ export function ProductionTab() {
           </div>
         );
       }
-      return <StepLauncher edition={edition} onStart={handleStart} />;
+      return (
+        <>
+          <StepLauncher edition={edition} onStart={handleStart} />
+          <RunsPanel onRestored={fetchArtifacts} />
+        </>
+      );
     }
 
     // Pipeline done
@@ -451,17 +468,23 @@ export function ProductionTab() {
       );
     }
 
-    // Running — determine what to show based on current phase status
-    if (currentPhase) {
-      const status = phaseStatus[currentPhase];
+    // Running — determine what to show based on current phase status. An
+    // interactive pause keeps the screen while a concurrent phase (html runs
+    // alongside the image pause) emits its own events.
+    const pausedPhase = (["editor", "image", "deploy"] as PhaseName[]).find(
+      (p) => phaseStatus[p] === "paused",
+    );
+    if (pausedPhase || currentPhase) {
+      const current = pausedPhase ?? currentPhase!;
+      const status = phaseStatus[current];
 
       // Paused at editor
-      if (currentPhase === "editor" && status === "paused") {
+      if (current === "editor" && status === "paused") {
         return <StepEditor onPublishAndContinue={handleResume} />;
       }
 
       // Paused at image
-      if (currentPhase === "image" && status === "paused") {
+      if (current === "image" && status === "paused") {
         return (
           <StepImage
             editionNumber={edition?.number ?? 0}
@@ -472,7 +495,7 @@ export function ProductionTab() {
       }
 
       // Paused at deploy
-      if (currentPhase === "deploy" && status === "paused") {
+      if (current === "deploy" && status === "paused") {
         return (
           <StepDeploy
             editionNumber={edition?.number ?? 0}
@@ -485,9 +508,9 @@ export function ProductionTab() {
       // Auto phase running
       if (status === "running" || status === "resumed") {
         // Find the "real" phase for display (skip editorial sub-phases)
-        const displayPhase = currentPhase.startsWith("editorial_")
+        const displayPhase = current.startsWith("editorial_")
           ? "editorial" as PhaseName
-          : currentPhase;
+          : current;
         return <StepProgress phase={displayPhase} elapsed={Math.round(elapsed)} />;
       }
     }
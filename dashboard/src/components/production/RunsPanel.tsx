@@ -0,0 +1,138 @@
+import { useCallback, useEffect, useState } from "react";
+import { api } from "@/lib/api";
+import type { PhaseName, StoredRun } from "@/lib/types";
+import { PHASE_LABELS, PHASE_ORDER } from "@/lib/types";
+import { Button } from "@/components/ui/button";
+import { Badge } from "@/components/ui/badge";
+import {
+  Select,
+  SelectContent,
+  SelectItem,
+  SelectTrigger,
+  SelectValue,
+} from "@/components/ui/select";
+import { Loader2Icon } from "lucide-react";
+
+interface RunsPanelProps {
+  /** Called after a restore, so the stepper can refresh its artifacts. */
+  onRestored: () => void;
+}
+
+// Restoring before the first phase would put nothing back
+const START_PHASES = PHASE_ORDER.slice(1);
+const ALL_PHASES = "all";
+
+function formatCreated(created: number) {
+  return new Date(created * 1000).toLocaleString("fr-FR", {
+    day: "2-digit",
+    month: "2-digit",
+    hour: "2-digit",
+    minute: "2-digit",
+  });
+}
+
+export function RunsPanel({ onRestored }: RunsPanelProps) {
+  const [runs, setRuns] = useState<StoredRun[]>([]);
+  const [startAt, setStartAt] = useState<string>(ALL_PHASES);
+  const [busy, setBusy] = useState<string | null>(null);
+  const [message, setMessage] = useState<string | null>(null);
+
+  const fetchRuns = useCallback(async () => {
+    try {
+      const res = await api.getRuns();
+      setRuns(res.runs);
+    } catch (err) {
+      console.error("Failed to fetch runs", err);
+    }
+  }, []);
+
+  useEffect(() => {
+    fetchRuns();
+  }, [fetchRuns]);
+
+  async function handleRestore(run: StoredRun) {
+    setBusy(run.run_id);
+    setMessage(null);
+    try {
+      const res = await api.restoreRun(run.run_id, startAt === ALL_PHASES ? undefined : startAt);
+      setMessage(`${res.restored.length} fichier(s) restauré(s) depuis ${run.run_id}`);
+      onRestored();
+    } catch (err) {
+      setMessage(err instanceof Error ? err.message : "Restauration impossible");
+    } finally {
+      setBusy(null);
+    }
+  }
+
+  async function handlePin(run: StoredRun) {
+    setBusy(run.run_id);
+    try {
+      await api.pinRun(run.run_id, !run.pinned);
+      await fetchRuns();
+    } catch (err) {
+      console.error("Failed to pin run", err);
+    } finally {
+      setBusy(null);
+    }
+  }
+
+  if (runs.length === 0) return null;
+
+  return (
+    <div className="mx-auto flex max-w-lg flex-col gap-3 border-t border-border pb-12 pt-6">
+      <div className="flex items-center justify-between gap-2">
+        <span className="text-sm text-muted-foreground">Exécutions précédentes</span>
+        <Select value={startAt} onValueChange={setStartAt}>
+          <SelectTrigger className="w-[200px]">
+            <SelectValue placeholder="Reprendre à" />
+          </SelectTrigger>
+          <SelectContent>
+            <SelectItem value={ALL_PHASES}>Tous les fichiers</SelectItem>
+            {START_PHASES.map((p: PhaseName) => (
+              <SelectItem key={p} value={p}>
+                Avant : {PHASE_LABELS[p]}
+              </SelectItem>
+            ))}
+          </SelectContent>
+        </Select>
+      </div>
+
+      <div className="flex flex-col gap-1">
+        {runs.map((run) => (
+          <div
+            key={run.run_id}
+            className="flex items-center gap-2 rounded-md px-2 py-1.5 text-xs hover:bg-muted/50"
+          >
+            <span className="font-medium">{formatCreated(run.created)}</span>
+            {run.edition_date && (
+              <span className="text-muted-foreground">{run.edition_date}</span>
+            )}
+            {run.label && <Badge variant="outline">{run.label}</Badge>}
+            <span className="truncate text-muted-foreground">{run.phases.join(", ")}</span>
+            <div className="ml-auto flex gap-1">
+              {busy === run.run_id && <Loader2Icon className="size-3.5 animate-spin self-center" />}
+              <Button
+                variant={run.pinned ? "secondary" : "ghost"}
+                size="xs"
+                disabled={busy !== null}
+                onClick={() => handlePin(run)}
+              >
+                {run.pinned ? "Épinglé" : "Épingler"}
+              </Button>
+              <Button
+                variant="outline"
+                size="xs"
+                disabled={busy !== null}
+                onClick={() => handleRestore(run)}
+              >
+                Restaurer
+              </Button>
+            </div>
+          </div>
+        ))}
+      </div>
+
+      {message && <p className="text-xs text-muted-foreground">{message}</p>}
+    </div>
+  );
+}
@@ -1,14 +1,8 @@
 import { useCallback, useEffect, useRef, useState } from "react";
 import { api } from "@/lib/api";
-import type { ImageModel } from "@/lib/types";
+import type { ImageJob, ImageModel, StoredImage } from "@/lib/types";
 import { Button } from "@/components/ui/button";
-import {
-  Select,
-  SelectContent,
-  SelectItem,
-  SelectTrigger,
-  SelectValue,
-} from "@/components/ui/select";
+import { Badge } from "@/components/ui/badge";
 import { Loader2Icon } from "lucide-react";
 import { CopyLinkedInButton } from "./CopyLinkedInButton";
 
@@ -18,17 +12,44 @@ interface StepImageProps {
   onValidate: () => void;
 }
 
+// Job status is polled: image_job SSE events only exist while a pipeline run is active
+const JOB_POLL_MS = 1000;
+
+function isActive(job: ImageJob) {
+  return job.status === "queued" || job.status === "running";
+}
+
+function jobStatusLabel(job: ImageJob) {
+  switch (job.status) {
+    case "queued":
+      return "En attente";
+    case "running":
+      return job.stage === "overlay" ? "Bandeau..." : "Génération...";
+    case "done":
+      return job.result?.cached ? "cache" : `${job.result?.duration_s}s`;
+    case "error":
+      return "Erreur";
+    case "cancelled":
+      return "Annulé";
+  }
+}
+
 export function StepImage({ editionNumber, editionDate, onValidate }: StepImageProps) {
   const [models, setModels] = useState<ImageModel[]>([]);
-  const [selectedModel, setSelectedModel] = useState("");
+  const [selectedModels, setSelectedModels] = useState<string[]>([]);
   const [prompt, setPrompt] = useState("");
   const [loadingPrompt, setLoadingPrompt] = useState(false);
-  const [loadingImage, setLoadingImage] = useState(false);
+  const [jobs, setJobs] = useState<ImageJob[]>([]);
   const [error, setError] = useState<string | null>(null);
   const [imageTimestamp, setImageTimestamp] = useState<number | null>(null);
-  const [imageInfo, setImageInfo] = useState<{ model: string; duration_s: number } | null>(null);
+  const [imageInfo, setImageInfo] = useState<{ model: string; duration_s: number | null; cached: boolean } | null>(null);
+  const [history, setHistory] = useState<StoredImage[]>([]);
 
   const promptDirty = useRef(false);
+  // Jobs whose image becomes the LinkedIn image as soon as they finish
+  const autoApply = useRef<Set<string>>(new Set());
+  // Ids of the jobs shown in this view (last batch)
+  const jobIds = useRef<string[]>([]);
 
   // ── Init: fetch models + check existing state ──
   useEffect(() => {
@@ -40,7 +61,12 @@ export function StepImage({ editionNumber, editionDate, onValidate }: StepImageP
         const modelData = await api.getImageModels();
         if (cancelled) return;
         setModels(modelData.models);
-        setSelectedModel(modelData.default);
+        setSelectedModels([modelData.default]);
+
+        // Past generations (image store), shown as thumbnails
+        api.getImageHistory()
+          .then((res) => { if (!cancelled) setHistory(res.images); })
+          .catch(() => { /* Non-blocking */ });
 
         // Check if an image already exists
         const imgRes = await fetch("/api/image/preview", { method: "HEAD" });
@@ -97,10 +123,60 @@ export function StepImage({ editionNumber, editionDate, onValidate }: StepImageP
     }
   }, []);
 
-  const handleGenerateImage = useCallback(async () => {
-    if (!prompt.trim()) return;
+  const applyJob = useCallback(async (job: ImageJob) => {
+    setError(null);
+    try {
+      await api.applyImageJob(job.id);
+      setImageTimestamp(Date.now());
+      if (job.result) {
+        setImageInfo({ model: job.result.model, duration_s: job.result.duration_s, cached: job.result.cached });
+      }
+    } catch (err) {
+      setError(`Erreur image: ${err instanceof Error ? err.message : String(err)}`);
+    }
+  }, []);
+
+  const applyFinished = useCallback((finished: ImageJob[]) => {
+    for (const job of finished) {
+      if (!isActive(job) && autoApply.current.delete(job.id) && job.status === "done") {
+        applyJob(job);
+      }
+    }
+  }, [applyJob]);
+
+  // ── Poll the jobs of this view while one is queued or running ──
+  const hasActiveJobs = jobs.some(isActive);
+  useEffect(() => {
+    if (!hasActiveJobs) return;
+    const timer = setInterval(async () => {
+      try {
+        const res = await api.getImageJobs();
+        const ours = res.jobs.filter((j) => jobIds.current.includes(j.id));
+        const byId = new Map(ours.map((j) => [j.id, j]));
+        setJobs((prev) => prev.map((j) => byId.get(j.id) ?? j));
+        applyFinished(ours);
+        if (!ours.some(isActive)) {
+          // Last poll of the batch: new generations are in the image store
+          api.getImageHistory().then((h) => setHistory(h.images)).catch(() => {});
+        }
+      } catch (err) {
+        console.error("Failed to poll image jobs", err);
+      }
+    }, JOB_POLL_MS);
+    return () => clearInterval(timer);
+  }, [hasActiveJobs, applyFinished]);
+
+  function toggleModel(id: string) {
+    setSelectedModels((prev) =>
+      prev.includes(id) ? prev.filter((m) => m !== id) : [...prev, id],
+    );
+  }
+
+  // One job per selected model, shown side by side. force: call the API even
+  // if this prompt + model is already in the image store
+  const handleGenerateImage = useCallback(async (force: boolean) => {
+    if (!prompt.trim() || selectedModels.length === 0) return;
 
-    setLoadingImage(true);
     setError(null);
 
     // Save prompt if modified
@@ -114,23 +190,50 @@ export function StepImage({ editionNumber, editionDate, onValidate }: StepImageP
     }
 
     try {
-      const res = await api.generateImage({ prompt: prompt.trim(), model: selectedModel });
-      setImageTimestamp(Date.now());
-      setImageInfo({ model: res.model, duration_s: res.duration_s });
+      const submitted = await Promise.all(
+        selectedModels.map((model) =>
+          api.submitImageJob({ prompt: prompt.trim(), model, force }).then((r) => r.job),
+        ),
+      );
+      // A single model keeps the direct flow: its image is applied when done
+      if (submitted.length === 1) autoApply.current.add(submitted[0].id);
+      jobIds.current = submitted.map((j) => j.id);
+      setJobs(submitted);
+      applyFinished(submitted);
     } catch (err) {
       setError(`Erreur génération image: ${err instanceof Error ? err.message : String(err)}`);
-    } finally {
-      setLoadingImage(false);
     }
-  }, [prompt, selectedModel]);
+  }, [prompt, selectedModels, applyFinished]);
+
+  const handleCancelJob = useCallback(async (job: ImageJob) => {
+    autoApply.current.delete(job.id);
+    try {
+      const res = await api.cancelImageJob(job.id);
+      setJobs((prev) => prev.map((j) => (j.id === job.id ? res.job : j)));
+    } catch (err) {
+      setError(`Erreur annulation: ${err instanceof Error ? err.message : String(err)}`);
+    }
+  }, []);
+
+  const handleApplyStored = useCallback(async (image: StoredImage) => {
+    setError(null);
+    try {
+      await api.applyStoredImage(image.key);
+      setPrompt(image.prompt);
+      setSelectedModels([image.model]);
+      setImageTimestamp(Date.now());
+      setImageInfo({ model: image.model, duration_s: image.duration_s, cached: true });
+    } catch (err) {
+      setError(`Erreur image: ${err instanceof Error ? err.message : String(err)}`);
+    }
+  }, []);
 
   const handlePromptChange = useCallback((value: string) => {
     setPrompt(value);
     promptDirty.current = true;
   }, []);
 
-  // Find model alias for display
-  const modelAlias = models.find((m) => m.id === (imageInfo?.model ?? selectedModel))?.alias ?? selectedModel;
+  const aliasOf = (id: string) => models.find((m) => m.id === id)?.alias ?? id;
 
   return (
     <div className="flex h-full gap-4 p-4">
@@ -160,20 +263,21 @@ export function StepImage({ editionNumber, editionDate, onValidate }: StepImageP
           <p className="text-sm text-red-500">{error}</p>
         )}
 
+        <div className="flex flex-wrap gap-1.5">
+          {models.map((m) => (
+            <Badge
+              key={m.id}
+              variant={selectedModels.includes(m.id) ? "default" : "outline"}
+              className="cursor-pointer select-none"
+              title={m.family}
+              onClick={() => toggleModel(m.id)}
+            >
+              {m.alias}
+            </Badge>
+          ))}
+        </div>
+
         <div className="flex flex-wrap items-center gap-2">
-          <Select value={selectedModel} onValueChange={setSelectedModel}>
-            <SelectTrigger className="w-[220px]">
-              <SelectValue placeholder="Modèle" />
-            </SelectTrigger>
-            <SelectContent>
-              {models.map((m) => (
-                <SelectItem key={m.id} value={m.id}>
-                  {m.alias}
-                  <span className="ml-1 text-xs text-muted-foreground">({m.family})</span>
-                </SelectItem>
-              ))}
-            </SelectContent>
-          </Select>
 
           <Button
             variant="outline"
@@ -187,11 +291,11 @@ export function StepImage({ editionNumber, editionDate, onValidate }: StepImageP
 
           <Button
             size="sm"
-            onClick={handleGenerateImage}
-            disabled={loadingImage || loadingPrompt || !prompt.trim()}
+            onClick={() => handleGenerateImage(false)}
+            disabled={hasActiveJobs || loadingPrompt || !prompt.trim() || selectedModels.length === 0}
           >
-            {loadingImage && <Loader2Icon className="mr-1 size-3.5 animate-spin" />}
-            Générer image
+            {hasActiveJobs && <Loader2Icon className="mr-1 size-3.5 animate-spin" />}
+            {selectedModels.length > 1 ? `Générer ${selectedModels.length} images` : "Générer image"}
           </Button>
         </div>
       </div>
@@ -203,12 +307,7 @@ export function StepImage({ editionNumber, editionDate, onValidate }: StepImageP
         </label>
 
         <div className="flex flex-1 items-center justify-center overflow-hidden rounded-lg border border-input bg-muted/10">
-          {loadingImage ? (
-            <div className="flex flex-col items-center gap-2">
-              <Loader2Icon className="size-8 animate-spin text-muted-foreground" />
-              <span className="text-sm text-muted-foreground">Génération en cours...</span>
-            </div>
-          ) : imageTimestamp ? (
+          {imageTimestamp ? (
             <img
               src={`/api/image/preview?t=${imageTimestamp}`}
               alt={`Edition #${editionNumber} — ${editionDate}`}
@@ -223,18 +322,67 @@ export function StepImage({ editionNumber, editionDate, onValidate }: StepImageP
 
         {imageInfo && (
           <p className="text-xs text-muted-foreground">
-            {modelAlias} — {imageInfo.duration_s}s
+            {aliasOf(imageInfo.model)} — {imageInfo.cached ? "cache" : `${imageInfo.duration_s}s`}
           </p>
         )}
 
+        {jobs.length > 0 && (
+          <div className="grid grid-cols-2 gap-2">
+            {jobs.map((job) => (
+              <div key={job.id} className="flex flex-col gap-1 rounded border border-input p-1">
+                <div className="flex aspect-video items-center justify-center overflow-hidden rounded bg-muted/10">
+                  {job.status === "done" ? (
+                    <img src={api.imageJobResultUrl(job.id)} alt={job.model} className="h-full w-full object-cover" />
+                  ) : isActive(job) ? (
+                    <Loader2Icon className="size-5 animate-spin text-muted-foreground" />
+                  ) : (
+                    <span className="px-1 text-center text-[10px] text-muted-foreground" title={job.error ?? undefined}>
+                      {job.error ?? "Annulé"}
+                    </span>
+                  )}
+                </div>
+                <div className="flex items-center justify-between gap-1 text-[10px] text-muted-foreground">
+                  <span className="truncate">{aliasOf(job.model)} — {jobStatusLabel(job)}</span>
+                  {isActive(job) && (
+                    <Button variant="ghost" size="xs" onClick={() => handleCancelJob(job)}>
+                      Annuler
+                    </Button>
+                  )}
+                  {job.status === "done" && (
+                    <Button variant="outline" size="xs" onClick={() => applyJob(job)}>
+                      Utiliser
+                    </Button>
+                  )}
+                </div>
+              </div>
+            ))}
+          </div>
+        )}
+
+        {history.length > 0 && (
+          <div className="grid grid-cols-4 gap-1">
+            {history.slice(0, 8).map((image) => (
+              <button
+                key={image.key}
+                type="button"
+                title={image.prompt}
+                onClick={() => handleApplyStored(image)}
+                disabled={hasActiveJobs}
+                className="overflow-hidden rounded border border-input hover:border-ring"
+              >
+                <img src={api.imageHistoryUrl(image.key)} alt={image.model} loading="lazy" className="aspect-video w-full object-cover" />
+              </button>
+            ))}
+          </div>
+        )}
+
         <div className="flex gap-2">
           <Button
             variant="outline"
             size="sm"
-            onClick={handleGenerateImage}
-            disabled={loadingImage || !prompt.trim()}
+            onClick={() => handleGenerateImage(true)}
+            disabled={hasActiveJobs || !prompt.trim() || selectedModels.length === 0}
           >
-            {loadingImage && <Loader2Icon className="mr-1 size-3.5 animate-spin" />}
             Régénérer
           </Button>
 
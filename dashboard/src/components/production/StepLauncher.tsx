@@ -10,6 +10,7 @@ interface StartParams {
   skip_collect: boolean;
   no_linkedin: boolean;
   no_deploy: boolean;
+  force: boolean;
   debug: boolean;
 }
 
@@ -36,6 +37,7 @@ export function StepLauncher({ edition, onStart }: StepLauncherProps) {
   const [skipCollect, setSkipCollect] = useState(false);
   const [noLinkedin, setNoLinkedin] = useState(false);
   const [noDeploy, setNoDeploy] = useState(false);
+  const [force, setForce] = useState(false);
   const [debug, setDebug] = useState(false);
 
   function toggleStyle(style: string) {
@@ -52,6 +54,7 @@ export function StepLauncher({ edition, onStart }: StepLauncherProps) {
       skip_collect: skipCollect,
       no_linkedin: noLinkedin,
       no_deploy: noDeploy,
+      force,
       debug,
     });
   }
@@ -116,6 +119,13 @@ export function StepLauncher({ edition, onStart }: StepLauncherProps) {
           />
           Sans déploiement
         </label>
+        <label className="flex items-center gap-2 text-sm">
+          <Checkbox
+            checked={force}
+            onCheckedChange={(v) => setForce(v === true)}
+          />
+          Tout recalculer (ignorer les étapes à jour)
+        </label>
         <label className="flex items-center gap-2 text-sm">
           <Checkbox
             checked={debug}
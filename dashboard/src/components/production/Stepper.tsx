@@ -25,23 +25,25 @@ function getPhaseAvailability(
   artifacts: Record<string, ArtifactInfo>,
 ): PhaseAvailability {
   const has = (key: string) => artifacts[key]?.exists === true;
+  // Stale artifacts (inputs changed since they were produced) can be rerun
+  const done = (key: string) => has(key) && artifacts[key]?.up_to_date !== false;
 
   switch (phase) {
     case "websearch":
-      return has("websearch") ? "done" : "available";
+      return done("websearch") ? "done" : "available";
     case "collect":
-      return has("collect") ? "done" : "available";
+      return done("collect") ? "done" : "available";
     case "editorial":
-      if (has("editorial")) return "done";
+      if (done("editorial")) return "done";
       return has("collect") ? "available" : "blocked";
     case "editor":
-      if (has("editor")) return "done";
+      if (done("editor")) return "done";
       return has("editorial") ? "available" : "blocked";
     case "image":
-      if (has("image")) return "done";
+      if (done("image")) return "done";
       return has("editor") ? "available" : "blocked";
     case "html":
-      if (has("html")) return "done";
+      if (done("html")) return "done";
       return has("editor") ? "available" : "blocked";
     case "deploy":
       return has("html") ? "available" : "blocked";
@@ -1,4 +1,4 @@
-import type { ArchiveEdition, ArtifactInfo, EditionInfo, ImageModel, PipelineEvent, PipelineStatus, VariantArticle } from "./types";
+import type { ArchiveEdition, ArtifactInfo, EditionInfo, ImageJob, ImageModel, PipelineEvent, PipelineStatus, StoredImage, StoredRun, VariantArticle } from "./types";
 
 // ── Helpers ──────────────────────────────────────────────────────────────────
 
@@ -30,6 +30,8 @@ export const api = {
     skip_collect: boolean;
     no_linkedin: boolean;
     no_deploy: boolean;
+    /** Rerun every phase, even those whose inputs did not change. */
+    force?: boolean;
     debug?: boolean;
   }): Promise<{ ok: boolean; run_id: string }> {
     return fetch("/api/pipeline/start", {
@@ -88,6 +90,27 @@ export const api = {
     );
   },
 
+  /** List stored run snapshots (newest first). */
+  getRuns(): Promise<{ runs: StoredRun[] }> {
+    return fetch("/api/pipeline/runs").then((r) => json(r));
+  },
+
+  /** Restore a stored run into .pipeline/ (only the outputs upstream of startAt, if given). */
+  restoreRun(runId: string, startAt?: string): Promise<{ ok: boolean; run_id: string; restored: string[] }> {
+    return fetch(`/api/pipeline/runs/${encodeURIComponent(runId)}/restore`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(startAt ? { start_at: startAt } : {}),
+    }).then((r) => json(r));
+  },
+
+  /** Pin (never garbage-collected) or unpin a stored run. */
+  pinRun(runId: string, pinned: boolean): Promise<{ ok: boolean; run_id: string; pinned: boolean }> {
+    return fetch(`/api/pipeline/runs/${encodeURIComponent(runId)}/${pinned ? "pin" : "unpin"}`, {
+      method: "POST",
+    }).then((r) => json(r));
+  },
+
   /** Run a single pipeline phase (manual resume). */
   runPhase(params: { phase: string; date: string; styles?: string[]; debug?: boolean }): Promise<{ ok: boolean; run_id: string }> {
     return fetch("/api/pipeline/run-phase", {
@@ -109,15 +132,55 @@ export const api = {
     return fetch("/api/image/prompt", { method: "POST" }).then((r) => json(r));
   },
 
-  /** Generate an image from a prompt + model. */
-  generateImage(params: { prompt: string; model: string }): Promise<{ ok: boolean; model: string; duration_s: number }> {
-    return fetch("/api/image/generate", {
+  /** Queue an image generation job; returns immediately (poll getImageJobs for progress). */
+  submitImageJob(params: { prompt: string; model: string; force?: boolean }): Promise<{ job: ImageJob }> {
+    return fetch("/api/image/jobs", {
       method: "POST",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify(params),
     }).then((r) => json(r));
   },
 
+  /** List recent image jobs (newest first). */
+  getImageJobs(): Promise<{ jobs: ImageJob[] }> {
+    return fetch("/api/image/jobs").then((r) => json(r));
+  },
+
+  /** Get the status of one image job. */
+  getImageJob(id: string): Promise<{ job: ImageJob }> {
+    return fetch(`/api/image/jobs/${id}`).then((r) => json(r));
+  },
+
+  /** URL of a finished job's image (with overlay, or raw). */
+  imageJobResultUrl(id: string, raw = false): string {
+    return `/api/image/jobs/${id}/result${raw ? "?raw=true" : ""}`;
+  },
+
+  /** Cancel a queued or running image job. */
+  cancelImageJob(id: string): Promise<{ ok: boolean; job: ImageJob }> {
+    return fetch(`/api/image/jobs/${id}/cancel`, { method: "POST" }).then((r) => json(r));
+  },
+
+  /** Use a finished job's image as the LinkedIn image. */
+  applyImageJob(id: string): Promise<{ ok: boolean; job: ImageJob }> {
+    return fetch(`/api/image/jobs/${id}/apply`, { method: "POST" }).then((r) => json(r));
+  },
+
+  /** List past generations from the image store (newest first). */
+  getImageHistory(): Promise<{ images: StoredImage[] }> {
+    return fetch("/api/image/history").then((r) => json(r));
+  },
+
+  /** URL of a stored generation (raw image, without overlay). */
+  imageHistoryUrl(key: string): string {
+    return `/api/image/history/${key}`;
+  },
+
+  /** Use a stored generation as the LinkedIn image (overlay re-applied, no API call). */
+  applyStoredImage(key: string): Promise<{ ok: boolean; image: StoredImage }> {
+    return fetch(`/api/image/history/${key}/apply`, { method: "POST" }).then((r) => json(r));
+  },
+
   /** Save a manually edited prompt. */
   saveImagePrompt(prompt: string): Promise<{ ok: boolean }> {
     return fetch("/api/image/prompt/save", {
@@ -184,7 +247,8 @@ export function subscribePipelineEvents(
   };
 
   source.onerror = () => {
-    // EventSource reconnects automatically; nothing to do here
+    // EventSource reconnects automatically and sends Last-Event-ID, so the
+    // server resumes after the last event received; nothing to do here
   };
 
   return () => source.close();
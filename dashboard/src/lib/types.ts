@@ -66,7 +66,11 @@ export interface PipelineEvent {
     | "log"
     | "pause"
     | "pipeline_done"
+    | "events_dropped"
+    | "image_job"
     | "no_run";
+  /** Sequence id within the run (absent on events_dropped). */
+  id?: number;
   phase?: PhaseName;
   line?: string;
   text?: string;
@@ -78,6 +82,12 @@ export interface PipelineEvent {
   timestamp?: string;
   success?: boolean;
   single_phase?: boolean;
+  /** events_dropped: number of events evicted from the server buffer. */
+  dropped?: number;
+  /** phase_done: the phase was skipped because its inputs did not change. */
+  up_to_date?: boolean;
+  /** image_job: snapshot of the job after a state/stage change. */
+  job?: ImageJob;
 }
 
 // ── Artifact / resume types ─────────────────────────────────────────────────
@@ -86,10 +96,24 @@ export interface ArtifactInfo {
   exists: boolean;
   modified?: string;
   count?: number;
+  /** false when the phase's inputs/outputs changed since its last successful run (phase graph). */
+  up_to_date?: boolean;
 }
 
 export type PhaseAvailability = "available" | "blocked" | "done";
 
+/** A pipeline run snapshot stored in .pipeline/runs/<run_id>/. */
+export interface StoredRun {
+  run_id: string;
+  created: number;
+  label: string | null;
+  pinned: boolean;
+  edition_date: string | null;
+  /** Phases with at least one stored artifact (artifact_store order). */
+  phases: string[];
+  artifacts: Record<string, { phase: string; sha256: string; bytes: number }>;
+}
+
 // ── Image model types ───────────────────────────────────────────────────────
 
 export interface ImageModel {
@@ -98,6 +122,40 @@ export interface ImageModel {
   family: "gemini" | "imagen";
 }
 
+export type ImageJobStatus = "queued" | "running" | "done" | "error" | "cancelled";
+
+export interface ImageJob {
+  id: string;
+  model: string;
+  status: ImageJobStatus;
+  /** Current step while running: "request" (API call) or "overlay". */
+  stage: string | null;
+  error: string | null;
+  result: ImageGenerateResult | null;
+  created: number;
+  finished: number | null;
+}
+
+export interface ImageGenerateResult {
+  ok: boolean;
+  model: string;
+  duration_s: number | null;
+  /** True when served from the image store instead of calling the API. */
+  cached: boolean;
+  /** Image store key (sha256 of model + prompt). */
+  key: string;
+}
+
+/** A past generation kept in the content-addressed image store. */
+export interface StoredImage {
+  key: string;
+  model: string;
+  prompt: string;
+  duration_s: number | null;
+  created: number;
+  bytes: number;
+}
+
 // ── Variant / article types ──────────────────────────────────────────────────
 
 export interface VariantArticle {
@@ -0,0 +1,47 @@
+"""Paginated archive index (index.html + page-N.html), shared by generate_edition.py and deploy.py.
+
+Pages hold page_size editions, the oldest first: page-1.html is the oldest
+and the newest page is index.html, so appending an edition only changes
+index.html, plus the page before it when a new page starts. Items are listed
+newest first within a page.
+"""
+
+import template_engine
+
+DEFAULT_PAGE_SIZE = 50
+
+
+def last_page(total, page_size):
+    """Index of the newest page for total editions (0 when there are none)."""
+    return max(0, (total - 1) // page_size)
+
+
+def page_name(page, last):
+    """index.html for the newest page, page-<page + 1>.html for the older ones."""
+    return "index.html" if page == last else f"page-{page + 1}.html"
+
+
+def render_page(title, home_href, items, page, last):
+    """HTML of a page from the item snippets of its editions, oldest first."""
+    nav = []
+    if page < last:
+        nav.append(f'<a href="{page_name(page + 1, last)}">&larr; Plus recentes</a>')
+    if page > 0:
+        nav.append(f'<a href="{page_name(page - 1, last)}">Plus anciennes &rarr;</a>')
+    return template_engine.load("archives.html").render({
+        "EDITION_TITLE": title,
+        "HOME_HREF": home_href,
+        "ITEMS": "".join(reversed(items)),
+        "PAGINATION": f'<nav class="archive-pages">{"".join(nav)}</nav>' if nav else "",
+    })
+
+
+def remove_stale_pages(directory, last):
+    """Delete the page-N.html left over from a larger index; returns how many."""
+    removed = 0
+    page = last + 1
+    while (directory / f"page-{page}.html").exists():
+        (directory / f"page-{page}.html").unlink()
+        removed += 1
+        page += 1
+    return removed
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""Run-scoped artifact store: snapshots of .pipeline/ kept under .pipeline/runs/<run_id>/.
+
+A snapshot copies the artifacts of each phase (same relative paths as in
+.pipeline/) and records their sha256 in manifest.json. Files identical to the
+previous snapshot are hard-linked instead of copied. Restoring a snapshot
+before a phase puts back the outputs of every upstream phase, so the pipeline
+can restart at that phase without recomputing them.
+
+Retention comes from edition.runs in revue-presse.yaml (keep the N newest
+runs, drop runs older than max_age_days; pinned runs are never collected):
+
+    runs:
+      keep: 10
+      max_age_days: 30
+
+Usage:
+    python3 scripts/artifact_store.py snapshot [--run-id ID] [--label TEXT]
+    python3 scripts/artifact_store.py restore <run_id|latest> [--start-at PHASE]
+    python3 scripts/artifact_store.py list
+    python3 scripts/artifact_store.py gc [--keep N] [--max-age-days D]
+    python3 scripts/artifact_store.py pin|unpin <run_id>
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from datetime import datetime
+
+from log_utils import setup_logging, load_config, PIPELINE_DIR
+
+logger = setup_logging("artifact_store")
+
+RUNS_DIR = PIPELINE_DIR / "runs"
+DEFAULT_KEEP_RUNS = 10
+DEFAULT_MAX_AGE_DAYS = 30
+INCOMPLETE_GRACE_S = 3600  # a run dir without manifest younger than this may still be written
+RUN_ID_RE = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+# Phase -> artifacts it produces (paths relative to .pipeline/; directories
+# are stored file by file), in pipeline order
+PHASE_ARTIFACTS = {
+    "websearch": ["00_websearch.json"],
+    "collect": ["01_candidates.json"],
+    "editorial": ["02_editorial.json", "variants"],
+    "html": [],  # writes editions/, outside .pipeline
+    "linkedin": [
+        "linkedin/post.txt",
+        "linkedin/comment.txt",
+        "linkedin/image_prompt.txt",
+        "linkedin/image_raw.png",
+        "linkedin/image.png",
+    ],
+    "deploy": [],
+}
+PHASE_ORDER = list(PHASE_ARTIFACTS)
+# Dashboard phases without their own artifacts -> phase above with the same
+# upstream outputs (editor and image work on the editorial outputs, like html)
+PHASE_ALIASES = {"editor": "html", "image": "html"}
+START_PHASES = PHASE_ORDER + list(PHASE_ALIASES)
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _iter_phase_files(source, phase):
+    """Yield paths (relative to source, posix) of the existing artifacts of a phase."""
+    for rel in PHASE_ARTIFACTS[phase]:
+        path = source / rel
+        if path.is_dir():
+            for sub in sorted(p for p in path.rglob("*") if p.is_file()):
+                yield sub.relative_to(source).as_posix()
+        elif path.is_file():
+            yield rel
+
+
+def _run_dir(run_id):
+    if not RUN_ID_RE.match(run_id):
+        raise ValueError(f"Invalid run id: {run_id!r}")
+    return RUNS_DIR / run_id
+
+
+def _write_manifest(run_dir, manifest):
+    tmp = run_dir / "manifest.json.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, run_dir / "manifest.json")
+
+
+def load_run(run_id):
+    """Return the manifest of a run ("latest" = newest), or None."""
+    if run_id == "latest":
+        runs = list_runs()
+        return runs[0] if runs else None
+    try:
+        with open(_run_dir(run_id) / "manifest.json", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def list_runs():
+    """Return the manifests of all complete runs, newest first."""
+    if not RUNS_DIR.exists():
+        return []
+    runs = []
+    for run_dir in RUNS_DIR.iterdir():
+        if run_dir.is_dir() and RUN_ID_RE.match(run_dir.name):
+            manifest = load_run(run_dir.name)
+            if manifest is not None:
+                runs.append(manifest)
+    return sorted(runs, key=lambda m: m.get("created", 0), reverse=True)
+
+
+def new_run_id():
+    """Timestamp-based run id, unique within RUNS_DIR."""
+    base = datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_id, n = base, 1
+    while (RUNS_DIR / run_id).exists():
+        n += 1
+        run_id = f"{base}_{n}"
+    return run_id
+
+
+def snapshot(run_id=None, label=None, source=PIPELINE_DIR):
+    """Store the current artifacts of source as a new run; returns its manifest (None if nothing to store)."""
+    run_id = run_id or new_run_id()
+    run_dir = _run_dir(run_id)
+
+    # Content hash -> file of the previous run, to hard-link unchanged artifacts
+    previous = {}
+    latest = load_run("latest")
+    if latest is not None:
+        for rel, info in latest["artifacts"].items():
+            previous[info["sha256"]] = RUNS_DIR / latest["run_id"] / rel
+
+    artifacts = {}
+    for phase in PHASE_ORDER:
+        for rel in _iter_phase_files(source, phase):
+            src = source / rel
+            sha = file_sha256(src)
+            dst = run_dir / rel
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            linked = False
+            if sha in previous:
+                try:
+                    os.link(previous[sha], dst)
+                    linked = True
+                except OSError:
+                    pass
+            if not linked:
+                shutil.copy2(src, dst)
+            artifacts[rel] = {"phase": phase, "sha256": sha, "bytes": src.stat().st_size}
+
+    if not artifacts:
+        logger.info("[RUNS] No artifact in .pipeline/, nothing to snapshot")
+        return None
+
+    manifest = {
+        "run_id": run_id,
+        "created": time.time(),
+        "label": label,
+        "pinned": False,
+        "edition_date": os.environ.get("RP_EDITION_DATE") or datetime.now().strftime("%Y-%m-%d"),
+        "artifacts": artifacts,
+    }
+    _write_manifest(run_dir, manifest)  # written last: a run without manifest is incomplete
+    logger.info(f"[RUNS] Snapshot {run_id}: {len(artifacts)} artifact(s)")
+    return manifest
+
+
+def upstream_phases(start_at):
+    """Phases whose outputs a run starting at start_at (bash or dashboard phase) needs."""
+    if start_at not in START_PHASES:
+        raise ValueError(f"Unknown phase: {start_at!r} (expected one of {START_PHASES})")
+    start_at = PHASE_ALIASES.get(start_at, start_at)
+    return PHASE_ORDER[:PHASE_ORDER.index(start_at)]
+
+
+def restore(run_id, start_at=None, phases=None, target=PIPELINE_DIR):
+    """Copy a run's artifacts back into target; returns the restored paths.
+
+    start_at restores the outputs of every phase before it; phases restores an
+    explicit list; neither restores everything. Raises ValueError for an
+    unknown run or an artifact whose hash no longer matches.
+    """
+    manifest = load_run(run_id)
+    if manifest is None:
+        raise ValueError(f"Run '{run_id}' not found in {RUNS_DIR}")
+    if start_at is not None:
+        phases = upstream_phases(start_at)
+    wanted = {rel: info for rel, info in manifest["artifacts"].items()
+              if phases is None or info["phase"] in phases}
+
+    run_dir = RUNS_DIR / manifest["run_id"]
+    for rel, info in wanted.items():
+        if file_sha256(run_dir / rel) != info["sha256"]:
+            raise ValueError(f"Artifact {rel} of run {manifest['run_id']} is corrupted (hash mismatch)")
+
+    # Directory artifacts are replaced as a whole (no stale variants left behind)
+    for phase in {info["phase"] for info in wanted.values()}:
+        for rel in PHASE_ARTIFACTS[phase]:
+            if (target / rel).is_dir():
+                shutil.rmtree(target / rel)
+
+    for rel in wanted:
+        dst = target / rel
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(run_dir / rel, dst)
+    logger.info(f"[RUNS] Restored {len(wanted)} artifact(s) from {manifest['run_id']}")
+    return sorted(wanted)
+
+
+def set_pinned(run_id, pinned=True):
+    """Pin (exclude from gc) or unpin a run; returns its manifest or None."""
+    manifest = load_run(run_id)
+    if manifest is None:
+        return None
+    manifest["pinned"] = pinned
+    _write_manifest(RUNS_DIR / manifest["run_id"], manifest)
+    return manifest
+
+
+def gc(keep=DEFAULT_KEEP_RUNS, max_age_days=DEFAULT_MAX_AGE_DAYS):
+    """Delete unpinned runs beyond the keep newest or older than max_age_days,
+    and abandoned incomplete runs. Returns the removed run ids."""
+    if not RUNS_DIR.exists():
+        return []
+    now = time.time()
+    removed = []
+    unpinned = [m for m in list_runs() if not m.get("pinned")]
+    for index, manifest in enumerate(unpinned):
+        too_old = now - manifest.get("created", 0) > max_age_days * 86400
+        if index >= keep or too_old:
+            shutil.rmtree(RUNS_DIR / manifest["run_id"], ignore_errors=True)
+            removed.append(manifest["run_id"])
+
+    for run_dir in RUNS_DIR.iterdir():
+        if (run_dir.is_dir() and not (run_dir / "manifest.json").exists()
+                and now - run_dir.stat().st_mtime > INCOMPLETE_GRACE_S):
+            shutil.rmtree(run_dir, ignore_errors=True)
+            removed.append(run_dir.name)
+
+    if removed:
+        logger.info(f"[RUNS] Garbage-collected {len(removed)} run(s)")
+    return removed
+
+
+def retention(config):
+    """(keep, max_age_days) from edition.runs."""
+    settings = config.get("edition", {}).get("runs", {}) or {}
+    return (settings.get("keep", DEFAULT_KEEP_RUNS),
+            settings.get("max_age_days", DEFAULT_MAX_AGE_DAYS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snapshots of .pipeline/ artifacts per run")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("snapshot", help="store the current .pipeline/ artifacts as a run, then gc")
+    p.add_argument("--run-id", help="run id (default: timestamp)")
+    p.add_argument("--label", help="free text shown by list")
+
+    p = sub.add_parser("restore", help="copy a run's artifacts back into .pipeline/")
+    p.add_argument("run_id", help="run id or 'latest'")
+    p.add_argument("--start-at", choices=START_PHASES,
+                   help="restore only the outputs of the phases before this one")
+
+    sub.add_parser("list", help="list stored runs, newest first")
+
+    p = sub.add_parser("gc", help="apply the retention policy")
+    p.add_argument("--keep", type=int, help="unpinned runs to keep (default: config)")
+    p.add_argument("--max-age-days", type=float, help="max age of unpinned runs (default: config)")
+
+    for name in ("pin", "unpin"):
+        p = sub.add_parser(name, help=f"{name} a run (pinned runs are never collected)")
+        p.add_argument("run_id")
+
+    args = parser.parse_args()
+    keep, max_age_days = retention(load_config())
+
+    try:
+        if args.command == "snapshot":
+            snapshot(args.run_id, args.label)
+            gc(keep, max_age_days)
+        elif args.command == "restore":
+            for rel in restore(args.run_id, start_at=args.start_at):
+                print(rel)
+        elif args.command == "list":
+            for m in list_runs():
+                created = datetime.fromtimestamp(m["created"]).strftime("%Y-%m-%d %H:%M")
+                phases = sorted({a["phase"] for a in m["artifacts"].values()}, key=PHASE_ORDER.index)
+                pin = " [pinned]" if m.get("pinned") else ""
+                label = f" {m['label']}" if m.get("label") else ""
+                print(f"{m['run_id']}  {created}  {','.join(phases)}{label}{pin}")
+        elif args.command == "gc":
+            gc(args.keep if args.keep is not None else keep,
+               args.max_age_days if args.max_age_days is not None else max_age_days)
+        else:
+            if set_pinned(args.run_id, args.command == "pin") is None:
+                raise ValueError(f"Run '{args.run_id}' not found")
+    except ValueError as e:
+        logger.error(f"[ERROR] {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,18 @@
 """Orchestrate RSS collection, optional WebSearch merge, dedup, and ranking.
 
 Usage:
-    python3 scripts/collect.py
+    python3 scripts/collect.py               # in-process (default)
+    python3 scripts/collect.py --subprocess  # one interpreter per sub-script
 
 Reads WebSearch results from .pipeline/00_websearch.json if present.
 Produces .pipeline/01_candidates.json with top N candidates (default 25).
+
+By default parse_rss, deduplicate and rank_articles are called directly on
+shared Python objects. --subprocess keeps the historical behaviour of running
+each sub-script in its own interpreter with JSON over stdin/stdout.
 """
 
+import argparse
 import json
 import os
 import re
@@ -15,13 +21,17 @@ import subprocess
 import sys
 import time
 from datetime import datetime, timedelta, timezone
-from difflib import SequenceMatcher
 from pathlib import Path
-from urllib.parse import urlparse
 
 import yaml
 
-from log_utils import setup_logging, PROJECT_DIR, PIPELINE_DIR
+import deduplicate
+import history_index
+import keywords
+import manifest_store
+import parse_rss
+import rank_articles
+from log_utils import setup_logging, load_config, PROJECT_DIR, PIPELINE_DIR
 
 logger = setup_logging("collect")
 
@@ -30,28 +40,12 @@ WEBSEARCH_PATH = PIPELINE_DIR / "00_websearch.json"
 OUTPUT_PATH = PIPELINE_DIR / "01_candidates.json"
 
 AI_WORD_BOUNDARY = re.compile(r'\bAI\b')
-
-
-def load_ai_keywords():
-    """Charge tous les keywords IA depuis revue-presse.yaml."""
-    config_path = PROJECT_DIR / "config" / "revue-presse.yaml"
-    with open(config_path, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
-    keywords = set()
-    for topic in config.get("topics", []):
-        for kw in topic.get("keywords", []):
-            keywords.add(kw.lower())
-    # Termes generiques de filet de securite
-    keywords.update(["artificial intelligence", "machine learning", "ml", "a.i."])
-    return keywords
+HISTORY_TITLE_THRESHOLD = 0.85
 
 
 def filter_ai_relevant(articles):
     """Filtre binaire : garde les articles mentionnant au moins un terme IA."""
-    keywords = load_ai_keywords()
-    # Separer les keywords courts (need word boundary) des longs
-    short_kw = {kw for kw in keywords if len(kw) <= 2}
-    long_kw = keywords - short_kw
+    matcher = keywords.get_matcher(load_config())
 
     kept = []
     for article in articles:
@@ -59,14 +53,13 @@ def filter_ai_relevant(articles):
         if article.get("research_context"):
             kept.append(article)
             continue
-        text = f"{article.get('title', '')} {article.get('summary', '')}".lower()
-        # Test keywords longs (substring match suffit)
-        if any(kw in text for kw in long_kw):
+        text = f"{article.get('title', '')} {article.get('summary', '')}"
+        # Keywords longs (substring match, insensible a la casse)
+        if matcher.hits(text, keywords.AI_GROUP):
             kept.append(article)
             continue
-        # Test keywords courts (word boundary sur texte original)
-        raw_text = f"{article.get('title', '')} {article.get('summary', '')}"
-        if AI_WORD_BOUNDARY.search(raw_text):
+        # Keywords courts (word boundary sur texte original)
+        if AI_WORD_BOUNDARY.search(text):
             kept.append(article)
             continue
 
@@ -79,55 +72,43 @@ def filter_ai_relevant(articles):
     return kept
 
 
-def normalize_url(url):
-    """Normalize URL for comparison (same logic as deduplicate.py)."""
-    parsed = urlparse(url)
-    host = parsed.netloc.lower().replace("www.", "")
-    path = parsed.path.rstrip("/")
-    return f"{host}{path}"
-
-
 def filter_already_published(articles):
     """Remove articles already published in recent editions (cross-edition dedup).
 
-    Reads manifest.json for URLs/titles from the last N days (configurable via
-    history_days in config). Excludes today's date to allow intra-day re-runs.
-    Graceful degradation: returns articles unchanged if manifest is missing/unreadable.
+    Queries the manifest store for URLs/titles from the last N days (configurable
+    via history_days in config). Excludes today's date to allow intra-day re-runs.
+    Graceful degradation: returns articles unchanged if the store is missing/unreadable.
     """
     config_path = PROJECT_DIR / "config" / "revue-presse.yaml"
     with open(config_path, encoding="utf-8") as f:
         config = yaml.safe_load(f)
     history_days = config.get("edition", {}).get("history_days", 3)
 
-    manifest_path = PROJECT_DIR / "editions" / "archives" / "manifest.json"
-    if not manifest_path.exists():
+    archives_dir = PROJECT_DIR / "editions" / "archives"
+    if not (archives_dir / manifest_store.DB_NAME).exists() and not (archives_dir / "manifest.json").exists():
         logger.info(f"[COLLECT] No manifest found, skipping history dedup")
         return articles
 
+    today_str = os.environ.get("RP_EDITION_DATE") or datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=history_days)).strftime("%Y-%m-%d")
+
     try:
-        with open(manifest_path, encoding="utf-8") as f:
-            manifest = json.load(f)
-    except (json.JSONDecodeError, Exception) as e:
-        logger.warning(f"[WARN] Could not read manifest: {e}")
+        store = manifest_store.ManifestStore(archives_dir)
+        recent = store.entries(since=cutoff)
+        published = store.published_urls([a.get("url", "") for a in articles],
+                                         since=cutoff, exclude_date=today_str)
+    except Exception as e:
+        logger.warning(f"[WARN] Could not read manifest store: {e}")
         return articles
 
-    today_str = os.environ.get("RP_EDITION_DATE") or datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    cutoff = (datetime.now(timezone.utc) - timedelta(days=history_days)).strftime("%Y-%m-%d")
+    # Recent editions (excluding today to allow re-runs): URLs through the
+    # store's normalized-URL index, titles through the persistent title index
+    # instead of pairwise SequenceMatcher calls
+    entries = history_index.sync_index(recent)
+    recent_dates = [d for d in entries if d != today_str]
+    history = history_index.HistoryMatcher(entries, recent_dates, HISTORY_TITLE_THRESHOLD)
 
-    # Collect published URLs and titles from recent editions (excluding today)
-    published_urls = set()
-    published_titles = []
-    for entry in manifest:
-        entry_date = entry.get("date", "")
-        if entry_date == today_str:
-            continue  # Exclude today to allow re-runs
-        if entry_date < cutoff:
-            continue  # Too old
-        for url in entry.get("urls", []):
-            published_urls.add(normalize_url(url))
-        published_titles.extend(entry.get("titles", []))
-
-    if not published_urls and not published_titles:
+    if not history:
         return articles
 
     kept = []
@@ -136,14 +117,11 @@ def filter_already_published(articles):
         title = article.get("title", "")
 
         # Check exact URL match
-        if url and normalize_url(url) in published_urls:
+        if url and deduplicate.normalize_url(url) in published:
             continue
 
         # Check title similarity (cross-domain: same news, different source)
-        if title and any(
-            SequenceMatcher(None, title.lower(), pt.lower()).ratio() >= 0.85
-            for pt in published_titles
-        ):
+        if title and history.has_similar_title(title):
             continue
 
         kept.append(article)
@@ -182,13 +160,50 @@ def run_script(script_name, input_data=None, env_extra=None):
     return json.loads(result.stdout)
 
 
+def collect_rss(use_subprocess):
+    if use_subprocess:
+        return run_script("parse_rss.py")
+    return parse_rss.collect_articles()
+
+
+def deduplicate_articles(articles, use_subprocess):
+    if use_subprocess:
+        return run_script("deduplicate.py", input_data=json.dumps(articles, ensure_ascii=False))
+    deduped = deduplicate.deduplicate(articles)
+    logger.info(f"[INFO] Deduplication: {len(articles)} -> {len(deduped)} articles")
+    return deduped
+
+
+def rank_candidates(articles, max_candidates, use_subprocess):
+    if use_subprocess:
+        return run_script(
+            "rank_articles.py",
+            input_data=json.dumps(articles, ensure_ascii=False),
+            env_extra={"RP_MAX_CANDIDATES": str(max_candidates)},
+        )
+    ranked = rank_articles.rank(articles, load_config(), max_candidates=max_candidates)
+    logger.info(f"[INFO] Ranked: top {len(ranked)} articles selected")
+    return ranked
+
+
 def main():
+    parser = argparse.ArgumentParser(
+        description="Phase 1 : RSS + merge WebSearch + dedup + ranking."
+    )
+    parser.add_argument(
+        "--subprocess", action="store_true",
+        help="Lancer parse_rss/deduplicate/rank_articles dans des interpreteurs separes",
+    )
+    args = parser.parse_args()
+    mode = "subprocess" if args.subprocess else "in-process"
+    logger.debug(f"Collect mode: {mode}")
+
     # Ensure pipeline directory exists
     PIPELINE_DIR.mkdir(exist_ok=True)
 
     # 1. Collect RSS
     logger.info("[COLLECT] Phase 1: RSS feeds...")
-    rss_articles = run_script("parse_rss.py")
+    rss_articles = collect_rss(args.subprocess)
 
     # 2. Merge with WebSearch JSON if present
     all_articles = list(rss_articles)
@@ -208,8 +223,7 @@ def main():
 
     # 3. Deduplicate
     logger.info("[COLLECT] Phase 2: Deduplication...")
-    merged_json = json.dumps(all_articles, ensure_ascii=False)
-    deduped = run_script("deduplicate.py", input_data=merged_json)
+    deduped = deduplicate_articles(all_articles, args.subprocess)
 
     # 3b. AI relevance filter
     deduped = filter_ai_relevant(deduped)
@@ -219,13 +233,8 @@ def main():
 
     # 4. Rank — propagate RP_MAX_CANDIDATES (default 20 for pipeline)
     logger.info("[COLLECT] Phase 3: Ranking...")
-    max_candidates = os.environ.get("RP_MAX_CANDIDATES", "25")
-    deduped_json = json.dumps(deduped, ensure_ascii=False)
-    ranked = run_script(
-        "rank_articles.py",
-        input_data=deduped_json,
-        env_extra={"RP_MAX_CANDIDATES": max_candidates},
-    )
+    max_candidates = int(os.environ.get("RP_MAX_CANDIDATES", "25"))
+    ranked = rank_candidates(deduped, max_candidates, args.subprocess)
 
     # 5. Write output
     with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
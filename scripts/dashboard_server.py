@@ -9,6 +9,7 @@ Usage:
 """
 
 import argparse
+import gzip
 import hashlib
 import json
 import mimetypes
@@ -20,6 +21,8 @@ import sys
 import threading
 import time
 import webbrowser
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from http.server import HTTPServer, ThreadingHTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
@@ -48,6 +51,9 @@ IMAGE_MODELS_PATH = PROJECT_DIR / "config" / "image-models.yaml"
 PROMPT_TEMPLATE_PATH = PROJECT_DIR / "scripts" / "prompts" / "linkedin.md"
 
 VARIANT_NAME_RE = re.compile(r"^[a-z0-9_]+$")
+IMAGE_JOB_PATH_RE = re.compile(r"^/api/image/jobs/([0-9_]+)(?:/(result|cancel|apply))?$")
+PIPELINE_RUN_PATH_RE = re.compile(r"^/api/pipeline/runs/([A-Za-z0-9_.-]+)/(restore|pin|unpin)$")
+IMAGE_HISTORY_PATH_RE = re.compile(r"^/api/image/history/([0-9a-f]{64})(?:/(apply))?$")
 
 DEV_MODE = False  # set by --dev flag
 
@@ -85,6 +91,127 @@ def load_config() -> dict:
         return yaml.safe_load(f)
 
 
+# ── gh-pages manifest cache ──────────────────────────────────────────────────
+# The published manifest lives on the gh-pages branch. It is read with
+# `git show` only when origin/gh-pages moves: the ref files' mtimes are checked
+# on every call, then the ref is resolved to a SHA (loose ref, packed-refs, or
+# `git rev-parse` as a last resort) and compared with the cached one.
+
+GH_PAGES_REF = "refs/remotes/origin/gh-pages"
+GH_PAGES_MANIFEST = "editions/archives/manifest.json"
+SHA_RE = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+
+
+def _git_dir() -> Path | None:
+    """Return the git dir holding the repository's refs.
+
+    Handles a .git file pointing elsewhere; in a linked worktree that is
+    .git/worktrees/<name>, whose `commondir` file points to the shared git dir
+    where refs/remotes and packed-refs live.
+    """
+    dot_git = PROJECT_DIR / ".git"
+    if dot_git.is_dir():
+        git_dir = dot_git
+    else:
+        try:
+            content = dot_git.read_text("utf-8").strip()
+        except OSError:
+            return None
+        if not content.startswith("gitdir:"):
+            return None
+        git_dir = (PROJECT_DIR / content.removeprefix("gitdir:").strip()).resolve()
+    try:
+        common = (git_dir / "commondir").read_text("utf-8").strip()
+    except OSError:
+        return git_dir
+    return (git_dir / common).resolve()
+
+
+class GhPagesManifestCache:
+    """Parsed gh-pages manifest, keyed by the resolved origin/gh-pages commit."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stamp: tuple | None = None
+        self._sha: str | None = None
+        self._entries: list[dict] | None = None
+
+    def _ref_stamp(self, git_dir: Path | None) -> tuple | None:
+        if git_dir is None:
+            return None
+        stamp = []
+        for path in (git_dir / GH_PAGES_REF, git_dir / "packed-refs"):
+            try:
+                stamp.append(path.stat().st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp) if any(stamp) else None
+
+    def _resolve_sha(self, git_dir: Path | None) -> str | None:
+        if git_dir is not None:
+            try:
+                sha = (git_dir / GH_PAGES_REF).read_text("utf-8").strip()
+                if SHA_RE.match(sha):
+                    return sha
+            except OSError:
+                pass
+            try:
+                with open(git_dir / "packed-refs", encoding="utf-8") as f:
+                    for line in f:
+                        sha, _, ref = line.strip().partition(" ")
+                        if ref == GH_PAGES_REF and SHA_RE.match(sha):
+                            return sha
+            except OSError:
+                pass
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "--verify", "-q", "origin/gh-pages"],
+                capture_output=True, cwd=str(PROJECT_DIR), timeout=10,
+            )
+            if result.returncode == 0:
+                return result.stdout.decode("ascii", errors="replace").strip()
+        except Exception:
+            pass
+        return None
+
+    def _load(self, sha: str) -> list[dict] | None:
+        try:
+            result = subprocess.run(
+                ["git", "show", f"{sha}:{GH_PAGES_MANIFEST}"],
+                capture_output=True, cwd=str(PROJECT_DIR), timeout=10,
+            )
+        except Exception:
+            return None
+        if result.returncode != 0:
+            return None
+        try:
+            entries = json.loads(result.stdout.decode("utf-8", errors="replace"))
+        except (json.JSONDecodeError, ValueError):
+            return None
+        return entries if isinstance(entries, list) else None
+
+    def get(self) -> list[dict] | None:
+        """Return the gh-pages manifest entries (None if unavailable)."""
+        with self._lock:
+            git_dir = _git_dir()
+            stamp = self._ref_stamp(git_dir)
+            if stamp is not None and stamp == self._stamp:
+                return self._entries
+
+            sha = self._resolve_sha(git_dir)
+            if sha is None:
+                self._stamp, self._sha, self._entries = None, None, None
+                return None
+            if sha != self._sha:
+                self._entries = self._load(sha)
+                self._sha = sha
+            self._stamp = stamp
+            return self._entries
+
+
+gh_pages_manifest = GhPagesManifestCache()
+
+
 # ── Image helpers ─────────────────────────────────────────────────────────────
 
 
@@ -171,8 +298,32 @@ def generate_image_prompt() -> str:
     return candidate
 
 
-def generate_image_from_prompt(prompt: str, model_id: str) -> dict:
-    """Generate an image using Google GenAI, apply overlay, return metadata."""
+def generate_image_from_prompt(prompt: str, model_id: str, output_dir: Path = LINKEDIN_DIR,
+                               progress=None, use_cache: bool = True) -> dict:
+    """Generate an image using Google GenAI, apply overlay, return metadata.
+
+    Writes image_raw.png and image.png into output_dir. progress, if given, is
+    called with the stage name ("request", "overlay") before each step. A
+    (model, prompt) pair already generated is served from the image store
+    (result "cached": true) unless use_cache is False.
+    """
+    import image_store
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    raw_path = output_dir / "image_raw.png"
+    final_path = output_dir / "image.png"
+    store = image_store.from_config(load_config())
+
+    hit = store.get(model_id, prompt) if use_cache else None
+    if hit is not None:
+        data, meta = hit
+        raw_path.write_bytes(data)
+        if progress:
+            progress("overlay")
+        _apply_linkedin_overlay(raw_path, final_path)
+        return {"ok": True, "model": model_id, "duration_s": meta.get("duration_s"),
+                "cached": True, "key": meta["key"]}
+
     api_key = os.environ.get("GOOGLE_API_KEY")
     if not api_key:
         raise RuntimeError("GOOGLE_API_KEY not set")
@@ -180,10 +331,6 @@ def generate_image_from_prompt(prompt: str, model_id: str) -> dict:
     from google import genai
     from google.genai import types
 
-    LINKEDIN_DIR.mkdir(parents=True, exist_ok=True)
-    raw_path = LINKEDIN_DIR / "image_raw.png"
-    final_path = LINKEDIN_DIR / "image.png"
-
     # Determine family from model_id
     models_info = load_image_models()
     family = "gemini"
@@ -194,7 +341,10 @@ def generate_image_from_prompt(prompt: str, model_id: str) -> dict:
 
     client = genai.Client(api_key=api_key)
     start = time.time()
+    if progress:
+        progress("request")
 
+    data = None
     if family == "imagen":
         response = client.models.generate_images(
             model=model_id,
@@ -204,8 +354,7 @@ def generate_image_from_prompt(prompt: str, model_id: str) -> dict:
             ),
         )
         if response.generated_images:
-            with open(raw_path, "wb") as f:
-                f.write(response.generated_images[0].image.image_bytes)
+            data = response.generated_images[0].image.image_bytes
         else:
             raise RuntimeError("No image returned by Imagen API")
     else:
@@ -217,23 +366,28 @@ def generate_image_from_prompt(prompt: str, model_id: str) -> dict:
                 response_modalities=["IMAGE", "TEXT"],
             ),
         )
-        image_found = False
         for part in response.candidates[0].content.parts:
             if part.inline_data and part.inline_data.mime_type.startswith("image/"):
-                with open(raw_path, "wb") as f:
-                    f.write(part.inline_data.data)
-                image_found = True
+                data = part.inline_data.data
                 break
-        if not image_found:
+        if data is None:
             raise RuntimeError("No image returned by Gemini API")
 
     duration = round(time.time() - start, 2)
+    raw_path.write_bytes(data)
+    meta = store.put(model_id, prompt, data, duration)
+    if progress:
+        progress("overlay")
 
-    # Copy raw to final, then apply overlay
-    import shutil
+    _apply_linkedin_overlay(raw_path, final_path)
+
+    return {"ok": True, "model": model_id, "duration_s": duration, "cached": False, "key": meta["key"]}
+
+
+def _apply_linkedin_overlay(raw_path: Path, final_path: Path):
+    """Copy raw_path to final_path and overlay the edition title + editorial subtitle."""
     shutil.copy2(raw_path, final_path)
 
-    # Apply text overlay
     config = load_config()
     edition_title = config.get("edition", {}).get("title", "IA qu'a demander")
     archives_dir = PROJECT_DIR / "editions" / "archives"
@@ -251,115 +405,177 @@ def generate_image_from_prompt(prompt: str, model_id: str) -> dict:
 
     _overlay_text_on_image(str(final_path), edition_title, edition_number, subtitle)
 
-    return {"ok": True, "model": model_id, "duration_s": duration}
+
+def apply_image_from_history(key: str) -> dict | None:
+    """Make a stored generation the current LinkedIn image (no API call). None if unknown."""
+    import image_store
+
+    hit = image_store.from_config(load_config()).read(key)
+    if hit is None:
+        return None
+    data, meta = hit
+    LINKEDIN_DIR.mkdir(parents=True, exist_ok=True)
+    LINKEDIN_IMAGE_RAW.write_bytes(data)
+    _apply_linkedin_overlay(LINKEDIN_IMAGE_RAW, LINKEDIN_IMAGE)
+    return meta
 
 
 def _get_edition_number(archives_dir: Path) -> int:
-    """Derive edition number from manifest.json."""
-    manifest = archives_dir / "manifest.json"
-    if manifest.exists():
-        with open(manifest, encoding="utf-8") as f:
-            entries = json.load(f)
-        if entries:
-            unique_days = set(e.get("date", "") for e in entries)
-            today = os.environ.get("RP_EDITION_DATE") or datetime.now().strftime("%Y-%m-%d")
-            if today in unique_days:
-                return len(unique_days)
-            return len(unique_days) + 1
-    return 1
+    """Derive edition number from the manifest store."""
+    from manifest_store import ManifestStore
+    today = os.environ.get("RP_EDITION_DATE") or datetime.now().strftime("%Y-%m-%d")
+    return ManifestStore(archives_dir).edition_number(today)
 
 
 def _overlay_text_on_image(image_path: str, edition_title: str, edition_number: int, subtitle: str):
-    """Overlay title + subtitle on image using Pillow."""
-    from PIL import Image, ImageDraw, ImageFont
-
-    TARGET_W, TARGET_H = 1200, 627
-    BANNER_COLOR = (26, 26, 26)  # #1A1A1A
-    BANNER_OPACITY = int(255 * 0.78)
-    ACCENT_COLOR = (230, 57, 70)  # #E63946
-    ACCENT_HEIGHT = 4
-    MARGIN_TOP = 70
-    PADDING_H = 60
-    PADDING_V = 20
-
-    # Font paths with cross-platform fallbacks
-    FONT_TITLE_PATHS = [
-        "/System/Library/Fonts/LucidaGrande.ttc",
-        "C:/Windows/Fonts/arialbd.ttf",
-    ]
-    FONT_SUBTITLE_PATHS = [
-        "/System/Library/Fonts/HelveticaNeue.ttc",
-        "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
-        "C:/Windows/Fonts/arial.ttf",
-    ]
-
-    img = Image.open(image_path).convert("RGBA")
-    if img.size != (TARGET_W, TARGET_H):
-        img = img.resize((TARGET_W, TARGET_H), Image.LANCZOS)
-
-    # Load title font
-    font_title = None
-    for fpath in FONT_TITLE_PATHS:
-        try:
-            font_title = ImageFont.truetype(fpath, 52, index=0)
-            break
-        except (OSError, IndexError):
-            continue
-    if font_title is None:
-        font_title = ImageFont.load_default()
+    """Overlay title + subtitle on image using Pillow (shared renderer, cached fonts/layers)."""
+    from image_overlay import overlay_text_on_image
+
+    overlay_text_on_image(image_path, edition_title, edition_number, subtitle)
+
+
+# ── Image generation jobs ─────────────────────────────────────────────────────
+# Image generation (8-12 s, more for Ultra models) runs on a small worker pool
+# instead of the HTTP handler thread. Each job writes into its own directory;
+# "apply" copies a finished job's images over the LinkedIn image. Job updates
+# are emitted on the current pipeline run's SSE stream (type "image_job").
+
+IMAGE_JOBS_DIR = LINKEDIN_DIR / "jobs"
+IMAGE_JOB_WORKERS = int(os.environ.get("RP_IMAGE_JOBS", "3"))
+IMAGE_JOBS_KEPT = 20  # finished jobs kept (with their files) before pruning
+
+
+class ImageJobCancelled(Exception):
+    pass
+
+
+class ImageJob:
+    """One image generation request and its lifecycle."""
+
+    def __init__(self, job_id: str, prompt: str, model: str, use_cache: bool = True):
+        self.id = job_id
+        self.prompt = prompt
+        self.model = model
+        self.use_cache = use_cache
+        self.status = "queued"  # queued|running|done|error|cancelled
+        self.stage: str | None = None
+        self.error: str | None = None
+        self.result: dict | None = None
+        self.created = time.time()
+        self.finished: float | None = None
+        self.cancel_requested = False
+        self.future = None
+
+    @property
+    def output_dir(self) -> Path:
+        return IMAGE_JOBS_DIR / self.id
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "model": self.model,
+            "status": self.status,
+            "stage": self.stage,
+            "error": self.error,
+            "result": self.result,
+            "created": self.created,
+            "finished": self.finished,
+        }
 
-    # Load subtitle font
-    font_subtitle = None
-    for fpath in FONT_SUBTITLE_PATHS:
+
+class ImageJobManager:
+    """Worker pool (at most IMAGE_JOB_WORKERS concurrent generations) + job registry."""
+
+    def __init__(self, max_workers: int = IMAGE_JOB_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="image-job")
+        self._jobs: dict[str, ImageJob] = {}
+        self._lock = threading.Lock()
+        self._counter = 0
+
+    def _publish(self, job: ImageJob):
+        """Push a job update on the run's SSE stream; without a run, clients poll GET /api/image/jobs."""
+        run = current_run
+        if run is not None:
+            run.emit({"type": "image_job", "phase": "image", "job": job.to_dict()})
+
+    def submit(self, prompt: str, model: str, use_cache: bool = True) -> ImageJob:
+        with self._lock:
+            self._counter += 1
+            job = ImageJob(f"{int(time.time())}_{self._counter}", prompt, model, use_cache)
+            self._jobs[job.id] = job
+            self._prune()
+        self._publish(job)
+        job.future = self._pool.submit(self._run, job)
+        return job
+
+    def _run(self, job: ImageJob):
+        if job.cancel_requested:
+            return
+
+        def progress(stage: str):
+            if job.cancel_requested:
+                raise ImageJobCancelled()
+            job.stage = stage
+            self._publish(job)
+
+        job.status = "running"
         try:
-            font_subtitle = ImageFont.truetype(fpath, 26, index=0)
-            break
-        except (OSError, IndexError):
-            continue
-    if font_subtitle is None:
-        font_subtitle = ImageFont.load_default()
-
-    title_text = f"{edition_title} N\u00b0{edition_number}"
-
-    # Truncate subtitle if too long
-    max_subtitle_w = TARGET_W - 2 * PADDING_H
-    if font_subtitle.getlength(subtitle) > max_subtitle_w:
-        while font_subtitle.getlength(subtitle + "\u2026") > max_subtitle_w and len(subtitle) > 10:
-            subtitle = subtitle[:-1].rstrip()
-        subtitle = subtitle + "\u2026"
-
-    title_bbox = font_title.getbbox(title_text)
-    title_h = title_bbox[3] - title_bbox[1]
-    subtitle_bbox = font_subtitle.getbbox(subtitle)
-    subtitle_h = subtitle_bbox[3] - subtitle_bbox[1]
-
-    banner_top = MARGIN_TOP
-    banner_height = PADDING_V + title_h + 12 + subtitle_h + PADDING_V
-    banner_bottom = banner_top + banner_height
-
-    overlay = Image.new("RGBA", (TARGET_W, TARGET_H), (0, 0, 0, 0))
-    draw_overlay = ImageDraw.Draw(overlay)
-    draw_overlay.rectangle(
-        [(0, banner_top), (TARGET_W, banner_bottom)],
-        fill=(*BANNER_COLOR, BANNER_OPACITY),
-    )
-    draw_overlay.rectangle(
-        [(0, banner_bottom), (TARGET_W, banner_bottom + ACCENT_HEIGHT)],
-        fill=(*ACCENT_COLOR, 255),
-    )
-    img = Image.alpha_composite(img, overlay)
+            job.result = generate_image_from_prompt(job.prompt, job.model, job.output_dir, progress,
+                                                    use_cache=job.use_cache)
+            if job.cancel_requested:
+                raise ImageJobCancelled()
+            job.status = "done"
+        except ImageJobCancelled:
+            job.status = "cancelled"
+        except Exception as e:
+            job.status = "error"
+            job.error = str(e)
+        job.stage = None
+        job.finished = time.time()
+        self._publish(job)
+
+    def get(self, job_id: str) -> ImageJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> list[ImageJob]:
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda j: j.created, reverse=True)
+
+    def cancel(self, job_id: str) -> ImageJob | None:
+        """Cancel a queued job, or discard a running job's result when it returns."""
+        job = self.get(job_id)
+        if job is None or job.status in ("done", "error", "cancelled"):
+            return job
+        job.cancel_requested = True
+        if job.future is not None and job.future.cancel():
+            job.status = "cancelled"
+            job.finished = time.time()
+            self._publish(job)
+        return job
+
+    def apply(self, job_id: str) -> ImageJob | None:
+        """Make a finished job's images the current LinkedIn image."""
+        job = self.get(job_id)
+        if job is None or job.status != "done":
+            return job
+        LINKEDIN_DIR.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(job.output_dir / "image_raw.png", LINKEDIN_IMAGE_RAW)
+        shutil.copy2(job.output_dir / "image.png", LINKEDIN_IMAGE)
+        return job
+
+    def _prune(self):
+        """Forget the oldest finished jobs beyond IMAGE_JOBS_KEPT (lock held)."""
+        finished = sorted(
+            (j for j in self._jobs.values() if j.finished is not None),
+            key=lambda j: j.created,
+        )
+        for job in finished[:max(0, len(finished) - IMAGE_JOBS_KEPT)]:
+            del self._jobs[job.id]
+            shutil.rmtree(job.output_dir, ignore_errors=True)
 
-    draw = ImageDraw.Draw(img)
-    text_y = banner_top + PADDING_V
-    title_w = font_title.getlength(title_text)
-    title_x = (TARGET_W - title_w) / 2
-    draw.text((title_x, text_y), title_text, font=font_title, fill=(255, 255, 255, 255))
-    text_y += title_h + 12
-    subtitle_w = font_subtitle.getlength(subtitle)
-    subtitle_x = (TARGET_W - subtitle_w) / 2
-    draw.text((subtitle_x, text_y), subtitle, font=font_subtitle, fill=(255, 255, 255, 210))
 
-    img.convert("RGB").save(image_path, "PNG")
+image_jobs = ImageJobManager()
 
 
 # ── LinkedIn deterministic text (post + comment) ──────────────────────────────
@@ -418,6 +634,9 @@ def write_linkedin_text_files() -> tuple[int, int]:
 
 PHASES = ["websearch", "collect", "editorial", "editor", "image", "html", "deploy"]
 
+SSE_KEEPALIVE_INTERVAL = 15  # seconds without events before a keepalive comment
+EVENT_BUFFER_SIZE = 5000  # events kept per run for SSE replay (older ones are dropped)
+
 current_run: "PipelineRun | None" = None
 run_lock = threading.Lock()
 
@@ -430,7 +649,7 @@ class PipelineRun:
         self.run_id = run_id
         self.date = date
         self.styles = styles
-        self.options = options  # skip_collect, no_linkedin, no_deploy, debug
+        self.options = options  # skip_collect, no_linkedin, no_deploy, force, debug
         self.single_phase = single_phase  # True when running a single phase via manual resume
         self.debug = options.get("debug", False)
 
@@ -440,11 +659,15 @@ class PipelineRun:
         self.current_phase: str | None = None
         self.running = True
         self.aborted = False
-        self._process: subprocess.Popen | None = None
+        # Live subprocesses (several while editorial variants run in parallel)
+        self._processes: set[subprocess.Popen] = set()
 
-        # SSE events (append-only broadcast list)
-        self._events: list[dict] = []
-        self._events_lock = threading.Lock()
+        # SSE events: ring buffer of the last EVENT_BUFFER_SIZE events, each with
+        # a sequence id (1, 2, ...); subscribers block on the condition until
+        # emit() appends something
+        self._events: deque[dict] = deque(maxlen=EVENT_BUFFER_SIZE)
+        self._last_seq = 0
+        self._events_cond = threading.Condition()
 
         # Initialize phase statuses
         for phase in PHASES:
@@ -460,16 +683,37 @@ class PipelineRun:
             self.phase_status["deploy"] = "skipped"
 
     def emit(self, event: dict):
-        """Append event to broadcast list (thread-safe)."""
+        """Append event to the ring buffer and wake up subscribers (thread-safe)."""
         event.setdefault("timestamp", time.time())
-        with self._events_lock:
+        with self._events_cond:
+            self._last_seq += 1
+            event["id"] = self._last_seq
             self._events.append(event)
+            self._events_cond.notify_all()
+
+    def _events_after(self, cursor: int) -> tuple[list[dict], int]:
+        """Events with id > cursor (lock held). Prepends an events_dropped marker
+        when some of them were already evicted from the ring buffer."""
+        new_count = self._last_seq - cursor
+        if new_count <= 0:
+            return [], self._last_seq
+        dropped = new_count - len(self._events)
+        if dropped > 0:
+            marker = {"type": "events_dropped", "dropped": dropped, "timestamp": time.time()}
+            return [marker, *self._events], self._last_seq
+        start = len(self._events) - new_count
+        return [self._events[i] for i in range(start, len(self._events))], self._last_seq
 
     def get_events(self, cursor: int = 0) -> tuple[list[dict], int]:
-        """Return events from cursor position. Returns (events, new_cursor)."""
-        with self._events_lock:
-            new_events = self._events[cursor:]
-            return new_events, len(self._events)
+        """Return events after sequence id cursor. Returns (events, new_cursor)."""
+        with self._events_cond:
+            return self._events_after(cursor)
+
+    def wait_events(self, cursor: int, timeout: float) -> tuple[list[dict], int]:
+        """Like get_events, but block up to timeout seconds until there is something new."""
+        with self._events_cond:
+            self._events_cond.wait_for(lambda: self._last_seq > cursor, timeout=timeout)
+            return self._events_after(cursor)
 
     def run_phase_script(self, phase: str, cmd: list[str], env_extra: dict | None = None) -> bool:
         """Internal: run a subprocess for a phase, streaming output as SSE events."""
@@ -491,6 +735,7 @@ class PipelineRun:
         if env_extra:
             env.update(env_extra)
 
+        proc = None
         try:
             proc = subprocess.Popen(
                 cmd,
@@ -499,7 +744,7 @@ class PipelineRun:
                 cwd=str(PROJECT_DIR),
                 env=env,
             )
-            self._process = proc
+            self._processes.add(proc)
 
             def stream_output(pipe, stream_name):
                 for raw_line in iter(pipe.readline, b""):
@@ -520,7 +765,7 @@ class PipelineRun:
             t_err.join(timeout=5)
 
             rc = proc.returncode
-            self._process = None
+            self._processes.discard(proc)
 
             end = time.time()
             self.phase_times[phase]["end"] = end
@@ -546,9 +791,73 @@ class PipelineRun:
             self.phase_times[phase]["duration"] = round(end - start, 2)
             self.phase_status[phase] = "error"
             self.emit({"type": "phase_error", "phase": phase, "error": str(e)})
-            self._process = None
+            if proc is not None:
+                self._processes.discard(proc)
             return False
 
+    def run_editorial_variants(self) -> list[str]:
+        """Run the editorial phase: one write_editorial.py per style, in parallel.
+
+        Each variant writes straight to VARIANTS_DIR/editorial_{style}.json and
+        streams its logs under its own sub-phase (editorial_{style}). Up to
+        edition.editorial_parallelism variants (RP_EDITORIAL_PARALLEL overrides)
+        run at once. The last successful style (in request order) is also copied
+        to 02_editorial.json, as the sequential loop used to leave it.
+        Returns the generated styles.
+        """
+        python = sys.executable
+        self.current_phase = "editorial"
+        self.phase_status["editorial"] = "running"
+        editorial_start = time.time()
+        self.phase_times["editorial"] = {"start": editorial_start}
+        self.emit({"type": "phase_start", "phase": "editorial"})
+
+        VARIANTS_DIR.mkdir(parents=True, exist_ok=True)
+        parallelism = int(os.environ.get(
+            "RP_EDITORIAL_PARALLEL",
+            load_config().get("edition", {}).get("editorial_parallelism", 3),
+        ))
+        parallelism = max(1, min(parallelism, len(self.styles) or 1))
+
+        def run_variant(style: str) -> bool:
+            if self.aborted:
+                return False
+            output = VARIANTS_DIR / f"editorial_{style}.json"
+            self.emit({"type": "log", "phase": "editorial", "stream": "stdout",
+                       "text": f"── Generating variant: {style} ──"})
+            ok = self.run_phase_script(
+                f"editorial_{style}",
+                [python, str(SCRIPTS_DIR / "write_editorial.py"), "--output", str(output)],
+                env_extra={"EDITO_STYLE": style},
+            )
+            if ok and output.exists():
+                self.emit({"type": "log", "phase": "editorial", "stream": "stdout",
+                           "text": f"[OK] Variant '{style}' saved"})
+                return True
+            self.emit({"type": "log", "phase": "editorial", "stream": "stderr",
+                       "text": f"[WARN] Variant '{style}' failed"})
+            return False
+
+        with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="editorial") as pool:
+            results = list(pool.map(run_variant, self.styles))
+        generated = [style for style, ok in zip(self.styles, results) if ok]
+        self.current_phase = "editorial"
+
+        if generated:
+            shutil.copy2(VARIANTS_DIR / f"editorial_{generated[-1]}.json", EDITORIAL_PATH)
+
+        editorial_end = time.time()
+        self.phase_times["editorial"]["end"] = editorial_end
+        self.phase_times["editorial"]["duration"] = round(editorial_end - editorial_start, 2)
+
+        if generated:
+            self.phase_status["editorial"] = "done"
+            self.emit({"type": "phase_done", "phase": "editorial"})
+        else:
+            self.phase_status["editorial"] = "error"
+            self.emit({"type": "phase_error", "phase": "editorial", "error": "No variants generated"})
+        return generated
+
     def _pause_phase(self, phase: str):
         """Pause a phase and wait for resume or abort."""
         self.current_phase = phase
@@ -567,177 +876,84 @@ class PipelineRun:
         return True
 
     def run_pipeline(self):
-        """Execute all pipeline phases in sequence."""
-        python = sys.executable
-
-        try:
-            # Ensure .pipeline directory exists
-            PIPELINE_DIR.mkdir(parents=True, exist_ok=True)
-
-            # ── Phase: websearch ──
-            if self.phase_status["websearch"] != "skipped":
-                ok = self.run_phase_script(
-                    "websearch",
-                    [python, str(SCRIPTS_DIR / "websearch_collect.py")],
-                )
-                if not ok and not self.aborted:
-                    # WebSearch is tolerant - continue on failure
-                    self.emit({"type": "log", "phase": "websearch", "stream": "stderr",
-                               "text": "[WARN] WebSearch failed, continuing with RSS only"})
-
-            if self.aborted:
-                self._finish_pipeline()
-                return
+        """Execute the pipeline (all phases of phase_graph.dashboard_graph())."""
+        self.run_graph(force=["all"] if self.options.get("force") else ())
 
-            # ── Phase: collect ──
-            if self.phase_status["collect"] != "skipped":
-                ok = self.run_phase_script(
-                    "collect",
-                    [python, str(SCRIPTS_DIR / "collect.py")],
-                )
-                if not ok:
-                    self._finish_pipeline()
-                    return
+    def run_graph(self, **run_kwargs):
+        """Run the dashboard phase graph, then finish the pipeline.
 
-            if self.aborted:
-                self._finish_pipeline()
-                return
-
-            # ── Phase: editorial (one run per style) ──
-            if self.phase_status["editorial"] != "skipped":
-                self.current_phase = "editorial"
-                self.phase_status["editorial"] = "running"
-                editorial_start = time.time()
-                self.phase_times["editorial"] = {"start": editorial_start}
-                self.emit({"type": "phase_start", "phase": "editorial"})
-
-                VARIANTS_DIR.mkdir(parents=True, exist_ok=True)
-                generated_styles = []
-
-                for style in self.styles:
-                    if self.aborted:
-                        break
-
-                    sub_phase = f"editorial_{style}"
-                    self.emit({"type": "log", "phase": "editorial", "stream": "stdout",
-                               "text": f"── Generating variant: {style} ──"})
-
-                    ok = self.run_phase_script(
-                        sub_phase,
-                        [python, str(SCRIPTS_DIR / "write_editorial.py")],
-                        env_extra={"EDITO_STYLE": style},
-                    )
-
-                    if ok:
-                        # Copy to variants directory
-                        src = EDITORIAL_PATH
-                        dst = VARIANTS_DIR / f"editorial_{style}.json"
-                        if src.exists():
-                            shutil.copy2(src, dst)
-                            generated_styles.append(style)
-                            self.emit({"type": "log", "phase": "editorial", "stream": "stdout",
-                                       "text": f"[OK] Variant '{style}' saved"})
-                    else:
-                        self.emit({"type": "log", "phase": "editorial", "stream": "stderr",
-                                   "text": f"[WARN] Variant '{style}' failed"})
-
-                editorial_end = time.time()
-                self.phase_times["editorial"]["end"] = editorial_end
-                self.phase_times["editorial"]["duration"] = round(editorial_end - editorial_start, 2)
-
-                if not generated_styles:
-                    self.phase_status["editorial"] = "error"
-                    self.emit({"type": "phase_error", "phase": "editorial", "error": "No variants generated"})
-                    self._finish_pipeline()
-                    return
-
-                self.phase_status["editorial"] = "done"
-                self.emit({"type": "phase_done", "phase": "editorial"})
-
-            if self.aborted:
-                self._finish_pipeline()
-                return
-
-            # ── Phase: editor (interactive pause) ──
-            if self.phase_status["editor"] != "skipped":
-                resumed = self._pause_phase("editor")
-                if not resumed:
-                    self._finish_pipeline()
-                    return
-                self.phase_status["editor"] = "done"
-                self.emit({"type": "phase_done", "phase": "editor"})
-
-            if self.aborted:
-                self._finish_pipeline()
-                return
-
-            # ── Phase: image (interactive pause for LinkedIn image) ──
-            if self.phase_status["image"] != "skipped":
-                # Regenerate post.txt + comment.txt deterministically from the
-                # freshly-chosen editorial, before the interactive image pause.
-                try:
-                    post_len, comment_len = write_linkedin_text_files()
-                    self.emit({"type": "log", "phase": "image", "stream": "stdout",
-                               "text": f"[LINKEDIN] Post: {post_len} chars (deterministic)"})
-                    self.emit({"type": "log", "phase": "image", "stream": "stdout",
-                               "text": f"[LINKEDIN] Comment: {comment_len} chars (deterministic)"})
-                except Exception as e:
-                    self.emit({"type": "log", "phase": "image", "stream": "stderr",
-                               "text": f"[LINKEDIN] Failed to write post/comment: {e}"})
-
-                resumed = self._pause_phase("image")
-                if not resumed:
-                    self._finish_pipeline()
-                    return
-                self.phase_status["image"] = "done"
-                self.emit({"type": "phase_done", "phase": "image"})
-
-            if self.aborted:
-                self._finish_pipeline()
-                return
-
-            # ── Phase: html ──
-            if self.phase_status["html"] != "skipped":
-                ok = self.run_phase_script(
-                    "html",
-                    [python, str(SCRIPTS_DIR / "generate_edition.py"),
-                     str(EDITORIAL_PATH)],
-                )
-                if not ok:
-                    self._finish_pipeline()
-                    return
-
-            if self.aborted:
-                self._finish_pipeline()
-                return
-
-            # ── Phase: deploy (interactive pause, then run) ──
-            if self.phase_status["deploy"] != "skipped":
-                resumed = self._pause_phase("deploy")
-                if not resumed:
-                    self._finish_pipeline()
-                    return
-
-                ok = self.run_phase_script(
-                    "deploy",
-                    [python, str(SCRIPTS_DIR / "deploy.py")],
-                )
-                if not ok:
-                    self._finish_pipeline()
-                    return
+        Phases marked "skipped" are treated as satisfied; phases whose inputs
+        did not change since their last success are reported done without
+        running; html and the image pause run concurrently after the editor.
+        run_kwargs are passed to PhaseGraph.run (force, targets, ...).
+        """
+        import phase_graph
 
+        try:
+            PIPELINE_DIR.mkdir(parents=True, exist_ok=True)
+            graph = phase_graph.dashboard_graph()
+            params = phase_graph.default_params(edition_date=self.date, styles=self.styles)
+            skip = [p for p in graph.order if self.phase_status.get(p) == "skipped"]
+            graph.run(self._run_graph_phase, params, skip=skip,
+                      should_stop=lambda: self.aborted,
+                      on_status=self._on_graph_status, **run_kwargs)
         except Exception as e:
             self.emit({"type": "log", "phase": self.current_phase or "unknown",
                        "stream": "stderr", "text": f"Pipeline error: {e}"})
         finally:
             self._finish_pipeline()
 
+    def _run_graph_phase(self, phase) -> bool:
+        """Run one phase of the dashboard graph (scheduler callback, may run concurrently)."""
+        python = sys.executable
+        name = phase.name
+
+        if name == "editorial":
+            return bool(self.run_editorial_variants())
+
+        if name == "image":
+            # Regenerate post.txt + comment.txt deterministically from the
+            # freshly-chosen editorial, before the interactive image pause.
+            try:
+                post_len, comment_len = write_linkedin_text_files()
+                self.emit({"type": "log", "phase": "image", "stream": "stdout",
+                           "text": f"[LINKEDIN] Post: {post_len} chars (deterministic)"})
+                self.emit({"type": "log", "phase": "image", "stream": "stdout",
+                           "text": f"[LINKEDIN] Comment: {comment_len} chars (deterministic)"})
+            except Exception as e:
+                self.emit({"type": "log", "phase": "image", "stream": "stderr",
+                           "text": f"[LINKEDIN] Failed to write post/comment: {e}"})
+
+        if name in ("editor", "image") or (name == "deploy" and not self.single_phase):
+            if not self._pause_phase(name):
+                return False
+            if phase.command is None:
+                self.phase_status[name] = "done"
+                self.emit({"type": "phase_done", "phase": name})
+                return True
+
+        ok = self.run_phase_script(name, [python, str(SCRIPTS_DIR / phase.command[0]), *phase.command[1:]])
+        if not ok and phase.tolerant and not self.aborted:
+            self.emit({"type": "log", "phase": name, "stream": "stderr",
+                       "text": f"[WARN] {name} failed, continuing"})
+        return ok
+
+    def _on_graph_status(self, phase: str, status: str):
+        if status == "up_to_date":
+            self.phase_status[phase] = "done"
+            self.emit({"type": "log", "phase": phase, "stream": "stdout",
+                       "text": f"[SKIP] {phase}: inputs unchanged since last run"})
+            self.emit({"type": "phase_done", "phase": phase, "up_to_date": True})
+
     def _finish_pipeline(self):
         """Mark pipeline as done and emit final event (idempotent)."""
         if not self.running:
             return  # already finished
         self.running = False
         self.current_phase = None
+        if not self.single_phase:
+            # Manual single-phase reruns would evict real runs from retention
+            self._snapshot_artifacts()
         has_error = any(s == "error" for s in self.phase_status.values())
         self.emit({
             "type": "pipeline_done",
@@ -746,11 +962,27 @@ class PipelineRun:
             "single_phase": self.single_phase,
         })
 
+    def _snapshot_artifacts(self):
+        """Store this run's .pipeline artifacts in .pipeline/runs/<run_id> and apply retention."""
+        import artifact_store
+
+        try:
+            manifest = artifact_store.snapshot(self.run_id, label="dashboard")
+            artifact_store.gc(*artifact_store.retention(load_config()))
+        except Exception as e:
+            self.emit({"type": "log", "phase": "pipeline", "stream": "stderr",
+                       "text": f"[WARN] Run snapshot failed: {e}"})
+            return
+        if manifest is not None:
+            self.emit({"type": "log", "phase": "pipeline", "stream": "stdout",
+                       "text": f"[RUNS] Snapshot {self.run_id}: {len(manifest['artifacts'])} artifact(s)"})
+
     def abort(self):
         """Abort the running pipeline."""
         self.aborted = True
-        proc = self._process
-        if proc and proc.poll() is None:
+        for proc in list(self._processes):
+            if proc.poll() is not None:
+                continue
             try:
                 proc.terminate()
                 proc.wait(timeout=5)
@@ -774,6 +1006,86 @@ class PipelineRun:
         }
 
 
+# ── Static asset cache ─────────────────────────────────────────────────────────
+# dashboard/dist is served from memory: each file is read once (and re-read when
+# its mtime/size changes), with its gzip/brotli variants and a strong ETag.
+
+STATIC_GZIP_MIN_BYTES = 1024
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+# Vite emits content-hashed names under assets/ (e.g. index-B2x9fK1a.js)
+HASHED_ASSET_RE = re.compile(r"-[A-Za-z0-9_-]{8,}\.[a-z0-9]+$")
+CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_REVALIDATE = "no-cache"
+
+
+class StaticAsset:
+    """One file of dashboard/dist with its encoded representations."""
+
+    def __init__(self, path: Path, stat: os.stat_result):
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        content_type, _ = mimetypes.guess_type(str(path))
+        self.content_type = content_type or "application/octet-stream"
+
+        body = path.read_bytes()
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        # encoding -> (body, strong ETag of that representation)
+        self.variants: dict[str, tuple[bytes, str]] = {"identity": (body, f'"{digest}"')}
+
+        # Precomputed variants (vite-plugin-compression style), if up to date
+        for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+            pre = path.with_name(path.name + suffix)
+            try:
+                if pre.stat().st_mtime_ns >= self.mtime_ns:
+                    self.variants[encoding] = (pre.read_bytes(), f'"{digest}-{encoding}"')
+            except OSError:
+                continue
+
+        if ("gzip" not in self.variants and len(body) >= STATIC_GZIP_MIN_BYTES
+                and self.content_type.startswith(COMPRESSIBLE_TYPES)):
+            compressed = gzip.compress(body, compresslevel=6, mtime=0)
+            if len(compressed) < len(body):
+                self.variants["gzip"] = (compressed, f'"{digest}-gzip"')
+
+    def select(self, accept_encoding: str) -> tuple[str, bytes, str]:
+        """Pick the best representation for an Accept-Encoding header: (encoding, body, etag)."""
+        accepted = set()
+        for part in accept_encoding.split(","):
+            token, _, params = part.strip().partition(";")
+            q = params.strip().removeprefix("q=")
+            if token and q not in ("0", "0.0", "0.00", "0.000"):
+                accepted.add(token.strip().lower())
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and (encoding in accepted or "*" in accepted):
+                return (encoding, *self.variants[encoding])
+        return ("identity", *self.variants["identity"])
+
+
+_static_cache: dict[Path, StaticAsset] = {}
+_static_cache_lock = threading.Lock()
+
+
+def load_static_asset(path: Path) -> StaticAsset:
+    """Return the cached asset for path, reloading it if the file changed."""
+    stat = path.stat()
+    with _static_cache_lock:
+        asset = _static_cache.get(path)
+    if asset is not None and asset.mtime_ns == stat.st_mtime_ns and asset.size == stat.st_size:
+        return asset
+    asset = StaticAsset(path, stat)
+    with _static_cache_lock:
+        _static_cache[path] = asset
+    return asset
+
+
+def static_cache_control(path: Path) -> str:
+    """Immutable caching for hashed bundle files, revalidation for everything else."""
+    rel = path.resolve().relative_to(DIST_DIR.resolve()).as_posix()
+    if rel.startswith("assets/") and HASHED_ASSET_RE.search(rel):
+        return CACHE_IMMUTABLE
+    return CACHE_REVALIDATE
+
+
 # ── HTTP Handler ───────────────────────────────────────────────────────────────
 
 class DashboardHandler(BaseHTTPRequestHandler):
@@ -857,6 +1169,10 @@ class DashboardHandler(BaseHTTPRequestHandler):
             self._handle_pipeline_artifacts()
             return
 
+        if path == "/api/pipeline/runs":
+            self._handle_pipeline_runs()
+            return
+
         if path == "/api/pipeline/events":
             self._handle_pipeline_events()
             return
@@ -870,6 +1186,24 @@ class DashboardHandler(BaseHTTPRequestHandler):
             self._handle_image_preview()
             return
 
+        if path == "/api/image/jobs":
+            self._send_json({"jobs": [job.to_dict() for job in image_jobs.list()]})
+            return
+
+        m = IMAGE_JOB_PATH_RE.match(path)
+        if m and m.group(2) in (None, "result"):
+            self._handle_image_job_get(m.group(1), m.group(2))
+            return
+
+        if path == "/api/image/history":
+            self._handle_image_history()
+            return
+
+        m = IMAGE_HISTORY_PATH_RE.match(path)
+        if m and m.group(2) is None:
+            self._handle_image_history_get(m.group(1))
+            return
+
         # ── LinkedIn text API ─────────────────────────────────────────────
         if path == "/api/linkedin/post":
             self._handle_linkedin_text("post")
@@ -947,6 +1281,11 @@ class DashboardHandler(BaseHTTPRequestHandler):
             self._handle_run_phase()
             return
 
+        m = PIPELINE_RUN_PATH_RE.match(path)
+        if m:
+            self._handle_pipeline_run_action(m.group(1), m.group(2))
+            return
+
         # ── Image API ─────────────────────────────────────────────────────
         if path == "/api/image/prompt":
             self._handle_image_prompt()
@@ -960,6 +1299,20 @@ class DashboardHandler(BaseHTTPRequestHandler):
             self._handle_image_prompt_save()
             return
 
+        if path == "/api/image/jobs":
+            self._handle_image_job_submit()
+            return
+
+        m = IMAGE_JOB_PATH_RE.match(path)
+        if m and m.group(2) in ("cancel", "apply"):
+            self._handle_image_job_action(m.group(1), m.group(2))
+            return
+
+        m = IMAGE_HISTORY_PATH_RE.match(path)
+        if m and m.group(2) == "apply":
+            self._handle_image_history_apply(m.group(1))
+            return
+
         # ── Config API ────────────────────────────────────────────────────
         if path == "/api/config":
             self._handle_config_post()
@@ -973,36 +1326,19 @@ class DashboardHandler(BaseHTTPRequestHandler):
         config = load_config()
         tz = ZoneInfo(config.get("edition", {}).get("timezone", "Europe/Paris"))
 
-        # Count unique dates from manifest (try local first, then gh-pages)
-        unique_dates = set()
-        manifest_data = None
-        if MANIFEST_PATH.exists():
+        # Count published dates (manifest store first, then gh-pages)
+        count = 0
+        if MANIFEST_PATH.exists() or (MANIFEST_PATH.parent / "manifest.db").exists():
+            from manifest_store import ManifestStore
             try:
-                manifest_data = MANIFEST_PATH.read_text("utf-8")
-            except OSError:
-                pass
-        if not manifest_data:
-            # Fall back to gh-pages branch
-            try:
-                result = subprocess.run(
-                    ["git", "show", "origin/gh-pages:editions/archives/manifest.json"],
-                    capture_output=True, cwd=str(PROJECT_DIR), timeout=10,
-                )
-                if result.returncode == 0:
-                    manifest_data = result.stdout.decode("utf-8", errors="replace")
+                count = ManifestStore(MANIFEST_PATH.parent).count()
             except Exception:
                 pass
-        if manifest_data:
-            try:
-                entries = json.loads(manifest_data)
-                for entry in entries:
-                    d = entry.get("date", "")
-                    if d:
-                        unique_dates.add(d)
-            except (json.JSONDecodeError, KeyError):
-                pass
+        if not count:
+            # Fall back to gh-pages branch
+            count = len({e.get("date") for e in gh_pages_manifest.get() or [] if e.get("date")})
 
-        number = len(unique_dates) + 1
+        number = count + 1
         tomorrow = datetime.now(tz) + timedelta(days=1)
         date_str = tomorrow.strftime("%Y-%m-%d")
         title = config.get("edition", {}).get("title", "IA qu'a demander")
@@ -1043,6 +1379,7 @@ class DashboardHandler(BaseHTTPRequestHandler):
             date = body.get("date", "")
             styles = body.get("styles", ["deep", "angle", "focused"])
             skip_collect = body.get("skip_collect", False)
+            force = body.get("force", False)  # rerun phases even if up to date
             no_linkedin = body.get("no_linkedin", False)
             no_deploy = body.get("no_deploy", False)
             debug = body.get("debug", False)
@@ -1060,6 +1397,7 @@ class DashboardHandler(BaseHTTPRequestHandler):
                     "skip_collect": skip_collect,
                     "no_linkedin": no_linkedin,
                     "no_deploy": no_deploy,
+                    "force": force,
                     "debug": debug,
                 },
             )
@@ -1138,7 +1476,7 @@ class DashboardHandler(BaseHTTPRequestHandler):
             return
 
         try:
-            result = generate_image_from_prompt(prompt, model)
+            result = generate_image_from_prompt(prompt, model, use_cache=not body.get("force", False))
             self._send_json(result)
         except Exception as e:
             self._send_error(500, str(e))
@@ -1147,8 +1485,9 @@ class DashboardHandler(BaseHTTPRequestHandler):
         """GET /api/image/preview — serve generated image as PNG."""
         parsed = urlparse(self.path)
         raw = "raw=true" in (parsed.query or "")
-        target = LINKEDIN_IMAGE_RAW if raw else LINKEDIN_IMAGE
+        self._send_png(LINKEDIN_IMAGE_RAW if raw else LINKEDIN_IMAGE)
 
+    def _send_png(self, target: Path):
         if not target.exists():
             self._send_error(404, "No image generated yet")
             return
@@ -1166,6 +1505,95 @@ class DashboardHandler(BaseHTTPRequestHandler):
         except OSError:
             self._send_error(500, "Failed to read image file")
 
+    def _handle_image_job_submit(self):
+        """POST /api/image/jobs — queue an image generation, return the job at once."""
+        try:
+            body = json.loads(self._read_body())
+        except json.JSONDecodeError as e:
+            self._send_error(400, f"Invalid JSON: {e}")
+            return
+
+        prompt = body.get("prompt", "").strip()
+        model = body.get("model", "gemini-3-pro-image-preview")
+        if not prompt:
+            self._send_error(400, "Missing 'prompt' field")
+            return
+
+        job = image_jobs.submit(prompt, model, use_cache=not body.get("force", False))
+        self._send_json({"job": job.to_dict()}, status=202)
+
+    def _handle_image_job_get(self, job_id: str, action: str | None):
+        """GET /api/image/jobs/<id> (status) or /api/image/jobs/<id>/result[?raw=true] (PNG)."""
+        job = image_jobs.get(job_id)
+        if job is None:
+            self._send_error(404, f"Job '{job_id}' not found")
+            return
+        if action is None:
+            self._send_json({"job": job.to_dict()})
+            return
+        if job.status != "done":
+            self._send_error(409, f"Job '{job_id}' is {job.status}")
+            return
+        raw = "raw=true" in (urlparse(self.path).query or "")
+        self._send_png(job.output_dir / ("image_raw.png" if raw else "image.png"))
+
+    def _handle_image_job_action(self, job_id: str, action: str):
+        """POST /api/image/jobs/<id>/cancel or /api/image/jobs/<id>/apply."""
+        if action == "cancel":
+            job = image_jobs.cancel(job_id)
+        else:
+            try:
+                job = image_jobs.apply(job_id)
+            except OSError as e:
+                self._send_error(500, f"Failed to apply image: {e}")
+                return
+            if job is not None and job.status != "done":
+                self._send_error(409, f"Job '{job_id}' is {job.status}")
+                return
+        if job is None:
+            self._send_error(404, f"Job '{job_id}' not found")
+            return
+        self._send_json({"ok": True, "job": job.to_dict()})
+
+    def _handle_image_history(self):
+        """GET /api/image/history — past generations (metadata), newest first."""
+        import image_store
+
+        entries = image_store.from_config(load_config()).list()
+        self._send_json({"images": entries})
+
+    def _handle_image_history_get(self, key: str):
+        """GET /api/image/history/<key> — raw stored image as PNG."""
+        import image_store
+
+        # Display only: viewing the gallery must not refresh the LRU order
+        hit = image_store.from_config(load_config()).read(key, touch=False)
+        if hit is None:
+            self._send_error(404, f"Image '{key[:12]}' not in store")
+            return
+        body = hit[0]
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", len(body))
+        # A forced regeneration replaces the bytes behind a key: revalidate
+        self.send_header("Cache-Control", "no-cache")
+        if DEV_MODE:
+            self._add_cors_headers()
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle_image_history_apply(self, key: str):
+        """POST /api/image/history/<key>/apply — make a stored image the LinkedIn image."""
+        try:
+            meta = apply_image_from_history(key)
+        except OSError as e:
+            self._send_error(500, f"Failed to apply image: {e}")
+            return
+        if meta is None:
+            self._send_error(404, f"Image '{key[:12]}' not in store")
+            return
+        self._send_json({"ok": True, "image": meta})
+
     def _handle_image_prompt_save(self):
         """POST /api/image/prompt/save — save edited prompt text."""
         try:
@@ -1234,25 +1662,8 @@ class DashboardHandler(BaseHTTPRequestHandler):
 
     def _handle_archives(self):
         """GET /api/archives — return archived editions from gh-pages manifest."""
-        manifest_data = None
-
-        try:
-            result = subprocess.run(
-                ["git", "show", "origin/gh-pages:editions/archives/manifest.json"],
-                capture_output=True, cwd=str(PROJECT_DIR), timeout=10,
-            )
-            if result.returncode == 0:
-                manifest_data = result.stdout.decode("utf-8", errors="replace")
-        except Exception:
-            pass
-
-        if not manifest_data:
-            self._send_json({"editions": []})
-            return
-
-        try:
-            entries = json.loads(manifest_data)
-        except (json.JSONDecodeError, ValueError):
+        entries = gh_pages_manifest.get()
+        if not entries:
             self._send_json({"editions": []})
             return
 
@@ -1270,7 +1681,13 @@ class DashboardHandler(BaseHTTPRequestHandler):
     # ── Pipeline artifacts ─────────────────────────────────────────────────
 
     def _handle_pipeline_artifacts(self):
-        """Return existence/modified status of pipeline artifacts."""
+        """Return existence/modified status of pipeline artifacts.
+
+        Phases recorded by the phase graph also get "up_to_date": false when
+        their inputs or outputs changed since their last successful run.
+        """
+        import phase_graph
+
         artifacts: dict[str, dict] = {}
 
         # Simple file artifacts
@@ -1309,8 +1726,72 @@ class DashboardHandler(BaseHTTPRequestHandler):
         # Deploy: launchable if html exists, no real artifact to check
         artifacts["deploy"] = {"exists": artifacts["html"]["exists"]}
 
+        for phase, info in phase_graph.dashboard_graph().status().items():
+            if phase in artifacts and phase != "deploy":
+                artifacts[phase]["up_to_date"] = info["up_to_date"]
+
         self._send_json({"artifacts": artifacts})
 
+    # ── Stored runs (.pipeline/runs) ───────────────────────────────────────
+
+    def _handle_pipeline_runs(self):
+        """GET /api/pipeline/runs — stored run snapshots, newest first."""
+        import artifact_store
+
+        runs = []
+        for manifest in artifact_store.list_runs():
+            phases = {a["phase"] for a in manifest["artifacts"].values()}
+            runs.append({
+                "run_id": manifest["run_id"],
+                "created": manifest["created"],
+                "label": manifest.get("label"),
+                "pinned": manifest.get("pinned", False),
+                "edition_date": manifest.get("edition_date"),
+                "phases": [p for p in artifact_store.PHASE_ORDER if p in phases],
+                "artifacts": manifest["artifacts"],
+            })
+        self._send_json({"runs": runs})
+
+    def _handle_pipeline_run_action(self, run_id: str, action: str):
+        """POST /api/pipeline/runs/<id>/restore {start_at?} (or /pin, /unpin).
+
+        Restore copies the run's artifacts back into .pipeline/ (only the
+        outputs of the phases before start_at, if given), so a phase can be
+        run with run-phase without recomputing its upstream phases.
+        """
+        import artifact_store
+
+        if action in ("pin", "unpin"):
+            manifest = artifact_store.set_pinned(run_id, action == "pin")
+            if manifest is None:
+                self._send_error(404, f"Run '{run_id}' not found")
+                return
+            self._send_json({"ok": True, "run_id": run_id, "pinned": manifest["pinned"]})
+            return
+
+        try:
+            body = json.loads(self._read_body() or "{}")
+        except json.JSONDecodeError as e:
+            self._send_error(400, f"Invalid JSON: {e}")
+            return
+
+        with run_lock:
+            if current_run is not None and current_run.running:
+                self._send_error(409, "Pipeline already running")
+                return
+            if artifact_store.load_run(run_id) is None:
+                self._send_error(404, f"Run '{run_id}' not found")
+                return
+            try:
+                restored = artifact_store.restore(run_id, start_at=body.get("start_at"))
+            except ValueError as e:
+                self._send_error(400, str(e))
+                return
+            except OSError as e:
+                self._send_error(500, f"Failed to restore run: {e}")
+                return
+        self._send_json({"ok": True, "run_id": run_id, "restored": restored})
+
     # ── Run single phase ──────────────────────────────────────────────────
 
     def _handle_run_phase(self):
@@ -1360,76 +1841,8 @@ class DashboardHandler(BaseHTTPRequestHandler):
             current_run = run
 
             def run_single_phase():
-                python = sys.executable
-                PIPELINE_DIR.mkdir(parents=True, exist_ok=True)
-
-                if phase == "websearch":
-                    run.run_phase_script(
-                        "websearch",
-                        [python, str(SCRIPTS_DIR / "websearch_collect.py")],
-                    )
-                elif phase == "collect":
-                    run.run_phase_script(
-                        "collect",
-                        [python, str(SCRIPTS_DIR / "collect.py")],
-                    )
-                elif phase == "editorial":
-                    run.current_phase = "editorial"
-                    run.phase_status["editorial"] = "running"
-                    editorial_start = time.time()
-                    run.phase_times["editorial"] = {"start": editorial_start}
-                    run.emit({"type": "phase_start", "phase": "editorial"})
-
-                    VARIANTS_DIR.mkdir(parents=True, exist_ok=True)
-                    generated = []
-
-                    for style in styles:
-                        if run.aborted:
-                            break
-                        sub_phase = f"editorial_{style}"
-                        run.emit({"type": "log", "phase": "editorial", "stream": "stdout",
-                                  "text": f"── Generating variant: {style} ──"})
-                        ok = run.run_phase_script(
-                            sub_phase,
-                            [python, str(SCRIPTS_DIR / "write_editorial.py")],
-                            env_extra={"EDITO_STYLE": style},
-                        )
-                        if ok:
-                            src = EDITORIAL_PATH
-                            dst = VARIANTS_DIR / f"editorial_{style}.json"
-                            if src.exists():
-                                shutil.copy2(src, dst)
-                                generated.append(style)
-                                run.emit({"type": "log", "phase": "editorial", "stream": "stdout",
-                                          "text": f"[OK] Variant '{style}' saved"})
-                        else:
-                            run.emit({"type": "log", "phase": "editorial", "stream": "stderr",
-                                      "text": f"[WARN] Variant '{style}' failed"})
-
-                    editorial_end = time.time()
-                    run.phase_times["editorial"]["end"] = editorial_end
-                    run.phase_times["editorial"]["duration"] = round(editorial_end - editorial_start, 2)
-
-                    if generated:
-                        run.phase_status["editorial"] = "done"
-                        run.emit({"type": "phase_done", "phase": "editorial"})
-                    else:
-                        run.phase_status["editorial"] = "error"
-                        run.emit({"type": "phase_error", "phase": "editorial", "error": "No variants generated"})
-
-                elif phase == "html":
-                    run.run_phase_script(
-                        "html",
-                        [python, str(SCRIPTS_DIR / "generate_edition.py"),
-                         str(EDITORIAL_PATH)],
-                    )
-                elif phase == "deploy":
-                    run.run_phase_script(
-                        "deploy",
-                        [python, str(SCRIPTS_DIR / "deploy.py")],
-                    )
-
-                run._finish_pipeline()
+                # Forced: a manual launch reruns the phase even if up to date
+                run.run_graph(force=[phase])
 
             t = threading.Thread(target=run_single_phase, daemon=True)
             t.start()
@@ -1438,6 +1851,14 @@ class DashboardHandler(BaseHTTPRequestHandler):
 
     # ── Pipeline SSE events ────────────────────────────────────────────────
 
+    def _resume_cursor(self, run: PipelineRun) -> int:
+        """Sequence id to resume from, from the Last-Event-ID header (0 = replay all)."""
+        last_id = self.headers.get("Last-Event-ID", "")
+        run_id, _, seq = last_id.rpartition(":")
+        if run_id == run.run_id and seq.isdigit():
+            return int(seq)
+        return 0
+
     def _handle_pipeline_events(self):
         global current_run
 
@@ -1456,26 +1877,31 @@ class DashboardHandler(BaseHTTPRequestHandler):
             self.wfile.flush()
             return
 
-        cursor = 0
         run = current_run  # capture reference
+        cursor = self._resume_cursor(run)
 
         try:
             while True:
-                events, cursor = run.get_events(cursor)
+                events, cursor = run.wait_events(cursor, SSE_KEEPALIVE_INTERVAL)
                 for event in events:
                     event_data = json.dumps(event, ensure_ascii=False)
-                    self.wfile.write(f"data: {event_data}\n\n".encode("utf-8"))
+                    # SSE id "<run_id>:<seq>": the browser sends it back as
+                    # Last-Event-ID when it reconnects. The events_dropped marker
+                    # has no id, so it doesn't move the client's resume point.
+                    id_line = f"id: {run.run_id}:{event['id']}\n" if "id" in event else ""
+                    self.wfile.write(f"{id_line}data: {event_data}\n\n".encode("utf-8"))
                     self.wfile.flush()
 
                     # Stop streaming after pipeline_done
                     if event.get("type") == "pipeline_done":
                         return
 
-                # Send keepalive
-                self.wfile.write(": keepalive\n\n".encode("utf-8"))
-                self.wfile.flush()
-
-                time.sleep(1)
+                if not events:
+                    if current_run is not run:
+                        return  # a new run started: let the client reconnect to it
+                    # Idle for SSE_KEEPALIVE_INTERVAL: keep proxies/browser from timing out
+                    self.wfile.write(": keepalive\n\n".encode("utf-8"))
+                    self.wfile.flush()
         except (BrokenPipeError, ConnectionAbortedError, ConnectionResetError, OSError):
             pass  # client disconnected
 
@@ -1514,24 +1940,33 @@ class DashboardHandler(BaseHTTPRequestHandler):
             self._send_error(404, "Not found (no dashboard/dist/index.html)")
 
     def _serve_file(self, file_path: Path):
-        """Serve a single file with appropriate content type."""
-        content_type, _ = mimetypes.guess_type(str(file_path))
-        if content_type is None:
-            content_type = "application/octet-stream"
-
+        """Serve a single file from the static cache (ETag, compression, caching headers)."""
         try:
-            body = file_path.read_bytes()
+            asset = load_static_asset(file_path)
         except OSError:
             self._send_error(500, "Failed to read file")
             return
 
-        self.send_response(200)
-        self.send_header("Content-Type", content_type)
-        self.send_header("Content-Length", len(body))
+        encoding, body, etag = asset.select(self.headers.get("Accept-Encoding", ""))
+        if_none_match = self.headers.get("If-None-Match", "")
+        not_modified = any(
+            tag.strip().removeprefix("W/") in (etag, "*") for tag in if_none_match.split(",")
+        ) if if_none_match else False
+
+        self.send_response(304 if not_modified else 200)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", static_cache_control(file_path))
+        self.send_header("Vary", "Accept-Encoding")
+        if not not_modified:
+            self.send_header("Content-Type", asset.content_type)
+            if encoding != "identity":
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", len(body))
         if DEV_MODE:
             self._add_cors_headers()
         self.end_headers()
-        self.wfile.write(body)
+        if not not_modified:
+            self.wfile.write(body)
 
     def log_message(self, format, *args):
         """Keep logs concise: suppress API requests."""
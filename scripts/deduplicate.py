@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
-"""Deduplicate articles by URL and title similarity."""
+"""Deduplicate articles by URL and title similarity.
+
+Title near-duplicates are found through a MinHash/LSH index (see
+similarity.py) and confirmed with the SequenceMatcher thresholds below, so
+each article is only compared against a handful of candidates instead of
+every article already kept.
+"""
 
 import json
 import sys
@@ -7,6 +13,7 @@ from difflib import SequenceMatcher
 from urllib.parse import urlparse
 
 from log_utils import setup_logging
+from similarity import LSHIndex, minhash
 
 logger = setup_logging("deduplicate")
 
@@ -42,6 +49,8 @@ def deduplicate(articles):
 
     seen_urls = {}
     result = []
+    index = LSHIndex()  # keys are positions in result
+    comparisons = 0
 
     for article in articles:
         norm_url = normalize_url(article["url"])
@@ -50,9 +59,12 @@ def deduplicate(articles):
         if norm_url in seen_urls:
             continue
 
-        # Title similarity check
+        # Title similarity check, restricted to LSH candidates
+        signature = minhash(article["title"])
         is_dup = False
-        for kept in result:
+        for pos in index.query(signature):
+            kept = result[pos]
+            comparisons += 1
             threshold = SAME_DOMAIN_THRESHOLD if same_domain(article["url"], kept["url"]) else CROSS_DOMAIN_THRESHOLD
             if title_similarity(article["title"], kept["title"]) >= threshold:
                 is_dup = True
@@ -60,8 +72,10 @@ def deduplicate(articles):
 
         if not is_dup:
             seen_urls[norm_url] = True
+            index.add(len(result), signature)
             result.append(article)
 
+    logger.debug(f"Title check: {comparisons} ratio comparisons for {len(articles)} articles")
     return result
 
 def main():
@@ -1,20 +1,39 @@
 #!/usr/bin/env python3
-"""Deploy latest edition to GitHub Pages (gh-pages branch)."""
-
+"""Deploy latest edition to GitHub Pages (gh-pages branch).
+
+The gh-pages branch is kept checked out in .cache/gh-pages/ between deploys:
+each deploy fetches the branch, resets the worktree onto it and rewrites only
+the files whose content changed, so the commit (and the push) carries only
+the new edition. Archives already deployed are tracked in a ledger
+(.cache/gh-pages.ledger.json) and not read again while neither the source nor
+the deployed copy changed. The remote defaults to https://github.com/<github.repo>.git
+and can be overridden with github.remote or RP_DEPLOY_REMOTE (any git URL,
+e.g. a local bare repo).
+"""
+
+import fcntl
+import hashlib
 import json
+import os
 import re
 import subprocess
 import sys
 import shutil
-import tempfile
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
-from log_utils import setup_logging, load_config
+import archive_pages
+from artifact_store import file_sha256
+from manifest_store import ManifestStore
+from log_utils import setup_logging, load_config, CACHE_DIR
 
 logger = setup_logging("deploy")
 
+WORKTREE_DIR = CACHE_DIR / "gh-pages"
+LOCK_PATH = CACHE_DIR / "gh-pages.lock"
+LEDGER_PATH = CACHE_DIR / "gh-pages.ledger.json"
+
 
 def run(cmd, cwd=None, check=True):
     """Run a shell command."""
@@ -28,102 +47,161 @@ def run(cmd, cwd=None, check=True):
         raise RuntimeError(f"Command failed: {' '.join(cmd)}")
     return result
 
-def build_deploy_archive_index(deploy_archives, manifest_path, config_title):
-    """Generate archive index.html from manifest.json."""
-    # Load manifest or build minimal fallback from filenames
-    if manifest_path.exists():
-        with open(manifest_path, encoding="utf-8") as f:
-            manifest = json.load(f)
-    else:
-        manifest = []
-
-    # Build lookup from manifest
-    by_date = {e["date"]: e for e in manifest}
-
-    # Collect existing archive HTML files
-    archive_files = sorted(deploy_archives.glob("????-??-??.html"), reverse=True)
-    archive_files = [f for f in archive_files if f.name != "index.html"]
-
-    if not archive_files:
-        return
-
-    # Build entries: only files that exist, enriched with manifest data
-    entries = []
-    for f in archive_files:
-        date_str = f.stem  # YYYY-MM-DD
-        info = by_date.get(date_str, {})
-        entries.append({
-            "date": date_str,
-            "number": info.get("number", ""),
-            "title": info.get("title", ""),
-            "filename": f.name,
-        })
-
-    items_html = ""
-    for e in entries:
-        num_html = f'<span class="archive-num">N\u00b0{e["number"]}</span>' if e["number"] else ""
-        title_html = f'<span class="archive-title">{e["title"]}</span>' if e["title"] else ""
-        items_html += f'''
-    <a href="{e['filename']}" class="archive-item">
+
+def deploy_remote(config):
+    """Remote URL of the gh-pages branch: RP_DEPLOY_REMOTE > github.remote > GitHub repo."""
+    github = config["github"]
+    return (os.environ.get("RP_DEPLOY_REMOTE") or github.get("remote")
+            or f"https://github.com/{github['repo']}.git")
+
+
+def prepare_worktree(remote, branch, worktree=WORKTREE_DIR):
+    """Bring the cached gh-pages checkout to the tip of remote/branch.
+
+    Clones (shallow) on first use; afterwards fetches the branch and hard-resets
+    onto it, dropping leftovers of a failed deploy. A broken checkout is cloned
+    again from scratch.
+    """
+    if (worktree / ".git").is_dir():
+        try:
+            run(["git", "remote", "set-url", "origin", remote], cwd=worktree)
+            run(["git", "fetch", "--depth", "1", "origin", branch], cwd=worktree)
+            run(["git", "checkout", "-q", "-B", branch, "FETCH_HEAD"], cwd=worktree)
+            run(["git", "reset", "-q", "--hard", "FETCH_HEAD"], cwd=worktree)
+            run(["git", "clean", "-qfdx"], cwd=worktree)
+            logger.info(f"[INFO] Worktree {worktree} updated from {remote}")
+            return
+        except RuntimeError:
+            logger.warning("[WARN] Cached worktree unusable, cloning again")
+    shutil.rmtree(worktree, ignore_errors=True)
+    worktree.parent.mkdir(parents=True, exist_ok=True)
+    run(["git", "clone", "--branch", branch, "--single-branch", "--depth", "1",
+         remote, str(worktree)])
+
+
+def write_if_changed(path, data):
+    """Write bytes or text to path unless it already holds them; returns True if written."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if path.is_file() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def copy_if_changed(src, dst):
+    """Copy src to dst unless dst has the same content hash; returns True if copied."""
+    if (dst.is_file() and dst.stat().st_size == src.stat().st_size
+            and file_sha256(dst) == file_sha256(src)):
+        return False
+    shutil.copy2(str(src), str(dst))
+    return True
+
+
+def rewrite_archive_links(content):
+    """Make root-relative nav links of an archive relative to editions/archives/.
+
+    Archives generated by generate_edition.py already are; this only changes
+    older ones.
+    """
+    content = content.replace('href="editions/archives/index.html"', 'href="index.html"')
+    return content.replace('href="editions/archives/', 'href="')
+
+
+def load_ledger():
+    try:
+        with open(LEDGER_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_ledger(ledger):
+    tmp = LEDGER_PATH.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(ledger, f, indent=1, sort_keys=True)
+    os.replace(tmp, LEDGER_PATH)
+
+
+def sync_archive(src, dst, entry):
+    """Deploy one archive unless the ledger entry shows it is already there.
+
+    Returns (new ledger entry, written). The entry records the source (name,
+    size, mtime, sha256) and the deployed copy (size, mtime): when both stats
+    match, nothing is read; when only the source was touched but its hash is
+    unchanged, nothing is written.
+    """
+    src_stat = src.stat()
+    dst_stat = dst.stat() if dst.is_file() else None
+    deployed = (entry is not None and dst_stat is not None
+                and entry["source"] == src.name
+                and (entry["size"], entry["mtime_ns"]) == (dst_stat.st_size, dst_stat.st_mtime_ns))
+    if deployed and (entry["source_size"], entry["source_mtime_ns"]) == (src_stat.st_size, src_stat.st_mtime_ns):
+        return entry, False
+
+    data = src.read_bytes()
+    sha = hashlib.sha256(data).hexdigest()
+    written = False
+    if not (deployed and sha == entry["source_sha256"]):
+        written = write_if_changed(dst, rewrite_archive_links(data.decode("utf-8")))
+        dst_stat = dst.stat()
+    return {
+        "source": src.name,
+        "source_sha256": sha,
+        "source_size": src_stat.st_size,
+        "source_mtime_ns": src_stat.st_mtime_ns,
+        "size": dst_stat.st_size,
+        "mtime_ns": dst_stat.st_mtime_ns,
+    }, written
+
+
+def _deploy_archive_item_html(date, number, title):
+    num_html = f'<span class="archive-num">N\u00b0{number}</span>' if number else ""
+    title_html = f'<span class="archive-title">{title}</span>' if title else ""
+    return f'''
+    <a href="{date}.html" class="archive-item">
       {num_html}
       {title_html}
-      <span class="archive-date">{e['date']}</span>
+      <span class="archive-date">{date}</span>
     </a>'''
 
-    archive_html = f'''<!DOCTYPE html>
-<html lang="fr" data-theme="light">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>Archives — {config_title}</title>
-<link href="https://fonts.googleapis.com/css2?family=Instrument+Serif:ital@0;1&family=Inter:wght@400;500;600&family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">
-<style>
-*,*::before,*::after{{margin:0;padding:0;box-sizing:border-box}}
-:root{{--bg:#FAFAF8;--card:#FFFFFF;--text:#1A1A1A;--text-2:#6B6B6B;--accent:#E63946;--border:#E5E5E3;
---font-h:'Instrument Serif',serif;--font-b:'Inter',sans-serif;--font-m:'JetBrains Mono',monospace}}
-[data-theme="dark"]{{--bg:#0F0F0F;--card:#1A1A1A;--text:#EDEDEB;--text-2:#999;--accent:#FF6B6B;--border:#2A2A2A}}
-body{{font-family:var(--font-b);color:var(--text);background:var(--bg);min-height:100vh}}
-a{{color:inherit;text-decoration:none}}
-.masthead{{padding:clamp(1.5rem,4vw,3rem) clamp(1rem,5vw,4rem);border-bottom:2px solid var(--text);
-display:flex;justify-content:space-between;align-items:baseline;flex-wrap:wrap;gap:1rem}}
-.masthead h1{{font-family:var(--font-h);font-size:clamp(2rem,5vw,3.5rem);font-weight:400;letter-spacing:-0.02em}}
-.masthead-link{{
-  font-family:var(--font-m);font-size:0.8rem;
-  color:var(--text-2);display:inline-flex;align-items:center;gap:0.3rem;
-  transition:color .2s;border:none;background:none;cursor:pointer;text-decoration:none;
-}}
-.masthead-link:hover{{color:var(--text)}}
-.masthead-link svg{{width:14px;height:14px;stroke:currentColor;fill:none;stroke-width:1.5;stroke-linecap:round;stroke-linejoin:round}}
-.archives{{max-width:720px;margin:2rem auto;padding:0 clamp(1rem,5vw,4rem)}}
-.archive-item{{display:flex;align-items:center;gap:1rem;padding:1rem 0;border-bottom:1px solid var(--border);
-transition:color .2s}}
-.archive-item:hover{{color:var(--accent)}}
-.archive-num{{font-family:var(--font-m);font-size:0.8rem;color:var(--text-2);white-space:nowrap;min-width:3rem}}
-.archive-title{{flex:1;font-family:var(--font-b);font-size:0.95rem;overflow:hidden;text-overflow:ellipsis;white-space:nowrap}}
-.archive-date{{font-family:var(--font-m);font-size:0.85rem;color:var(--text-2);white-space:nowrap}}
-</style>
-</head>
-<body>
-<header class="masthead">
-  <h1><a href="https://sandjab.github.io/rp/" style="color:inherit;text-decoration:none">Archives</a></h1>
-  <a href="../../index.html" class="masthead-link"><svg viewBox="0 0 24 24"><path d="M4 22h16a2 2 0 002-2V4a2 2 0 00-2-2H8a2 2 0 00-2 2v16a2 2 0 01-2 2zm0 0a2 2 0 01-2-2v-9c0-1.1.9-2 2-2h2"/><path d="M18 14h-8M18 18h-8M18 10h-8"/></svg> edito</a>
-</header>
-<main class="archives">
-{items_html}
-</main>
-</body>
-</html>'''
-
-    index_path = deploy_archives / "index.html"
-    with open(index_path, "w", encoding="utf-8") as f:
-        f.write(archive_html)
-    logger.info(f"[INFO] Archive index generated: {index_path}")
+
+def build_deploy_archive_index(deploy_archives, store, config_title, page_size):
+    """Generate the paginated archive index (index.html, page-N.html) of the deployed archives.
+
+    Lists every deployed <date>.html, archive_page_size per page, with its
+    number and title from the manifest store (None without local archives)
+    when it has the date: editions missing from the store stay listed by
+    date. Every page is rendered but only changed ones are written, so a new
+    edition touches index.html, plus the page before it when a new page
+    starts. Returns the number of files written or removed.
+    """
+    by_date = {row[0]: row for row in store.summaries()} if store is not None else {}
+    dates = sorted(f.stem for f in deploy_archives.glob("????-??-??.html"))
+    rows = [by_date.get(date, (date, "", "")) for date in dates]
+    if not rows:
+        return 0
+
+    last_page = archive_pages.last_page(len(rows), page_size)
+    written = 0
+    for page in range(last_page + 1):
+        chunk = rows[page * page_size:(page + 1) * page_size]
+        archive_html = archive_pages.render_page(
+            config_title, "../../index.html",
+            [_deploy_archive_item_html(*row) for row in chunk], page, last_page)
+        written += write_if_changed(deploy_archives / archive_pages.page_name(page, last_page), archive_html)
+    written += archive_pages.remove_stale_pages(deploy_archives, last_page)
+    if written:
+        logger.info(f"[INFO] Archive index generated: {deploy_archives / 'index.html'} "
+                    f"({len(rows)} edition(s), {last_page + 1} page(s), {written} file(s) updated)")
+    return written
 
 
 def main():
     config = load_config()
-    repo = config["github"]["repo"]
     branch = config["github"]["branch"]
+    remote = deploy_remote(config)
 
     project_dir = Path(__file__).parent.parent
     editions_dir = project_dir / "editions"
@@ -140,20 +218,19 @@ def main():
     timestamp_str = now.strftime("%Y-%m-%d.%H%M%S")
     archives_dir = editions_dir / "archives"
 
-    # Clone into temp dir
-    tmp_dir = tempfile.mkdtemp(prefix="rp-deploy-")
-    logger.info(f"[INFO] Cloning into {tmp_dir}")
-
-    try:
-        # Clone only gh-pages branch (shallow)
-        run(["git", "clone", "--branch", branch, "--single-branch", "--depth", "1",
-             f"https://github.com/{repo}.git", tmp_dir])
+    LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_PATH, "w") as lock:
+        # One deploy at a time in the shared worktree
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        prepare_worktree(remote, branch)
+        work_dir = WORKTREE_DIR
+        written = 0
 
         # Copy latest as index.html
-        shutil.copy2(str(latest), f"{tmp_dir}/index.html")
+        written += copy_if_changed(latest, work_dir / "index.html")
 
         # Create editions dir structure in deploy
-        deploy_editions = Path(tmp_dir) / "editions"
+        deploy_editions = work_dir / "editions"
         deploy_editions.mkdir(exist_ok=True)
         deploy_archives = deploy_editions / "archives"
         deploy_archives.mkdir(exist_ok=True)
@@ -170,80 +247,45 @@ def main():
                 f.unlink()
                 logger.debug(f"Removed legacy archive: {f.name}")
 
-        # Copy archives: keep only latest file per day
+        # Copy archives: keep only latest file per day; only new or changed ones are read
+        by_date = {}
+        ledger = load_ledger()
         if archives_dir.exists():
-            by_date = {}
-            for f in archives_dir.glob("*.html"):
-                if f.name == "index.html":
-                    continue
+            for f in archives_dir.glob("????-??-??*.html"):
                 date_part = f.name.split(".")[0]
                 if date_part not in by_date or f.name > by_date[date_part].name:
                     by_date[date_part] = f
             for date_str, f in by_date.items():
-                shutil.copy2(str(f), str(deploy_archives / f"{date_str}.html"))
-
-        # Build manifest from timestamped snapshots matching selected archives
-        manifest_dst = deploy_archives / "manifest.json"
-        if archives_dir and archives_dir.exists():
-            merged_manifest = []
-            seen_dates = set()
-            # For each selected archive, find its matching manifest snapshot
-            for date_str, f in by_date.items():
-                ts = f.stem  # e.g. "2026-02-10.001737"
-                snapshot = archives_dir / f"manifest.{ts}.json"
-                if snapshot.exists():
-                    with open(snapshot, encoding="utf-8") as sf:
-                        snap_data = json.load(sf)
-                    # Extract only the entry for this date
-                    for entry in snap_data:
-                        if entry.get("date") == date_str and date_str not in seen_dates:
-                            merged_manifest.append(entry)
-                            seen_dates.add(date_str)
-                            break
-            # Fill remaining dates from the generic manifest
-            manifest_src = archives_dir / "manifest.json"
-            if manifest_src.exists():
-                with open(manifest_src, encoding="utf-8") as mf:
-                    generic = json.load(mf)
-                for entry in generic:
-                    if entry.get("date") not in seen_dates:
-                        merged_manifest.append(entry)
-                        seen_dates.add(entry["date"])
-            merged_manifest.sort(key=lambda e: e.get("date", ""), reverse=True)
-            with open(manifest_dst, "w", encoding="utf-8") as mf:
-                json.dump(merged_manifest, mf, ensure_ascii=False, indent=2)
-        else:
-            manifest_src = archives_dir / "manifest.json" if archives_dir.exists() else None
-            if manifest_src and manifest_src.exists():
-                shutil.copy2(str(manifest_src), str(manifest_dst))
-        build_deploy_archive_index(deploy_archives, manifest_dst, config["edition"]["title"])
-
-        # Rewrite nav links for archive context (relative paths differ from root)
-        for html_file in deploy_archives.glob("????-??-??.html"):
-            content = html_file.read_text(encoding="utf-8")
-            content = content.replace('href="editions/archives/index.html"', 'href="index.html"')
-            content = content.replace('href="editions/archives/', 'href="')
-            html_file.write_text(content, encoding="utf-8")
+                name = f"{date_str}.html"
+                ledger[name], changed = sync_archive(f, deploy_archives / name, ledger.get(name))
+                written += changed
+        save_ledger(ledger)
+
+        # Export the manifest store (one entry per date, that of the day's latest generation)
+        store = ManifestStore(archives_dir) if archives_dir.exists() else None
+        if store is not None:
+            written += write_if_changed(
+                deploy_archives / "manifest.json",
+                json.dumps(store.entries(), ensure_ascii=False, indent=2))
+        page_size = config["edition"].get("archive_page_size", archive_pages.DEFAULT_PAGE_SIZE)
+        written += build_deploy_archive_index(
+            deploy_archives, store, config["edition"]["title"], page_size)
+        logger.info(f"[INFO] {written} file(s) updated in {work_dir}")
 
         # Git add, commit, push
-        run(["git", "add", "-A"], cwd=tmp_dir)
+        run(["git", "add", "-A"], cwd=work_dir)
 
         # Check if there are changes
-        status = run(["git", "status", "--porcelain"], cwd=tmp_dir)
+        status = run(["git", "status", "--porcelain"], cwd=work_dir)
         if not status.stdout.strip():
             logger.info("[INFO] No changes to deploy.")
             return
 
-        run(["git", "commit", "-m", f"Edition {timestamp_str}"], cwd=tmp_dir)
-        run(["git", "push", "origin", branch], cwd=tmp_dir)
+        run(["git", "commit", "-m", f"Edition {timestamp_str}"], cwd=work_dir)
+        run(["git", "push", "origin", branch], cwd=work_dir)
 
         logger.info(f"[INFO] Deployed to https://sandjab.github.io/rp/")
         print(f"https://sandjab.github.io/rp/")
 
-    finally:
-        # Cleanup
-        shutil.rmtree(tmp_dir, ignore_errors=True)
-        logger.info(f"[INFO] Cleaned up {tmp_dir}")
-
 if __name__ == "__main__":
     main()
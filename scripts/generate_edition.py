@@ -2,6 +2,7 @@
 """Generate HTML edition from template and article data."""
 
 import argparse
+import bisect
 import json
 import os
 import re
@@ -12,14 +13,19 @@ from html import escape as h
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+import archive_pages
+import history_index
+import template_engine
+from manifest_store import ManifestStore
 from log_utils import setup_logging, load_config
 
 logger = setup_logging("generate")
 
+ARCHIVES_HREF = "editions/archives/"  # archive links as seen from the site root (latest.html)
+ARCHIVE_INDEX_NAME = "archive_index.json"  # sorted archive file names, next to manifest.json
+
 def load_template():
-    tpl_path = Path(__file__).parent.parent / "templates" / "edition.html"
-    with open(tpl_path, encoding="utf-8") as f:
-        return f.read()
+    return template_engine.load("edition.html")
 
 def get_edition_date(tz):
     """Return edition date from RP_EDITION_DATE env var, or now()."""
@@ -29,18 +35,9 @@ def get_edition_date(tz):
     return datetime.now(tz)
 
 def get_edition_number(archives_dir):
-    """Derive edition number from manifest.json history (resilient to HTML deletion)."""
-    manifest = archives_dir / "manifest.json"
-    if manifest.exists():
-        with open(manifest, encoding="utf-8") as f:
-            entries = json.load(f)
-        if entries:
-            unique_days = set(e.get("date", "") for e in entries)
-            edition_date = os.environ.get("RP_EDITION_DATE") or datetime.now().strftime("%Y-%m-%d")
-            if edition_date in unique_days:
-                return len(unique_days)
-            return len(unique_days) + 1
-    return 1
+    """Derive edition number from the manifest store (resilient to HTML deletion)."""
+    edition_date = os.environ.get("RP_EDITION_DATE") or datetime.now().strftime("%Y-%m-%d")
+    return ManifestStore(archives_dir).edition_number(edition_date)
 
 def time_ago(published_str, now):
     """Human-readable relative time in French."""
@@ -253,75 +250,90 @@ def build_grid_card_html(article, index, config, now):
       </div>
     </article>'''
 
-def build_archive_page(archives_dir, config):
-    """Generate archive index page."""
-    editions = sorted(archives_dir.glob("????-??-??.??????.html"), reverse=True)
-    if not editions:
-        # Also try legacy format
-        editions = sorted(archives_dir.glob("????-??-??.html"), reverse=True)
-    if not editions:
-        return
+def nav_values(archives_href):
+    """Values of the nav slots; archives_href is the path of editions/archives/ from the page."""
+    # Masthead nav — edition page shows archives link only
+    masthead_nav = f'<a href="{archives_href}index.html" class="masthead-btn" aria-label="Archives"><svg viewBox="0 0 24 24"><path d="M21 8v13H3V8"/><path d="M1 3h22v5H1z"/><path d="M10 12h4"/></svg></a>'
+
+    # Footer nav
+    footer_nav = f'<a href="{archives_href}index.html">Archives</a>'
+
+    return {"MASTHEAD_NAV": masthead_nav, "FOOTER_NAV": footer_nav}
+
+def load_archive_index(archives_dir):
+    """Archive file names, oldest first, and whether they were rebuilt by a directory scan.
 
-    items_html = ""
-    for ed in editions:
-        # Filename format: YYYY-MM-DD.hhmmss.html
-        name = ed.stem  # YYYY-MM-DD.hhmmss
-        parts = name.split(".")
-        date_part = parts[0]
-        time_part = parts[1] if len(parts) > 1 else ""
-        display = date_part
-        if time_part and len(time_part) == 6:
-            display += f" {time_part[:2]}:{time_part[2:4]}:{time_part[4:6]}"
-        items_html += f'''
-    <a href="{ed.name}" class="archive-item">
+    Read from archive_index.json; the scan only happens when that file is
+    missing or unreadable (first run, manual cleanup).
+    """
+    try:
+        with open(archives_dir / ARCHIVE_INDEX_NAME, encoding="utf-8") as f:
+            return json.load(f)["editions"], False
+    except (OSError, json.JSONDecodeError, KeyError):
+        pass
+    names = sorted(f.name for f in archives_dir.glob("????-??-??.??????.html"))
+    if not names:
+        # Also try legacy format
+        names = sorted(f.name for f in archives_dir.glob("????-??-??.html"))
+    return names, True
+
+def save_archive_index(archives_dir, names):
+    path = archives_dir / ARCHIVE_INDEX_NAME
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"editions": names}, f, indent=0)
+    os.replace(tmp, path)
+
+def _archive_item_html(name):
+    # Filename format: YYYY-MM-DD.hhmmss.html
+    parts = name[:-len(".html")].split(".")
+    date_part = parts[0]
+    time_part = parts[1] if len(parts) > 1 else ""
+    display = date_part
+    if time_part and len(time_part) == 6:
+        display += f" {time_part[:2]}:{time_part[2:4]}:{time_part[4:6]}"
+    return f'''
+    <a href="{name}" class="archive-item">
       <span class="archive-date">{display}</span>
     </a>'''
 
-    archive_html = f'''<!DOCTYPE html>
-<html lang="fr" data-theme="light">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>Archives — {config["edition"]["title"]}</title>
-<link href="https://fonts.googleapis.com/css2?family=Instrument+Serif:ital@0;1&family=Inter:wght@400;500;600&family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">
-<style>
-*,*::before,*::after{{margin:0;padding:0;box-sizing:border-box}}
-:root{{--bg:#FAFAF8;--card:#FFFFFF;--text:#1A1A1A;--text-2:#6B6B6B;--accent:#E63946;--border:#E5E5E3;
---font-h:'Instrument Serif',serif;--font-b:'Inter',sans-serif;--font-m:'JetBrains Mono',monospace}}
-[data-theme="dark"]{{--bg:#0F0F0F;--card:#1A1A1A;--text:#EDEDEB;--text-2:#999;--accent:#FF6B6B;--border:#2A2A2A}}
-body{{font-family:var(--font-b);color:var(--text);background:var(--bg);min-height:100vh}}
-a{{color:inherit;text-decoration:none}}
-.masthead{{padding:clamp(1.5rem,4vw,3rem) clamp(1rem,5vw,4rem);border-bottom:2px solid var(--text);
-display:flex;justify-content:space-between;align-items:baseline;flex-wrap:wrap;gap:1rem}}
-.masthead h1{{font-family:var(--font-h);font-size:clamp(2rem,5vw,3.5rem);font-weight:400;letter-spacing:-0.02em}}
-.masthead-link{{
-  font-family:var(--font-m);font-size:0.8rem;
-  color:var(--text-2);display:inline-flex;align-items:center;gap:0.3rem;
-  transition:color .2s;border:none;background:none;cursor:pointer;text-decoration:none;
-}}
-.masthead-link:hover{{color:var(--text)}}
-.masthead-link svg{{width:14px;height:14px;stroke:currentColor;fill:none;stroke-width:1.5;stroke-linecap:round;stroke-linejoin:round}}
-.archives{{max-width:720px;margin:2rem auto;padding:0 clamp(1rem,5vw,4rem)}}
-.archive-item{{display:block;padding:1rem 0;border-bottom:1px solid var(--border);
-font-family:var(--font-m);font-size:0.9rem;transition:color .2s}}
-.archive-item:hover{{color:var(--accent)}}
-</style>
-</head>
-<body>
-<header class="masthead">
-  <h1><a href="https://sandjab.github.io/rp/" style="color:inherit;text-decoration:none">Archives</a></h1>
-  <a href="../index.html" class="masthead-link"><svg viewBox="0 0 24 24"><path d="M4 22h16a2 2 0 002-2V4a2 2 0 00-2-2H8a2 2 0 00-2 2v16a2 2 0 01-2 2zm0 0a2 2 0 01-2-2v-9c0-1.1.9-2 2-2h2"/><path d="M18 14h-8M18 18h-8M18 10h-8"/></svg> edito</a>
-</header>
-<main class="archives">
-{items_html}
-</main>
-</body>
-</html>'''
-
-    archive_path = archives_dir / "index.html"
-    with open(archive_path, "w", encoding="utf-8") as f:
-        f.write(archive_html)
-    logger.info(f"[INFO] Archive page updated: {archive_path}")
+def build_archive_page(archives_dir, config, added=None):
+    """Update the archive index pages after adding the archive file named added.
+
+    The sorted list of archives lives in archive_index.json; added is inserted
+    by bisection and only the pages from the one receiving it onwards are
+    rendered again (all of them when the index had to be rebuilt or added is
+    None), plus the page before the old last one when a new page starts: its
+    "Plus recentes" link moves from index.html to the renamed page.
+    """
+    names, rebuilt = load_archive_index(archives_dir)
+    page_size = config["edition"].get("archive_page_size", archive_pages.DEFAULT_PAGE_SIZE)
+    old_last_page = archive_pages.last_page(len(names), page_size)
+    first_page = 0
+    if added is not None and not rebuilt:
+        pos = bisect.bisect_left(names, added)
+        if pos == len(names) or names[pos] != added:
+            names.insert(pos, added)
+        first_page = min(pos // page_size, old_last_page)
+    if not names:
+        return
+    save_archive_index(archives_dir, names)
+
+    last_page = archive_pages.last_page(len(names), page_size)
+    if last_page > old_last_page:
+        first_page = min(first_page, max(0, old_last_page - 1))
+    for page in range(first_page, last_page + 1):
+        chunk = names[page * page_size:(page + 1) * page_size]
+        archive_html = archive_pages.render_page(
+            config["edition"]["title"], "../index.html",
+            [_archive_item_html(name) for name in chunk], page, last_page)
+        archive_path = archives_dir / archive_pages.page_name(page, last_page)
+        with open(archive_path, "w", encoding="utf-8") as f:
+            f.write(archive_html)
+    if rebuilt:
+        archive_pages.remove_stale_pages(archives_dir, last_page)
+    logger.info(f"[INFO] Archive page updated: {archives_dir / 'index.html'} "
+                f"({last_page - first_page + 1}/{last_page + 1} page(s) rendered)")
 
 def main():
     config = load_config()
@@ -358,7 +370,7 @@ def main():
 
     # Warn about missing editorial content
     missing_editorial = [a for a in articles if not a.get("editorial_title") or not a.get("editorial_summary")]
-    logger.debug(f"Template size: {len(template)} chars, {len(articles)} articles loaded")
+    logger.debug(f"Template slots: {len(template.slots)}, {len(articles)} articles loaded")
 
     if missing_editorial:
         logger.warning(f"[WARN] {len(missing_editorial)}/{len(articles)} articles missing editorial_title or editorial_summary.")
@@ -399,30 +411,22 @@ def main():
             cards_html += build_card_html(article, i, config, now)
             grid_cards_html += build_grid_card_html(article, i, config, now)
 
-    # Masthead nav — edition page shows archives link only
-    masthead_nav = '<a href="editions/archives/index.html" class="masthead-btn" aria-label="Archives"><svg viewBox="0 0 24 24"><path d="M21 8v13H3V8"/><path d="M1 3h22v5H1z"/><path d="M10 12h4"/></svg></a>'
+    # Template slots (nav links are filled per output, see below)
+    values = {
+        "EDITION_TITLE": config["edition"]["title"],
+        "EDITION_DATE": date_str,
+        "EDITION_DATE_DISPLAY": date_display,
+        "EDITION_NUMBER": edition_number,
+        "CARDS": cards_html,
+        "GRID_CARDS": grid_cards_html,
+        "ARTICLES_JSON": json.dumps(articles, ensure_ascii=False).replace("</", "<\\/"),
+        "GENERATION_TIME": now.strftime("%H:%M %Z"),
+    }
 
-    # Footer nav
-    footer_nav = f'<a href="editions/archives/index.html">Archives</a>'
-
-    # Replace placeholders
-    html = template
-    html = html.replace("{{EDITION_TITLE}}", config["edition"]["title"])
-    html = html.replace("{{EDITION_DATE}}", date_str)
-    html = html.replace("{{EDITION_DATE_DISPLAY}}", date_display)
-    html = html.replace("{{EDITION_NUMBER}}", str(edition_number))
-    html = html.replace("{{MASTHEAD_NAV}}", masthead_nav)
-    html = html.replace("{{CARDS}}", cards_html)
-    html = html.replace("{{GRID_CARDS}}", grid_cards_html)
-    articles_json = json.dumps(articles, ensure_ascii=False).replace("</", "<\\/")
-    html = html.replace("{{ARTICLES_JSON}}", articles_json)
-    html = html.replace("{{GENERATION_TIME}}", now.strftime("%H:%M %Z"))
-    html = html.replace("{{FOOTER_NAV}}", footer_nav)
-
-    # Archive with timestamp
+    # Archive with timestamp, nav links relative to editions/archives/ (deployed as is)
     archive_path = archives_dir / f"{timestamp_str}.html"
     with open(archive_path, "w", encoding="utf-8") as f:
-        f.write(html)
+        f.write(template.render({**values, **nav_values("")}))
 
     logger.info(f"[INFO] Archived: {archive_path}")
 
@@ -433,14 +437,7 @@ def main():
         shutil.copy2(str(editorial_src), str(editorial_snapshot))
         logger.info(f"[INFO] Editorial snapshot: {editorial_snapshot}")
 
-    # Update manifest.json with edition metadata
-    manifest_path = archives_dir / "manifest.json"
-    if manifest_path.exists():
-        with open(manifest_path, encoding="utf-8") as f:
-            manifest = json.load(f)
-    else:
-        manifest = []
-
+    # Record the edition in the manifest store
     synth = next((a for a in articles if a.get("is_synthesis")), None)
     editorial_title = synth.get("editorial_title", synth.get("title", "")) if synth else ""
 
@@ -455,27 +452,21 @@ def main():
         "urls": published_urls,
         "titles": published_titles,
     }
-    manifest = [e for e in manifest if e.get("date") != date_str]
-    manifest.append(entry)
-    manifest.sort(key=lambda e: e.get("date", ""), reverse=True)
-
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    store = ManifestStore(archives_dir)
+    store.upsert(entry, archive=archive_path.name)
+    manifest_path = store.export_json()
     logger.info(f"[INFO] Manifest updated: {manifest_path}")
 
-    # Save timestamped manifest snapshot alongside the archive HTML
-    manifest_snapshot = archives_dir / f"manifest.{timestamp_str}.json"
-    with open(manifest_snapshot, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, ensure_ascii=False, indent=2)
-    logger.info(f"[INFO] Manifest snapshot: {manifest_snapshot}")
+    # Keep the cross-edition dedup index in step with the manifest
+    history_index.update_entry(entry)
 
     # Also write latest.html for deploy script
     latest_path = editions_dir / "latest.html"
     with open(latest_path, "w", encoding="utf-8") as f:
-        f.write(html)
+        f.write(template.render({**values, **nav_values(ARCHIVES_HREF)}))
 
     # Update archive index
-    build_archive_page(archives_dir, config)
+    build_archive_page(archives_dir, config, added=archive_path.name)
 
     # Output path to stdout
     print(str(latest_path))
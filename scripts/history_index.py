@@ -0,0 +1,123 @@
+"""Persistent title-similarity index over published editions (manifest store).
+
+Stores, per edition date, the normalized URLs, titles and MinHash signatures
+of published articles in .cache/history_index.json. generate_edition.py
+updates it incrementally when it writes a manifest entry; collect.py syncs it
+against the recent editions of the manifest store (recomputing only entries
+that changed) and queries it for cross-edition dedup.
+"""
+
+import json
+import os
+from difflib import SequenceMatcher
+
+from log_utils import setup_logging, CACHE_DIR
+from deduplicate import normalize_url
+from similarity import LSHIndex, minhash
+
+logger = setup_logging("history_index")
+
+INDEX_PATH = CACHE_DIR / "history_index.json"
+INDEX_VERSION = 1
+
+
+def _build_entry(manifest_entry):
+    titles = list(manifest_entry.get("titles", []))
+    return {
+        "urls": sorted({normalize_url(u) for u in manifest_entry.get("urls", []) if u}),
+        "titles": titles,
+        "signatures": [list(minhash(t)) for t in titles],
+    }
+
+
+def load_index():
+    """Return {date: entry} from disk, or {} if missing/incompatible."""
+    if not INDEX_PATH.exists():
+        return {}
+    try:
+        with open(INDEX_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"[WARN] Could not read history index, rebuilding: {e}")
+        return {}
+    if data.get("version") != INDEX_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def save_index(entries):
+    """Write the index atomically."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = INDEX_PATH.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": INDEX_VERSION, "entries": entries}, f, ensure_ascii=False)
+    os.replace(tmp, INDEX_PATH)
+
+
+def update_entry(manifest_entry):
+    """Insert or replace one edition (called when a manifest entry is written)."""
+    entries = load_index()
+    entries[manifest_entry["date"]] = _build_entry(manifest_entry)
+    try:
+        save_index(entries)
+    except OSError as e:
+        logger.warning(f"[WARN] Could not update history index: {e}")
+
+
+def sync_index(manifest):
+    """Bring the index in line with manifest entries, recomputing only what changed."""
+    entries = load_index()
+    changed = False
+    manifest_dates = set()
+    for m in manifest:
+        date = m.get("date", "")
+        if not date:
+            continue
+        manifest_dates.add(date)
+        cached = entries.get(date)
+        if cached is None or cached["titles"] != list(m.get("titles", [])):
+            entries[date] = _build_entry(m)
+            changed = True
+        elif cached["urls"] != sorted({normalize_url(u) for u in m.get("urls", []) if u}):
+            cached["urls"] = sorted({normalize_url(u) for u in m.get("urls", []) if u})
+            changed = True
+    for date in set(entries) - manifest_dates:
+        del entries[date]
+        changed = True
+    if changed:
+        try:
+            save_index(entries)
+        except OSError as e:
+            logger.warning(f"[WARN] Could not save history index: {e}")
+    return entries
+
+
+class HistoryMatcher:
+    """Answers "was this URL/title already published?" for a set of dates."""
+
+    def __init__(self, entries, dates, title_threshold):
+        self.title_threshold = title_threshold
+        self.urls = set()
+        self.titles = []
+        self._lsh = LSHIndex()
+        for date in dates:
+            entry = entries.get(date)
+            if not entry:
+                continue
+            self.urls.update(entry["urls"])
+            for title, sig in zip(entry["titles"], entry["signatures"]):
+                self._lsh.add(len(self.titles), sig)
+                self.titles.append(title.lower())
+
+    def __bool__(self):
+        return bool(self.urls or self.titles)
+
+    def has_url(self, url):
+        return normalize_url(url) in self.urls
+
+    def has_similar_title(self, title):
+        lowered = title.lower()
+        return any(
+            SequenceMatcher(None, lowered, self.titles[pos]).ratio() >= self.title_threshold
+            for pos in self._lsh.query(minhash(title))
+        )
@@ -0,0 +1,157 @@
+"""Content-addressed store of generated LinkedIn images, keyed by (model, prompt).
+
+Each entry is .cache/images/<sha256>.png (raw API bytes, before the text
+overlay) plus <sha256>.json metadata (model, prompt, duration, timestamp,
+size). A repeated (model, prompt) pair is served from disk instead of calling
+the paid Gemini/Imagen API again, and the dashboard lists past generations.
+When the store exceeds its budget, least recently used entries are evicted.
+
+Settings come from linkedin.image_cache in revue-presse.yaml:
+
+    image_cache:
+      enabled: true
+      max_mb: 200
+
+RP_NO_IMAGE_CACHE=1 disables lookups (new images are still recorded).
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+
+from log_utils import setup_logging, CACHE_DIR
+
+logger = setup_logging("image_store")
+
+IMAGE_STORE_DIR = CACHE_DIR / "images"
+DEFAULT_MAX_MB = 200
+KEY_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def image_key(model, prompt):
+    """Return the sha256 hex key of a (model id, prompt) pair."""
+    return hashlib.sha256(f"{model}\0{prompt.strip()}".encode("utf-8")).hexdigest()
+
+
+class ImageStore:
+    """Raw image bytes + metadata on disk, LRU-evicted above max_mb."""
+
+    def __init__(self, directory=IMAGE_STORE_DIR, max_mb=DEFAULT_MAX_MB, lookup=True):
+        self.directory = directory
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.lookup = lookup
+
+    def _paths(self, key):
+        return self.directory / f"{key}.png", self.directory / f"{key}.json"
+
+    def meta(self, key):
+        """Return the metadata of an entry, or None."""
+        if not KEY_RE.match(key):
+            return None
+        _, meta_path = self._paths(key)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def read(self, key, touch=True):
+        """Return (bytes, metadata) of an entry, or None.
+
+        touch marks the entry recently used (LRU eviction); display-only reads
+        such as the dashboard gallery pass touch=False.
+        """
+        meta = self.meta(key)
+        if meta is None:
+            return None
+        image_path, _ = self._paths(key)
+        try:
+            data = image_path.read_bytes()
+            if touch:
+                os.utime(image_path)  # mtime = last access, used for LRU eviction
+        except OSError:
+            return None
+        return data, meta
+
+    def get(self, model, prompt):
+        """Return (bytes, metadata) for a (model, prompt) already generated, or None."""
+        if not self.lookup:
+            return None
+        key = image_key(model, prompt)
+        hit = self.read(key)
+        if hit is not None:
+            logger.info(f"[CACHE] Image cache hit {key[:12]} ({model})")
+        return hit
+
+    def put(self, model, prompt, data, duration_s=None):
+        """Record a generated image; returns its metadata."""
+        key = image_key(model, prompt)
+        meta = {
+            "key": key,
+            "model": model,
+            "prompt": prompt.strip(),
+            "duration_s": duration_s,
+            "created": time.time(),
+            "bytes": len(data),
+        }
+        image_path, meta_path = self._paths(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for path, payload in ((image_path, data),
+                                  (meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))):
+                tmp = path.with_suffix(path.suffix + ".tmp")
+                tmp.write_bytes(payload)
+                os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"[WARN] Could not store image {key[:12]}: {e}")
+            return meta
+        self.evict()
+        return meta
+
+    def list(self):
+        """Return metadata of all entries, newest first."""
+        if not self.directory.exists():
+            return []
+        entries = []
+        for meta_path in self.directory.glob("*.json"):
+            meta = self.meta(meta_path.stem)
+            if meta is not None and self._paths(meta_path.stem)[0].exists():
+                entries.append(meta)
+        return sorted(entries, key=lambda m: m.get("created", 0), reverse=True)
+
+    def evict(self):
+        """Remove least recently used entries until the store fits in max_mb."""
+        if not self.directory.exists():
+            return
+        files = []
+        for image_path in self.directory.glob("*.png"):
+            try:
+                st = image_path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, image_path))
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for _, size, image_path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            for path in (image_path, image_path.with_suffix(".json")):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"[WARN] Could not evict {path.name}: {e}")
+            total -= size
+            removed += 1
+        if removed:
+            logger.debug(f"Image store: evicted {removed} entries ({total} bytes left)")
+
+
+def from_config(config):
+    """Build the store from linkedin.image_cache; RP_NO_IMAGE_CACHE=1 disables lookups."""
+    settings = config.get("linkedin", {}).get("image_cache", {}) or {}
+    lookup = settings.get("enabled", True) and os.environ.get("RP_NO_IMAGE_CACHE") != "1"
+    return ImageStore(max_mb=settings.get("max_mb", DEFAULT_MAX_MB), lookup=lookup)
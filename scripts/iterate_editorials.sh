@@ -4,6 +4,7 @@
 # Usage:
 #   bash scripts/iterate_editorials.sh                          # Collect + 3 variants
 #   bash scripts/iterate_editorials.sh --skip-collect --styles=deep
+#   bash scripts/iterate_editorials.sh --from-run=latest --styles=deep,angle
 #   bash scripts/iterate_editorials.sh --tomorrow --styles=deep,angle
 #   bash scripts/iterate_editorials.sh --tomorrow --no-deploy --no-linkedin
 #
@@ -29,6 +30,9 @@ Options:
                          Styles disponibles : deep, angle, focused
   --skip-collect         Reutiliser .pipeline/01_candidates.json existant
                          (saute les Phases 0+1)
+  --from-run=<run_id>    Restaure les candidats d'un run precedent
+                         (.pipeline/runs/, "latest" = le plus recent)
+                         puis saute les Phases 0+1
   --tomorrow             Date d'edition = demain (propage RP_EDITION_DATE)
   --date=YYYY-MM-DD      Force la date d'edition (propage RP_EDITION_DATE)
   --prompt-version=v     Version du prompt : v1 ou v2 (default: config)
@@ -46,18 +50,24 @@ Exemples:
   # Regener une seule variante sans recolleter
   bash scripts/iterate_editorials.sh --skip-collect --styles=deep
 
+  # Variantes a partir des candidats d'un run precedent
+  bash scripts/iterate_editorials.sh --from-run=latest --styles=deep,angle
+
   # Deux variantes avec prompt v2
   bash scripts/iterate_editorials.sh --styles=deep,angle --prompt-version=v2
 
 Workflow:
   1. Phases 0+1 : WebSearch + RSS + dedup + rank → 01_candidates.json
+                  (reutilises s'ils sont a jour, voir scripts/phase_graph.py)
   2. Phase 2    : Pour chaque style, genere une variante editoriale
                   → .pipeline/variants/editorial_{style}.json
   3. Resume     : Affiche titre, extrait et articles de chaque variante
   4. Choix      : Selection interactive de la variante a retenir
   5. Phase 3    : Generation HTML a partir de la variante choisie
-  6. Phase 3b   : Post LinkedIn (sauf --no-linkedin)
+  6. Phase 3b   : Post LinkedIn, en parallele de la Phase 3 (sauf --no-linkedin)
   7. Phase 4    : Deploy gh-pages (sauf --no-deploy)
+  Les artefacts sont archives dans .pipeline/runs/<run_id>/ en fin de script
+  (voir scripts/artifact_store.py list).
 HELP
   exit 0
 }
@@ -65,6 +75,7 @@ HELP
 # ── Defaults ──
 STYLES="deep,angle,focused"
 SKIP_COLLECT=false
+FROM_RUN=""
 EDITION_DATE=""
 PROMPT_VERSION=""
 LINKEDIN=true
@@ -75,6 +86,7 @@ for arg in "$@"; do
   case "$arg" in
     --styles=*)        STYLES="${arg#*=}" ;;
     --skip-collect)    SKIP_COLLECT=true ;;
+    --from-run=*)      FROM_RUN="${arg#*=}"; SKIP_COLLECT=true ;;
     --tomorrow)        EDITION_DATE=$(date -v+1d '+%Y-%m-%d') ;;
     --date=*)          EDITION_DATE="${arg#*=}" ;;
     --prompt-version=*) PROMPT_VERSION="${arg#*=}" ;;
@@ -102,8 +114,17 @@ if [ -n "$PROMPT_VERSION" ]; then
 fi
 echo "=========================================="
 
-# ── Phase 0+1: Collect candidates (unless --skip-collect) ──
-if [ "$SKIP_COLLECT" = true ]; then
+# Snapshot this run's artifacts on exit into .pipeline/runs
+mkdir -p "$PIPELINE_DIR"
+trap 'python3 "$SCRIPT_DIR/artifact_store.py" snapshot --label iterate_editorials || echo "[WARN] Run snapshot failed"' EXIT
+
+# ── Phase 0+1: Collect candidates (unless --skip-collect / --from-run) ──
+if [ -n "$FROM_RUN" ]; then
+  echo ""
+  echo "── Phases 0+1: Restored from run $FROM_RUN ──"
+  python3 "$SCRIPT_DIR/artifact_store.py" restore "$FROM_RUN" --start-at editorial
+  echo "[OK] Using 01_candidates.json of run $FROM_RUN"
+elif [ "$SKIP_COLLECT" = true ]; then
   echo ""
   echo "── Phases 0+1: Skipped (--skip-collect) ──"
   if [ ! -f "$PIPELINE_DIR/01_candidates.json" ]; then
@@ -112,22 +133,8 @@ if [ "$SKIP_COLLECT" = true ]; then
   fi
   echo "[OK] Using existing 01_candidates.json"
 else
-  rm -rf "$PIPELINE_DIR"
-  mkdir -p "$PIPELINE_DIR"
-
-  echo ""
-  echo "── Phase 0: WebSearch ──"
-  if python3 "$SCRIPT_DIR/websearch_collect.py"; then
-    echo "[OK] Phase 0 complete"
-  else
-    echo "[WARN] Phase 0 failed, continuing with RSS only"
-  fi
-
-  echo ""
-  echo "── Phase 1: Collect (RSS + dedup + rank) ──"
-  python3 "$SCRIPT_DIR/collect.py"
-  python3 "$SCRIPT_DIR/validate.py" "$PIPELINE_DIR/01_candidates.json" --phase candidates
-  echo "[OK] Phase 1 complete"
+  # WebSearch + RSS + dedup + rank, skipped if already up to date (phase_graph.py)
+  python3 "$SCRIPT_DIR/phase_graph.py" run --targets collect
 fi
 
 # ── Generate editorial variants ──
@@ -139,9 +146,9 @@ GENERATED=()
 for style in "${STYLE_LIST[@]}"; do
   echo ""
   echo "── Phase 2: Editorial variant [$style] ──"
-  if EDITO_STYLE="$style" PROMPT_VERSION="${PROMPT_VERSION}" python3 "$SCRIPT_DIR/write_editorial.py"; then
-    python3 "$SCRIPT_DIR/validate.py" "$PIPELINE_DIR/02_editorial.json" --phase editorial
-    cp "$PIPELINE_DIR/02_editorial.json" "$VARIANTS_DIR/editorial_${style}.json"
+  if EDITO_STYLE="$style" PROMPT_VERSION="${PROMPT_VERSION}" python3 "$SCRIPT_DIR/write_editorial.py" \
+      --output "$VARIANTS_DIR/editorial_${style}.json"; then
+    python3 "$SCRIPT_DIR/validate.py" "$VARIANTS_DIR/editorial_${style}.json" --phase editorial
     GENERATED+=("$style")
     echo "[OK] Variant '$style' saved"
   else
@@ -201,37 +208,20 @@ else
   done
 fi
 
-# ── Generate HTML from chosen variant ──
+# ── Generate HTML (+ LinkedIn in parallel, then deploy) from chosen variant ──
 echo ""
-echo "── Phase 3: Generate HTML (variant: $CHOICE) ──"
+echo "── Variante retenue : $CHOICE ──"
 cp "$VARIANTS_DIR/editorial_${CHOICE}.json" "$PIPELINE_DIR/02_editorial.json"
-python3 "$SCRIPT_DIR/generate_edition.py" "$PIPELINE_DIR/02_editorial.json"
-echo "[OK] Phase 3 complete"
-
-# ── Phase 3b: LinkedIn post ──
-if [ "$LINKEDIN" = true ]; then
-  echo ""
-  echo "── Phase 3b: LinkedIn post ──"
-  if python3 "$SCRIPT_DIR/linkedin_post.py"; then
-    echo "[OK] Phase 3b complete"
-  else
-    echo "[WARN] Phase 3b failed (LinkedIn), continuing"
-  fi
-else
-  echo ""
+SKIP=""
+if [ "$LINKEDIN" = false ]; then
+  SKIP="linkedin"
   echo "── Phase 3b: LinkedIn (skipped: --no-linkedin) ──"
 fi
-
-# ── Phase 4: Deploy ──
-if [ "$DEPLOY" = true ]; then
-  echo ""
-  echo "── Phase 4: Deploy ──"
-  python3 "$SCRIPT_DIR/deploy.py"
-  echo "[OK] Phase 4 complete"
-else
-  echo ""
+if [ "$DEPLOY" = false ]; then
+  SKIP="${SKIP:+$SKIP,}deploy"
   echo "── Phase 4: Deploy (skipped: --no-deploy) ──"
 fi
+python3 "$SCRIPT_DIR/phase_graph.py" run --start-at html ${SKIP:+--skip "$SKIP"}
 
 echo ""
 echo "=========================================="
@@ -0,0 +1,113 @@
+"""Compiled multi-keyword matcher shared by the AI filter, topic tagging and breaking detection.
+
+All keywords (topics from revue-presse.yaml, generic AI terms, breaking-news
+terms) are compiled once into a single trie-shaped regex. One scan of a text
+returns every keyword it contains, with the same semantics as
+``kw.lower() in text.lower()`` (overlapping and nested keywords included).
+Results are memoized per text, so collect.py and rank_articles.py share the
+scan of an article's title + summary.
+"""
+
+import re
+from functools import lru_cache
+
+AI_GROUP = "__ai__"
+BREAKING_GROUP = "__breaking__"
+
+# Termes generiques de filet de securite pour le filtre IA
+AI_GENERIC_KEYWORDS = ["artificial intelligence", "machine learning", "ml", "a.i."]
+
+BREAKING_KEYWORDS = [
+    "breaking", "urgent", "just in", "exclusive", "major",
+    "announces", "launches", "acquires", "shuts down", "breach",
+    "zero-day", "critical vulnerability", "recall",
+]
+
+_TEXT_CACHE_SIZE = 8192
+
+
+def _trie_pattern(words):
+    """Build a regex alternation factored by common prefixes (longest first)."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Optional continuation: the regex engine tries the longer keyword first
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Match groups of keywords against texts in a single pass."""
+
+    def __init__(self, groups):
+        self.groups = {name: [kw.lower() for kw in kws] for name, kws in groups.items()}
+        vocabulary = sorted({kw for kws in self.groups.values() for kw in kws if kw})
+        # A lookahead at every position reports the longest keyword starting
+        # there; shorter keywords starting at the same position are its prefixes.
+        self._regex = re.compile(f"(?=({_trie_pattern(vocabulary)}))") if vocabulary else None
+        self._prefixes = {
+            kw: [other for other in vocabulary if other != kw and kw.startswith(other)]
+            for kw in vocabulary
+        }
+        self.find = lru_cache(maxsize=_TEXT_CACHE_SIZE)(self._find)
+
+    def _find(self, text):
+        """Return the frozenset of keywords contained in text (case-insensitive)."""
+        if self._regex is None:
+            return frozenset()
+        found = set()
+        for m in self._regex.finditer(text.lower()):
+            kw = m.group(1)
+            if kw and kw not in found:
+                found.add(kw)
+                found.update(self._prefixes[kw])
+        return frozenset(found)
+
+    def match(self, text):
+        """Return {group: [keywords of the group found in text]} (config order)."""
+        found = self.find(text)
+        return {name: [kw for kw in kws if kw in found] for name, kws in self.groups.items()}
+
+    def hits(self, text, group):
+        """Return the keywords of one group found in text."""
+        found = self.find(text)
+        return [kw for kw in self.groups[group] if kw in found]
+
+
+def ai_keywords(config):
+    """Return all lowercase AI keywords: topic keywords + generic terms."""
+    keywords = set()
+    for topic in config.get("topics", []):
+        for kw in topic.get("keywords", []):
+            keywords.add(kw.lower())
+    keywords.update(AI_GENERIC_KEYWORDS)
+    return keywords
+
+
+_matchers = {}
+
+
+def get_matcher(config):
+    """Return the matcher for a config, compiled once per distinct keyword set.
+
+    Groups: one per topic tag, plus AI_GROUP (AI keywords longer than two
+    characters; short ones need word boundaries) and BREAKING_GROUP.
+    """
+    groups = {t["tag"]: list(t.get("keywords", [])) for t in config.get("topics", [])}
+    groups[AI_GROUP] = sorted(kw for kw in ai_keywords(config) if len(kw) > 2)
+    groups[BREAKING_GROUP] = list(BREAKING_KEYWORDS)
+    key = tuple((name, tuple(kws)) for name, kws in groups.items())
+    matcher = _matchers.get(key)
+    if matcher is None:
+        matcher = _matchers[key] = KeywordMatcher(groups)
+    return matcher
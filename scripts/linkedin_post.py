@@ -13,10 +13,12 @@ import json
 import os
 import subprocess
 import sys
+import time
 from pathlib import Path
 
-from PIL import Image, ImageDraw, ImageFont
-
+import image_overlay
+import image_store
+from manifest_store import ManifestStore
 from log_utils import setup_logging, load_config, PROJECT_DIR, PIPELINE_DIR
 
 # Handle --debug before logger init
@@ -29,24 +31,15 @@ logger = setup_logging("linkedin")
 LINKEDIN_DIR = PIPELINE_DIR / "linkedin"
 PROMPT_PATH = PROJECT_DIR / "scripts" / "prompts" / "linkedin.md"
 EDITORIAL_PATH = PIPELINE_DIR / "02_editorial.json"
+IMAGE_MODEL = "gemini-3-pro-image-preview"
 MAX_ATTEMPTS = 2
 
 
 def get_edition_number(archives_dir):
-    """Derive edition number from manifest.json history (resilient to HTML deletion)."""
-    manifest = archives_dir / "manifest.json"
-    if manifest.exists():
-        import json
-        with open(manifest, encoding="utf-8") as f:
-            entries = json.load(f)
-        if entries:
-            from datetime import datetime
-            unique_days = set(e.get("date", "") for e in entries)
-            today = os.environ.get("RP_EDITION_DATE") or datetime.now().strftime("%Y-%m-%d")
-            if today in unique_days:
-                return len(unique_days)
-            return len(unique_days) + 1
-    return 1
+    """Derive edition number from the manifest store (resilient to HTML deletion)."""
+    from datetime import datetime
+    today = os.environ.get("RP_EDITION_DATE") or datetime.now().strftime("%Y-%m-%d")
+    return ManifestStore(archives_dir).edition_number(today)
 
 
 def build_post(synthesis, hashtags):
@@ -111,8 +104,20 @@ def validate_image_prompt(text):
     return errors
 
 
-def generate_image(prompt, output_path):
-    """Generate image via Gemini Pro (generate_content API). Tolerant."""
+def generate_image(prompt, output_path, store=None):
+    """Generate image via Gemini Pro (generate_content API). Tolerant.
+
+    With an image store, a prompt already generated is served from it and new
+    images are recorded in it.
+    """
+    if store is not None:
+        hit = store.get(IMAGE_MODEL, prompt)
+        if hit is not None:
+            with open(output_path, "wb") as f:
+                f.write(hit[0])
+            logger.info(f"[LINKEDIN] Image reused from cache ({IMAGE_MODEL}): {output_path}")
+            return True
+
     api_key = os.environ.get("GOOGLE_API_KEY")
     if not api_key:
         logger.warning("[WARN] GOOGLE_API_KEY not set, skipping image generation")
@@ -122,8 +127,9 @@ def generate_image(prompt, output_path):
         from google.genai import types
 
         client = genai.Client(api_key=api_key)
+        start = time.time()
         response = client.models.generate_content(
-            model="gemini-3-pro-image-preview",
+            model=IMAGE_MODEL,
             contents=prompt,
             config=types.GenerateContentConfig(
                 response_modalities=["IMAGE", "TEXT"],
@@ -133,6 +139,8 @@ def generate_image(prompt, output_path):
             if part.inline_data and part.inline_data.mime_type.startswith("image/"):
                 with open(output_path, "wb") as f:
                     f.write(part.inline_data.data)
+                if store is not None:
+                    store.put(IMAGE_MODEL, prompt, part.inline_data.data, round(time.time() - start, 2))
                 logger.info(f"[LINKEDIN] Image generated (gemini-3-pro): {output_path}")
                 return True
         logger.warning("[WARN] No image returned by API")
@@ -144,112 +152,7 @@ def generate_image(prompt, output_path):
 
 def overlay_text_on_image(image_path, edition_title, edition_number, subtitle):
     """Overlay title + subtitle on image using Pillow. Guarantees perfect text."""
-    TARGET_W, TARGET_H = 1200, 627
-    BANNER_COLOR = (26, 26, 26)  # #1A1A1A
-    BANNER_OPACITY = int(255 * 0.78)
-    ACCENT_COLOR = (230, 57, 70)  # #E63946
-    ACCENT_HEIGHT = 4
-    MARGIN_TOP = 70  # safe-zone LinkedIn
-    PADDING_H = 60  # horizontal padding inside banner
-    PADDING_V = 20  # vertical padding inside banner
-
-    import platform
-
-    img = Image.open(image_path).convert("RGBA")
-
-    # Resize to target dimensions
-    if img.size != (TARGET_W, TARGET_H):
-        img = img.resize((TARGET_W, TARGET_H), Image.LANCZOS)
-
-    # Load fonts with platform-aware fallback
-    if platform.system() == "Darwin":
-        title_candidates = [
-            ("/System/Library/Fonts/LucidaGrande.ttc", 52, 0),
-            ("/System/Library/Fonts/Supplemental/Arial Bold.ttf", 52, None),
-        ]
-        subtitle_candidates = [
-            ("/System/Library/Fonts/HelveticaNeue.ttc", 26, 0),
-        ]
-    else:
-        import os
-        fonts_dir = os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts")
-        title_candidates = [
-            (os.path.join(fonts_dir, "arialbd.ttf"), 52, None),
-            (os.path.join(fonts_dir, "segoeui.ttf"), 52, None),
-        ]
-        subtitle_candidates = [
-            (os.path.join(fonts_dir, "arial.ttf"), 26, None),
-            (os.path.join(fonts_dir, "segoeui.ttf"), 26, None),
-        ]
-
-    font_title = None
-    for path, size, idx in title_candidates:
-        try:
-            font_title = ImageFont.truetype(path, size, index=idx or 0) if idx is not None else ImageFont.truetype(path, size)
-            break
-        except (OSError, IndexError):
-            continue
-    if font_title is None:
-        font_title = ImageFont.load_default()
-
-    font_subtitle = None
-    for path, size, idx in subtitle_candidates:
-        try:
-            font_subtitle = ImageFont.truetype(path, size, index=idx or 0) if idx is not None else ImageFont.truetype(path, size)
-            break
-        except (OSError, IndexError):
-            continue
-    if font_subtitle is None:
-        font_subtitle = ImageFont.load_default()
-
-    # Compose title line: "IA qu'à demander N°2"
-    title_text = f"{edition_title} N\u00b0{edition_number}"
-
-    # Truncate subtitle if too long
-    max_subtitle_w = TARGET_W - 2 * PADDING_H
-    if font_subtitle.getlength(subtitle) > max_subtitle_w:
-        while font_subtitle.getlength(subtitle + "\u2026") > max_subtitle_w and len(subtitle) > 10:
-            subtitle = subtitle[:-1].rstrip()
-        subtitle = subtitle + "\u2026"
-
-    # Measure text
-    title_bbox = font_title.getbbox(title_text)
-    title_h = title_bbox[3] - title_bbox[1]
-    subtitle_bbox = font_subtitle.getbbox(subtitle)
-    subtitle_h = subtitle_bbox[3] - subtitle_bbox[1]
-
-    # Banner dimensions
-    banner_top = MARGIN_TOP
-    banner_height = PADDING_V + title_h + 12 + subtitle_h + PADDING_V
-    banner_bottom = banner_top + banner_height
-
-    # Draw semi-transparent banner
-    overlay = Image.new("RGBA", (TARGET_W, TARGET_H), (0, 0, 0, 0))
-    draw_overlay = ImageDraw.Draw(overlay)
-    draw_overlay.rectangle(
-        [(0, banner_top), (TARGET_W, banner_bottom)],
-        fill=(*BANNER_COLOR, BANNER_OPACITY),
-    )
-    # Accent bar below banner
-    draw_overlay.rectangle(
-        [(0, banner_bottom), (TARGET_W, banner_bottom + ACCENT_HEIGHT)],
-        fill=(*ACCENT_COLOR, 255),
-    )
-    img = Image.alpha_composite(img, overlay)
-
-    # Draw text (centered horizontally)
-    draw = ImageDraw.Draw(img)
-    text_y = banner_top + PADDING_V
-    title_w = font_title.getlength(title_text)
-    title_x = (TARGET_W - title_w) / 2
-    draw.text((title_x, text_y), title_text, font=font_title, fill=(255, 255, 255, 255))
-    text_y += title_h + 12
-    subtitle_w = font_subtitle.getlength(subtitle)
-    subtitle_x = (TARGET_W - subtitle_w) / 2
-    draw.text((subtitle_x, text_y), subtitle, font=font_subtitle, fill=(255, 255, 255, 210))
-
-    # Save as RGB PNG
-    img.convert("RGB").save(image_path, "PNG")
+    image_overlay.overlay_text_on_image(image_path, edition_title, edition_number, subtitle)
     logger.info(f"[LINKEDIN] Text overlay applied: {image_path}")
 
 
@@ -264,6 +167,8 @@ def copy_to_clipboard(text):
 
 def main():
     image_only = "--image-only" in sys.argv
+    if "--no-image-cache" in sys.argv:
+        os.environ["RP_NO_IMAGE_CACHE"] = "1"
 
     # --editorial <path>: use a specific editorial JSON instead of .pipeline/02_editorial.json
     editorial_override = None
@@ -283,6 +188,7 @@ def main():
 
     config = load_config()
     claude_timeout = config.get("edition", {}).get("timeouts", {}).get("linkedin", 120)
+    images = image_store.from_config(config)
 
     # Check if LinkedIn is enabled
     linkedin_config = config.get("linkedin", {})
@@ -305,7 +211,7 @@ def main():
         edition_title = config.get("edition", {}).get("title", "IA qu'a demander")
 
         image_path = LINKEDIN_DIR / "image.png"
-        if not generate_image(image_prompt, image_path):
+        if not generate_image(image_prompt, image_path, images):
             logger.error("[ERROR] Image generation failed")
             sys.exit(1)
 
@@ -434,7 +340,7 @@ def main():
     image_generated = False
     if image_prompt:
         image_path = LINKEDIN_DIR / "image.png"
-        image_generated = generate_image(image_prompt, image_path)
+        image_generated = generate_image(image_prompt, image_path, images)
 
         if image_generated:
             # Save raw API image before Pillow overlay (debug)
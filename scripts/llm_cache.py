@@ -0,0 +1,155 @@
+"""Content-addressed on-disk cache for claude -p responses.
+
+Entries live in .cache/llm/<sha256>.json, keyed by a hash of the full
+command line (model + flags) and the prompt, so any change to either misses.
+Expired entries (TTL) are dropped on read; when the directory exceeds its
+size budget, the least recently used entries are evicted.
+
+Settings come from edition.llm_cache in revue-presse.yaml:
+
+    llm_cache:
+      enabled: true
+      ttl_hours: 72
+      max_mb: 50
+
+RP_NO_LLM_CACHE=1 bypasses the cache (no read, no write).
+"""
+
+import hashlib
+import json
+import os
+import time
+
+from log_utils import setup_logging, CACHE_DIR
+
+logger = setup_logging("llm_cache")
+
+LLM_CACHE_DIR = CACHE_DIR / "llm"
+DEFAULT_TTL_HOURS = 72
+DEFAULT_MAX_MB = 50
+
+
+def cache_key(cmd, prompt):
+    """Return the sha256 hex key of a command line (list of args) and a prompt."""
+    h = hashlib.sha256()
+    h.update(json.dumps(list(cmd), ensure_ascii=False).encode("utf-8"))
+    h.update(b"\0")
+    h.update(prompt.encode("utf-8"))
+    return h.hexdigest()
+
+
+class LLMCache:
+    """TTL + size-bounded response store. Disabled instances never hit nor store."""
+
+    def __init__(self, directory=LLM_CACHE_DIR, ttl_hours=DEFAULT_TTL_HOURS,
+                 max_mb=DEFAULT_MAX_MB, enabled=True):
+        self.directory = directory
+        self.ttl = ttl_hours * 3600
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return self.directory / f"{key}.json"
+
+    def get(self, key):
+        """Return the cached response for key, or None (miss, expired or disabled)."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"[WARN] Unreadable LLM cache entry {key[:12]}, ignoring: {e}")
+            self.discard(key)
+            self.misses += 1
+            return None
+
+        age = time.time() - entry.get("created", 0)
+        if age > self.ttl:
+            logger.debug(f"LLM cache entry {key[:12]} expired ({age / 3600:.1f}h old)")
+            self.discard(key)
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(path)  # mtime = last access, used for LRU eviction
+        except OSError:
+            pass
+        self.hits += 1
+        logger.info(f"[CACHE] LLM cache hit {key[:12]} ({age / 60:.0f} min old)")
+        return entry["response"]
+
+    def put(self, key, response, **meta):
+        """Store a response (atomic write), then enforce the size budget."""
+        if not self.enabled:
+            return
+        entry = {"created": time.time(), "response": response, **meta}
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = self._path(key).with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp, self._path(key))
+        except OSError as e:
+            logger.warning(f"[WARN] Could not write LLM cache entry: {e}")
+            return
+        logger.debug(f"LLM cache store {key[:12]} ({len(response)} chars)")
+        self.evict()
+
+    def discard(self, key):
+        """Remove one entry (e.g. a cached response that failed validation)."""
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"[WARN] Could not remove LLM cache entry {key[:12]}: {e}")
+
+    def evict(self):
+        """Drop expired entries, then least recently used ones until under max_mb."""
+        if not self.directory.exists():
+            return
+        now = time.time()
+        files = []
+        for path in self.directory.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for mtime, size, path in sorted(files):
+            # mtime >= created, so an entry not touched for ttl is surely expired
+            if now - mtime <= self.ttl and total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        if removed:
+            logger.debug(f"LLM cache: evicted {removed} entries ({total} bytes left)")
+
+    def summary(self):
+        return f"{self.hits} hit(s), {self.misses} miss(es)"
+
+
+def from_config(config, enabled=True):
+    """Build the cache from edition.llm_cache; RP_NO_LLM_CACHE=1 disables it."""
+    settings = config.get("edition", {}).get("llm_cache", {}) or {}
+    if os.environ.get("RP_NO_LLM_CACHE") == "1" or not settings.get("enabled", True):
+        enabled = False
+    return LLMCache(
+        ttl_hours=settings.get("ttl_hours", DEFAULT_TTL_HOURS),
+        max_mb=settings.get("max_mb", DEFAULT_MAX_MB),
+        enabled=enabled,
+    )
@@ -11,6 +11,7 @@ import yaml
 
 PROJECT_DIR = Path(__file__).resolve().parent.parent
 PIPELINE_DIR = PROJECT_DIR / ".pipeline"
+CACHE_DIR = PROJECT_DIR / ".cache"  # survives the rm -rf .pipeline of the bash runners
 SCRIPTS_DIR = PROJECT_DIR / "scripts"
 CONFIG_DIR = PROJECT_DIR / "config"
 
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""SQLite store of published editions (editions/archives/manifest.db).
+
+One row per edition date in `editions`, its published URLs (with their
+normalized form) in `urls` and its article titles in `titles`; `urls` is
+indexed on the normalized URL and every table on the date, so edition numbers,
+recent-history lookups and URL dedup are single indexed queries instead of a
+load of the whole manifest.json.
+
+manifest.json is now an export of the store (same format as before, newest
+first), written by generate_edition.py for gh-pages and the tools that read
+it. A new store is filled once from the existing manifest.json, preferring for
+each date the entry of the manifest.<timestamp>.json snapshot that matches the
+day's latest archive (the merge deploy.py used to redo on every deploy).
+
+Usage:
+    python3 scripts/manifest_store.py export [--output PATH]
+    python3 scripts/manifest_store.py import <manifest.json>
+    python3 scripts/manifest_store.py number [--date YYYY-MM-DD]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from deduplicate import normalize_url
+from log_utils import setup_logging, PROJECT_DIR
+
+logger = setup_logging("manifest_store")
+
+ARCHIVES_DIR = PROJECT_DIR / "editions" / "archives"
+DB_NAME = "manifest.db"
+SCHEMA_VERSION = 1
+SQL_MAX_VARIABLES = 500  # per IN (...) query, below SQLite's limit
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS editions (
+    date TEXT PRIMARY KEY,
+    number INTEGER,
+    title TEXT NOT NULL DEFAULT '',
+    archive TEXT,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS urls (
+    date TEXT NOT NULL REFERENCES editions(date) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    normalized TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_urls_normalized ON urls(normalized);
+CREATE INDEX IF NOT EXISTS idx_urls_date ON urls(date);
+CREATE TABLE IF NOT EXISTS titles (
+    date TEXT NOT NULL REFERENCES editions(date) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_titles_date ON titles(date);
+"""
+
+
+class ManifestStore:
+    """Published editions of an archives directory, backed by SQLite."""
+
+    def __init__(self, archives_dir=ARCHIVES_DIR):
+        self.archives_dir = archives_dir
+        self.path = archives_dir / DB_NAME
+        archives_dir.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            if db.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                db.executescript(SCHEMA)
+                self._migrate(db)
+                db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @contextmanager
+    def _connect(self):
+        """Connection for one transaction (committed on success), closed afterwards."""
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            db.execute("PRAGMA foreign_keys = ON")
+            db.execute("PRAGMA journal_mode = WAL")
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def _migrate(self, db):
+        """Fill a new store from manifest.json and the per-generation snapshots."""
+        manifest_path = self.archives_dir / "manifest.json"
+        if not manifest_path.exists():
+            return
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                by_date = {e["date"]: e for e in json.load(f) if e.get("date")}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"[WARN] Could not migrate {manifest_path}: {e}")
+            return
+
+        # Latest archive of each day, and the entry of its matching snapshot
+        latest = {}
+        for f in self.archives_dir.glob("????-??-??.??????.html"):
+            date = f.name.split(".")[0]
+            if date not in latest or f.name > latest[date]:
+                latest[date] = f.name
+        for date, name in latest.items():
+            snapshot = self.archives_dir / f"manifest.{name[:-len('.html')]}.json"
+            if not snapshot.exists():
+                continue
+            try:
+                with open(snapshot, encoding="utf-8") as f:
+                    entry = next((e for e in json.load(f) if e.get("date") == date), None)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if entry is not None:
+                by_date[date] = entry
+
+        for date, entry in by_date.items():
+            self._upsert(db, entry, latest.get(date))
+        logger.info(f"[MANIFEST] Migrated {len(by_date)} edition(s) from {manifest_path}")
+
+    @staticmethod
+    def _upsert(db, entry, archive):
+        date = entry["date"]
+        db.execute("DELETE FROM editions WHERE date = ?", (date,))
+        db.execute(
+            "INSERT INTO editions (date, number, title, archive, updated) VALUES (?, ?, ?, ?, ?)",
+            (date, entry.get("number"), entry.get("title", ""), archive, time.time()),
+        )
+        db.executemany(
+            "INSERT INTO urls (date, position, url, normalized) VALUES (?, ?, ?, ?)",
+            [(date, i, url, normalize_url(url)) for i, url in enumerate(entry.get("urls", []))],
+        )
+        db.executemany(
+            "INSERT INTO titles (date, position, title) VALUES (?, ?, ?)",
+            [(date, i, title) for i, title in enumerate(entry.get("titles", []))],
+        )
+
+    def upsert(self, entry, archive=None):
+        """Insert or replace the edition of entry["date"] (manifest.json entry format)."""
+        with self._connect() as db:
+            self._upsert(db, entry, archive)
+
+    def import_entries(self, entries):
+        """Replace the whole store with manifest.json entries."""
+        with self._connect() as db:
+            db.execute("DELETE FROM editions")
+            for entry in entries:
+                if entry.get("date"):
+                    self._upsert(db, entry, None)
+
+    def entries(self, since=None):
+        """Editions in manifest.json format, newest first (only dates >= since if given)."""
+        where, args = ("WHERE date >= ?", (since,)) if since else ("", ())
+        with self._connect() as db:
+            editions = db.execute(
+                f"SELECT date, number, title FROM editions {where} ORDER BY date DESC", args
+            ).fetchall()
+            urls = db.execute(f"SELECT date, url FROM urls {where} ORDER BY date, position", args).fetchall()
+            titles = db.execute(f"SELECT date, title FROM titles {where} ORDER BY date, position", args).fetchall()
+        result = {date: {"date": date, "number": number, "title": title, "urls": [], "titles": []}
+                  for date, number, title in editions}
+        for date, url in urls:
+            result[date]["urls"].append(url)
+        for date, title in titles:
+            result[date]["titles"].append(title)
+        return list(result.values())
+
+    def summaries(self):
+        """(date, number, title) of every edition, oldest first, without urls and titles."""
+        with self._connect() as db:
+            return db.execute("SELECT date, number, title FROM editions ORDER BY date").fetchall()
+
+    def count(self):
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM editions").fetchone()[0]
+
+    def edition_number(self, date):
+        """Edition number of date: the count of published dates, + 1 unless date is one of them."""
+        with self._connect() as db:
+            total, exists = db.execute(
+                "SELECT COUNT(*), EXISTS (SELECT 1 FROM editions WHERE date = ?) FROM editions", (date,)
+            ).fetchone()
+        return total if exists else total + 1
+
+    def published_urls(self, urls, since=None, exclude_date=None):
+        """Normalized forms of the urls published in an edition dated >= since, other than exclude_date."""
+        normalized = sorted({normalize_url(u) for u in urls if u})
+        found = set()
+        with self._connect() as db:
+            for i in range(0, len(normalized), SQL_MAX_VARIABLES):
+                chunk = normalized[i:i + SQL_MAX_VARIABLES]
+                rows = db.execute(
+                    f"SELECT DISTINCT normalized FROM urls WHERE normalized IN ({','.join('?' * len(chunk))})"
+                    " AND date >= ? AND date != ?",
+                    (*chunk, since or "", exclude_date or ""),
+                ).fetchall()
+                found.update(row[0] for row in rows)
+        return found
+
+    def export_json(self, path=None):
+        """Write the manifest.json export atomically (default: next to the store); returns its path."""
+        path = path or self.archives_dir / "manifest.json"
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.entries(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+        return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite store of published editions")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("export", help="write the manifest.json export")
+    p.add_argument("--output", help="output file (default: editions/archives/manifest.json, '-' = stdout)")
+
+    p = sub.add_parser("import", help="replace the store with the entries of a manifest.json")
+    p.add_argument("manifest")
+
+    p = sub.add_parser("number", help="print the edition number of a date")
+    p.add_argument("--date", default=os.environ.get("RP_EDITION_DATE") or datetime.now().strftime("%Y-%m-%d"))
+
+    args = parser.parse_args()
+    store = ManifestStore()
+
+    if args.command == "export":
+        if args.output == "-":
+            json.dump(store.entries(), sys.stdout, ensure_ascii=False, indent=2)
+        else:
+            print(store.export_json(Path(args.output) if args.output else None))
+    elif args.command == "import":
+        with open(args.manifest, encoding="utf-8") as f:
+            store.import_entries(json.load(f))
+        logger.info(f"[MANIFEST] Imported {store.count()} edition(s) from {args.manifest}")
+    else:
+        print(store.edition_number(args.date))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,32 @@
 #!/usr/bin/env python3
-"""Fetch and parse RSS feeds, output JSON articles."""
+"""Fetch and parse RSS feeds, output JSON articles.
 
+Feeds are fetched with HTTP conditional GET: the ETag / Last-Modified of the
+previous response and its parsed entries are kept in .cache/feeds/, and a
+304 Not Modified reuses the cached entries. Set RP_NO_FEED_CACHE=1 to bypass.
+"""
+
+import hashlib
 import json
+import os
 import sys
 import time
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
 import feedparser
 import yaml
 
-from log_utils import setup_logging
+from log_utils import setup_logging, CACHE_DIR
 
 logger = setup_logging("parse_rss")
 
 HOURS_CUTOFF = 48
 TIMEOUT = 10
+MAX_WORKERS = 8  # concurrent feed fetches (override with RP_RSS_WORKERS)
+FEED_CACHE_DIR = CACHE_DIR / "feeds"
 
 def load_feeds():
     config_path = Path(__file__).parent.parent / "config" / "rss-feeds.yaml"
@@ -51,65 +61,170 @@ def clean_summary(entry):
         summary = summary[:497] + "..."
     return summary
 
-def fetch_feed(feed_config, cutoff, authority):
-    """Parse a single RSS feed and return articles."""
-    articles = []
-    name = feed_config["name"]
-    url = feed_config["url"]
-    topics = feed_config.get("topics", [])
+def _feed_cache_path(url):
+    return FEED_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
 
-    old_timeout = socket.getdefaulttimeout()
-    socket.setdefaulttimeout(TIMEOUT)
+def load_feed_cache(url):
+    """Return the cached {etag, modified, entries} for a feed URL, or None."""
+    path = _feed_cache_path(url)
+    if not path.exists():
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.debug(f"Ignoring unreadable feed cache {path.name}: {e}")
+        return None
+    if cache.get("url") != url:
+        return None
+    return cache
+
+def save_feed_cache(url, etag, modified, entries):
+    """Persist validators + normalized entries (atomic write, one file per feed)."""
+    path = _feed_cache_path(url)
     try:
-        d = feedparser.parse(url)
+        FEED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({
+                "url": url,
+                "etag": etag,
+                "modified": modified,
+                "fetched_at": datetime.now(timezone.utc).isoformat(),
+                "entries": entries,
+            }, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Could not write feed cache for {url}: {e}")
+
+def normalize_entry(entry):
+    """Reduce a feedparser entry to the JSON-serializable fields we use."""
+    pub_date = parse_date(entry)
+    return {
+        "title": entry.get("title", "").strip(),
+        "link": entry.get("link", ""),
+        "summary": clean_summary(entry),
+        "published": pub_date.isoformat() if pub_date else None,
+    }
+
+def fetch_entries(name, url):
+    """Fetch a feed's normalized entries, using the conditional GET cache.
+
+    Returns a list of entries (possibly empty on error).
+    """
+    use_cache = os.environ.get("RP_NO_FEED_CACHE", "").strip() in ("", "0")
+    cache = load_feed_cache(url) if use_cache else None
+
+    kwargs = {}
+    if cache:
+        if cache.get("etag"):
+            kwargs["etag"] = cache["etag"]
+        if cache.get("modified"):
+            kwargs["modified"] = cache["modified"]
+
+    # Socket timeout is set process-wide by fetch_all_feeds (feedparser has no
+    # per-call timeout, and toggling the global from worker threads would race)
+    try:
+        d = feedparser.parse(url, **kwargs)
     except Exception as e:
         logger.warning(f"[WARN] Failed to fetch {name}: {e}")
-        return articles
-    finally:
-        socket.setdefaulttimeout(old_timeout)
+        return []
+
+    if cache and d.get("status") == 304:
+        logger.debug(f"{name}: 304 Not Modified, reusing {len(cache['entries'])} cached entries")
+        return cache["entries"]
 
     if d.bozo and not d.entries:
         logger.warning(f"[WARN] Feed error for {name}: {d.bozo_exception}")
-        return articles
+        return []
+
+    entries = [normalize_entry(e) for e in d.entries]
+
+    etag = d.get("etag")
+    modified = d.get("modified")
+    if use_cache and (etag or modified):
+        save_feed_cache(url, etag, modified, entries)
+
+    return entries
 
-    for entry in d.entries:
-        pub_date = parse_date(entry)
-        if pub_date and pub_date < cutoff:
+def fetch_feed(feed_config, cutoff, authority):
+    """Parse a single RSS feed and return articles."""
+    articles = []
+    name = feed_config["name"]
+    url = feed_config["url"]
+    topics = feed_config.get("topics", [])
+
+    for entry in fetch_entries(name, url):
+        published = entry["published"]
+        if published and datetime.fromisoformat(published) < cutoff:
             continue
 
-        link = entry.get("link", "")
-        title = entry.get("title", "").strip()
+        link = entry["link"]
+        title = entry["title"]
         if not title or not link:
             continue
 
-        summary = clean_summary(entry)
-
         articles.append({
             "title": title,
             "url": link,
             "source": name,
             "topics": topics,
-            "summary": summary,
-            "published": pub_date.isoformat() if pub_date else None,
+            "summary": entry["summary"],
+            "published": published,
             "authority": authority.get(name, authority.get("default", 10)),
         })
 
     return articles
 
-def main():
+def fetch_all_feeds(feeds, cutoff, authority, max_workers=None):
+    """Fetch all feeds concurrently, returning articles in config order.
+
+    Wall time is bounded by the slowest feed rather than the sum of all feeds.
+    """
+    if max_workers is None:
+        max_workers = int(os.environ.get("RP_RSS_WORKERS", MAX_WORKERS))
+    max_workers = max(1, min(max_workers, len(feeds) or 1))
+    logger.debug(f"Fetching {len(feeds)} feeds with {max_workers} workers")
+
+    def _fetch(feed):
+        t0 = time.time()
+        articles = fetch_feed(feed, cutoff, authority)
+        logger.debug(f"{feed['name']} fetched in {time.time() - t0:.1f}s")
+        return articles
+
+    old_timeout = socket.getdefaulttimeout()
+    socket.setdefaulttimeout(TIMEOUT)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # map() preserves input order, so the article list is identical
+            # to a serial walk over rss-feeds.yaml
+            results = list(pool.map(_fetch, feeds))
+    finally:
+        socket.setdefaulttimeout(old_timeout)
+
+    all_articles = []
+    for feed, articles in zip(feeds, results):
+        all_articles.extend(articles)
+        logger.info(f"[INFO] {feed['name']}: {len(articles)} articles")
+    return all_articles
+
+def collect_articles():
+    """Load rss-feeds.yaml and return all recent articles (in-process entry point)."""
     feeds = load_feeds()
     authority = load_authority()
     cutoff = datetime.now(timezone.utc) - timedelta(hours=HOURS_CUTOFF)
 
     logger.debug(f"Config: {len(feeds)} feeds, cutoff={HOURS_CUTOFF}h")
 
-    all_articles = []
-    for feed in feeds:
-        articles = fetch_feed(feed, cutoff, authority)
-        all_articles.extend(articles)
-        logger.info(f"[INFO] {feed['name']}: {len(articles)} articles")
+    t0 = time.time()
+    all_articles = fetch_all_feeds(feeds, cutoff, authority)
+    logger.debug(f"All feeds fetched in {time.time() - t0:.1f}s")
 
     logger.info(f"[INFO] Total: {len(all_articles)} articles from RSS")
+    return all_articles
+
+def main():
+    all_articles = collect_articles()
 
     # Output JSON to stdout
     json.dump(all_articles, sys.stdout, ensure_ascii=False, indent=2)
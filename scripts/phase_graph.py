@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""Declarative phase graph of the pipeline + incremental, concurrent scheduler.
+
+Each phase declares its upstream phases, the files it reads and the files it
+writes (paths relative to the project). After a phase succeeds, the scheduler
+records in .pipeline/phase_state.json a fingerprint of its inputs (sha256 of
+each input file + the run parameters it depends on) and the hashes of its
+outputs. A later run skips a phase whose fingerprint is unchanged and whose
+outputs are intact; a rerun upstream phase that produces identical outputs
+does not invalidate its dependents. Phases reading live network data
+(websearch, collect) also go stale edition.network_max_age_minutes after
+their last success. Phases whose dependencies are satisfied
+run concurrently (e.g. the LinkedIn post and the HTML after the editorial).
+
+Two graphs share the phase definitions: "edition" (run_edition.sh,
+iterate_editorials.sh) and "dashboard" (dashboard_server.py, which adds the
+interactive editor/image/deploy pauses and generates editorial variants).
+
+Usage:
+    python3 scripts/phase_graph.py run [--targets P,..] [--start-at P] [--force P,..|all] [--skip P,..] [--jobs N] [--dry-run]
+    python3 scripts/phase_graph.py status [--graph edition|dashboard]
+    python3 scripts/phase_graph.py order [--graph edition|dashboard]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+from log_utils import setup_logging, load_config, PROJECT_DIR, PIPELINE_DIR, SCRIPTS_DIR
+
+logger = setup_logging("phase_graph")
+
+STATE_PATH = PIPELINE_DIR / "phase_state.json"
+CONFIG_FILE = "config/revue-presse.yaml"
+DEFAULT_NETWORK_MAX_AGE_MIN = 30
+
+
+class Phase:
+    """One node of the graph.
+
+    command: script (in scripts/) + args, run from the project directory.
+    check: optional validation command run after it. params: names of run
+    parameters that are part of the input fingerprint. tolerant: a failure
+    does not block dependents. interactive: needs a human, never skipped as
+    up to date. max_age: seconds after which its last success is stale even
+    with unchanged inputs (None = never).
+    """
+
+    def __init__(self, name, deps=(), inputs=(), outputs=(), params=(), command=None,
+                 check=None, tolerant=False, interactive=False, max_age=None):
+        self.name = name
+        self.deps = list(deps)
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.params = list(params)
+        self.command = command
+        self.check = check
+        self.tolerant = tolerant
+        self.interactive = interactive
+        self.max_age = max_age
+
+
+def network_max_age():
+    """Seconds a websearch/collect result is reused (edition.network_max_age_minutes, 0 = never)."""
+    edition = load_config().get("edition", {})
+    return edition.get("network_max_age_minutes", DEFAULT_NETWORK_MAX_AGE_MIN) * 60
+
+
+def _websearch(max_age):
+    return Phase("websearch",
+                 inputs=["scripts/prompts/websearch.md", CONFIG_FILE],
+                 outputs=[".pipeline/00_websearch.json"],
+                 params=["edition_date"],
+                 command=["websearch_collect.py"], tolerant=True, max_age=max_age)
+
+
+def _collect(max_age):
+    return Phase("collect", deps=["websearch"],
+                 inputs=[".pipeline/00_websearch.json", CONFIG_FILE, "config/rss-feeds.yaml"],
+                 outputs=[".pipeline/01_candidates.json"],
+                 params=["edition_date"],
+                 command=["collect.py"],
+                 check=["validate.py", ".pipeline/01_candidates.json", "--phase", "candidates"],
+                 max_age=max_age)
+
+
+def _html(dep):
+    return Phase("html", deps=[dep],
+                 inputs=[".pipeline/02_editorial.json", "templates/edition.html",
+                         "templates/archives.html", CONFIG_FILE],
+                 outputs=["editions/latest.html"],
+                 params=["edition_date"],
+                 command=["generate_edition.py", ".pipeline/02_editorial.json"])
+
+
+_LINKEDIN_OUTPUTS = [".pipeline/linkedin/post.txt", ".pipeline/linkedin/comment.txt"]
+
+
+def edition_graph():
+    """Non-interactive graph of the bash runners."""
+    max_age = network_max_age()
+    return PhaseGraph([
+        _websearch(max_age),
+        _collect(max_age),
+        Phase("editorial", deps=["collect"],
+              inputs=[".pipeline/01_candidates.json", "scripts/prompts/editorial.md", CONFIG_FILE],
+              outputs=[".pipeline/02_editorial.json"],
+              params=["edition_date", "edito_style", "prompt_version"],
+              command=["write_editorial.py"],
+              check=["validate.py", ".pipeline/02_editorial.json", "--phase", "editorial"]),
+        _html("editorial"),
+        Phase("linkedin", deps=["editorial"],
+              inputs=[".pipeline/02_editorial.json", "scripts/prompts/linkedin.md", CONFIG_FILE],
+              outputs=_LINKEDIN_OUTPUTS,
+              params=["edition_date"],
+              command=["linkedin_post.py"], tolerant=True),
+        Phase("deploy", deps=["html", "linkedin"],
+              inputs=["editions/latest.html", "editions/archives/manifest.json", "templates/archives.html"],
+              command=["deploy.py"]),
+    ])
+
+
+def dashboard_graph():
+    """Graph of the dashboard: editorial variants, then interactive pauses."""
+    max_age = network_max_age()
+    return PhaseGraph([
+        _websearch(max_age),
+        _collect(max_age),
+        Phase("editorial", deps=["collect"],
+              inputs=[".pipeline/01_candidates.json", "scripts/prompts/editorial.md", CONFIG_FILE],
+              outputs=[".pipeline/variants"],
+              params=["edition_date", "styles", "prompt_version"]),
+        Phase("editor", deps=["editorial"], outputs=[".pipeline/02_editorial.json"],
+              interactive=True),
+        Phase("image", deps=["editor"], inputs=[".pipeline/02_editorial.json"],
+              outputs=_LINKEDIN_OUTPUTS, interactive=True),
+        _html("editor"),
+        Phase("deploy", deps=["html", "image"],
+              inputs=["editions/latest.html", "editions/archives/manifest.json", "templates/archives.html"],
+              command=["deploy.py"], interactive=True),
+    ])
+
+
+GRAPHS = {"edition": edition_graph, "dashboard": dashboard_graph}
+
+
+def default_params(**overrides):
+    """Run parameters from the environment / config (RP_EDITION_DATE, EDITO_STYLE, PROMPT_VERSION)."""
+    edition = load_config().get("edition", {})
+    params = {
+        "edition_date": os.environ.get("RP_EDITION_DATE") or datetime.now().strftime("%Y-%m-%d"),
+        "edito_style": os.environ.get("EDITO_STYLE") or edition.get("edito_style", "focused"),
+        "prompt_version": os.environ.get("PROMPT_VERSION") or edition.get("prompt_version", "v1"),
+    }
+    params.update(overrides)
+    return params
+
+
+# ── Hashing / state ──────────────────────────────────────────────────────────
+
+
+def _hash_file(path, h):
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+
+
+def path_hash(rel):
+    """sha256 of a file, or of a directory's files (names + contents); None if missing."""
+    path = PROJECT_DIR / rel
+    if path.is_file():
+        h = hashlib.sha256()
+        _hash_file(path, h)
+        return h.hexdigest()
+    if path.is_dir():
+        h = hashlib.sha256()
+        for sub in sorted(p for p in path.rglob("*") if p.is_file()):
+            h.update(sub.relative_to(path).as_posix().encode("utf-8") + b"\0")
+            _hash_file(sub, h)
+        return h.hexdigest()
+    return None
+
+
+def fingerprint(phase, params):
+    """Hash of a phase's input files and of the parameters it depends on."""
+    h = hashlib.sha256()
+    for rel in phase.inputs:
+        h.update(f"{rel}={path_hash(rel)}\n".encode("utf-8"))
+    for name in phase.params:
+        h.update(f"{name}={json.dumps(params.get(name), sort_keys=True)}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def load_state(path=STATE_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_state(state, path=STATE_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+# ── Graph + scheduler ────────────────────────────────────────────────────────
+
+
+class PhaseGraph:
+    def __init__(self, phases):
+        self.phases = {p.name: p for p in phases}
+        for p in phases:
+            for dep in p.deps:
+                if dep not in self.phases:
+                    raise ValueError(f"Phase '{p.name}' depends on unknown phase '{dep}'")
+        self.order = self._toposort(phases)
+
+    def _toposort(self, phases):
+        order, seen, visiting = [], set(), set()
+
+        def visit(name):
+            if name in seen:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle in phase graph at '{name}'")
+            visiting.add(name)
+            for dep in self.phases[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            seen.add(name)
+            order.append(name)
+
+        for p in phases:  # declaration order breaks ties
+            visit(p.name)
+        return order
+
+    def upstream(self, name):
+        """All ancestors of a phase."""
+        result, stack = set(), list(self.phases[name].deps)
+        while stack:
+            dep = stack.pop()
+            if dep not in result:
+                result.add(dep)
+                stack.extend(self.phases[dep].deps)
+        return result
+
+    def downstream(self, name):
+        """The phase and all its descendants."""
+        return {n for n in self.order if n == name or name in self.upstream(n)}
+
+    def is_up_to_date(self, name, params=None, state=None):
+        """True if the phase ran with the same inputs, recently enough, and its outputs are intact.
+
+        params=None compares against the parameters of the recorded run (input
+        files and outputs unchanged since then).
+        """
+        phase = self.phases[name]
+        entry = (load_state() if state is None else state).get(name)
+        if not entry:
+            return False
+        if params is None:
+            params = entry.get("params", {})
+        if entry.get("inputs") != fingerprint(phase, params):
+            return False
+        if phase.max_age is not None and time.time() - entry.get("finished", 0) > phase.max_age:
+            return False
+        return all(path_hash(rel) == sha for rel, sha in entry.get("outputs", {}).items()) \
+            and set(entry.get("outputs", {})) == set(phase.outputs)
+
+    def status(self, params=None):
+        """{phase: {"up_to_date", "finished"}} for the phases recorded in the state file."""
+        state = load_state()
+        return {
+            name: {
+                "up_to_date": self.is_up_to_date(name, params, state),
+                "finished": state[name].get("finished"),
+            }
+            for name in self.order if name in state
+        }
+
+    def run(self, runner, params, targets=None, start_at=None, force=(), skip=(),
+            max_workers=None, should_stop=None, on_status=None, record=True):
+        """Run the graph; returns {phase: status}.
+
+        runner(phase) -> bool executes one phase. targets limits the run to
+        these phases and their ancestors. start_at treats its ancestors as
+        satisfied and forces it and its descendants. force reruns phases even
+        if up to date ("all" for every phase); skip marks phases as satisfied
+        without running them. should_stop() is polled between phases (abort).
+        on_status(phase, status) is called for every terminal status. record=False
+        leaves the state file untouched (dry run). Statuses: done, up_to_date, skipped, error, blocked.
+        """
+        selected = set(self.order)
+        if targets:
+            selected = set()
+            for t in targets:
+                selected |= {t} | self.upstream(t)
+        forced = set(self.order) if "all" in force else set(force)
+        skipped = set(skip)
+        if start_at:
+            skipped |= self.upstream(start_at)
+            forced |= self.downstream(start_at)
+
+        statuses = {}
+        state_lock = threading.Lock()
+        state = load_state()
+
+        def finish(name, status):
+            statuses[name] = status
+            if on_status:
+                on_status(name, status)
+
+        def execute(name):
+            phase = self.phases[name]
+            inputs = fingerprint(phase, params)
+            if not phase.interactive and name not in forced:
+                with state_lock:
+                    up_to_date = self.is_up_to_date(name, params, state)
+                if up_to_date:
+                    logger.info(f"[SKIP] {name}: up to date")
+                    return "up_to_date"
+            if not runner(phase):
+                return "error"
+            if not record:
+                return "done"
+            entry = {
+                "inputs": inputs,
+                "params": {n: params.get(n) for n in phase.params},
+                "outputs": {rel: path_hash(rel) for rel in phase.outputs},
+                "finished": time.time(),
+            }
+            with state_lock:
+                state[name] = entry
+                _save_state(state)
+            return "done"
+
+        pending = [n for n in self.order if n in selected]
+        running = {}
+        workers = max_workers or len(pending) or 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="phase") as pool:
+            while pending or running:
+                stop = should_stop is not None and should_stop()
+                for name in list(pending):  # topological order
+                    deps = {d: statuses.get(d) for d in self.phases[name].deps if d in selected}
+                    if name in skipped:
+                        pending.remove(name)
+                        finish(name, "skipped")
+                    elif stop or any(s == "blocked" or (s == "error" and not self.phases[d].tolerant)
+                                     for d, s in deps.items()):
+                        pending.remove(name)
+                        finish(name, "blocked")
+                    elif all(s is not None for s in deps.values()):
+                        pending.remove(name)
+                        running[pool.submit(execute, name)] = name
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        finish(name, future.result())
+                    except Exception as e:
+                        logger.error(f"[ERROR] Phase {name} crashed: {e}")
+                        finish(name, "error")
+        return statuses
+
+
+def load_graph(name="edition"):
+    return GRAPHS[name]()
+
+
+# ── CLI (bash runners) ───────────────────────────────────────────────────────
+
+_print_lock = threading.Lock()
+
+
+def _say(text):
+    with _print_lock:
+        print(text, flush=True)
+
+
+def run_script(args):
+    """Run scripts/<args[0]> with args[1:] from the project directory; True on success."""
+    return subprocess.run([sys.executable, str(SCRIPTS_DIR / args[0]), *args[1:]],
+                          cwd=str(PROJECT_DIR)).returncode == 0
+
+
+def cli_runner(phase):
+    _say(f"\n── Phase: {phase.name} ──")
+    ok = run_script(phase.command) and (phase.check is None or run_script(phase.check))
+    if ok:
+        _say(f"[OK] {phase.name} complete")
+    elif phase.tolerant:
+        _say(f"[WARN] {phase.name} failed, continuing")
+    else:
+        _say(f"[ERROR] {phase.name} failed")
+    return ok
+
+
+def _split(value):
+    return [v for v in (value or "").split(",") if v]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental pipeline scheduler")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("run", help="run the phases that are not up to date")
+    p.add_argument("--targets", help="phases to bring up to date (default: all)")
+    p.add_argument("--start-at", help="assume the upstream phases done, force this one and its dependents")
+    p.add_argument("--force", help="phases to rerun even if up to date ('all' for every phase)")
+    p.add_argument("--skip", help="phases not to run (treated as satisfied)")
+    p.add_argument("--jobs", type=int, help="max phases running at once (default: unbounded)")
+    p.add_argument("--dry-run", action="store_true", help="only print what would run")
+    for name in ("status", "order"):
+        p = sub.add_parser(name)
+        p.add_argument("--graph", choices=sorted(GRAPHS), default="edition")
+
+    args = parser.parse_args()
+    graph = load_graph(getattr(args, "graph", "edition"))
+    params = default_params()
+
+    if args.command == "order":
+        for name in graph.order:
+            phase = graph.phases[name]
+            print(f"{name}: after {', '.join(phase.deps) or '-'}")
+        return
+    if args.command == "status":
+        status = graph.status(params)
+        for name in graph.order:
+            info = status.get(name)
+            label = "never run" if info is None else "up to date" if info["up_to_date"] else "stale"
+            print(f"{name:10s} {label}")
+        return
+
+    targets, force, skip = _split(args.targets), _split(args.force), _split(args.skip)
+    for name in [*targets, *skip, *[f for f in force if f != "all"], *_split(args.start_at)]:
+        if name not in graph.phases:
+            logger.error(f"[ERROR] Unknown phase '{name}' (expected one of {graph.order})")
+            sys.exit(1)
+
+    def dry_runner(phase):
+        _say(f"would run: {phase.name}")
+        return True
+
+    runner = dry_runner if args.dry_run else cli_runner
+    statuses = graph.run(runner, params, targets=targets, start_at=args.start_at,
+                         force=force, skip=skip, max_workers=args.jobs, record=not args.dry_run)
+    if args.dry_run:
+        return
+    failed = [n for n, s in statuses.items()
+              if (s == "error" and not graph.phases[n].tolerant) or s == "blocked"]
+    if failed:
+        logger.error(f"[ERROR] Pipeline stopped: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
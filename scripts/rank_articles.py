@@ -1,55 +1,75 @@
 #!/usr/bin/env python3
-"""Score and rank articles, output top N as JSON."""
+"""Score and rank articles, output top N as JSON.
 
+Large inputs (BATCH_MIN_ARTICLES and up, e.g. backfilled historical re-runs)
+are scored column-wise with NumPy when it is installed; otherwise, and for
+the daily pool of a few hundred articles, the scalar per-article path is used.
+Both paths return the same ranking: score, then source authority, then
+publication date (newest first), then URL, so equal scores never depend on
+input order.
+"""
+
+import heapq
 import json
 import os
 import sys
 from datetime import datetime, timezone
 
+from keywords import BREAKING_GROUP, get_matcher
 from log_utils import setup_logging, load_config
 
+try:
+    import numpy as np
+except ImportError:  # optional: rank() falls back to the scalar path
+    np = None
+
 logger = setup_logging("rank_articles")
 
-BREAKING_KEYWORDS = [
-    "breaking", "urgent", "just in", "exclusive", "major",
-    "announces", "launches", "acquires", "shuts down", "breach",
-    "zero-day", "critical vulnerability", "recall",
-]
+BATCH_MIN_ARTICLES = 1000
 
-def recency_score(published_str):
-    """Score 0-30 based on article age."""
+# (max age in hours, score), checked in order; older articles score 3
+RECENCY_BANDS = [(3, 30), (6, 25), (12, 20), (24, 15), (48, 8)]
+RECENCY_UNKNOWN = 10
+RECENCY_OLD = 3
+
+def published_timestamp(published_str):
+    """Parse an ISO publication date to a UTC epoch timestamp (None if unknown)."""
     if not published_str:
-        return 10  # Unknown date gets medium score
+        return None
     try:
         pub = datetime.fromisoformat(published_str)
         if pub.tzinfo is None:
             pub = pub.replace(tzinfo=timezone.utc)
-        age_hours = (datetime.now(timezone.utc) - pub).total_seconds() / 3600
+        return pub.timestamp()
     except Exception:
-        return 10
-
-    if age_hours < 3:
-        return 30
-    elif age_hours < 6:
-        return 25
-    elif age_hours < 12:
-        return 20
-    elif age_hours < 24:
-        return 15
-    elif age_hours < 48:
-        return 8
-    return 3
+        return None
+
+def recency_score(published_str, now=None):
+    """Score 0-30 based on article age."""
+    ts = published_timestamp(published_str)
+    if ts is None:
+        return RECENCY_UNKNOWN  # Unknown date gets medium score
+    if now is None:
+        now = datetime.now(timezone.utc).timestamp()
+    age_hours = (now - ts) / 3600
+
+    for max_hours, score in RECENCY_BANDS:
+        if age_hours < max_hours:
+            return score
+    return RECENCY_OLD
 
 def authority_score(article):
     """Score 0-25 from source authority."""
     return min(article.get("authority", 10), 25)
 
-def topic_relevance_score(article, topics_config):
+def topic_relevance_score(article, topics_config, matcher=None):
     """Score 0-20 based on keyword density in title + summary."""
-    text = f"{article.get('title', '')} {article.get('summary', '')}".lower()
+    if matcher is None:
+        matcher = get_matcher({"topics": topics_config})
+    hits = matcher.match(f"{article.get('title', '')} {article.get('summary', '')}")
     max_score = 0
     for topic in topics_config:
-        matches = sum(1 for kw in topic["keywords"] if kw.lower() in text)
+        matches = len(hits[topic["tag"]])
         density = min(matches / max(len(topic["keywords"]), 1), 1.0)
         score = int(density * 20)
         if score > max_score:
@@ -69,55 +89,171 @@ def depth_score(article):
         return 5
     return 0
 
-def breaking_score(article):
+def breaking_score(article, matcher=None):
     """Score 0-10 heuristic for breaking news."""
-    text = f"{article.get('title', '')}".lower()
-    hits = sum(1 for kw in BREAKING_KEYWORDS if kw in text)
+    if matcher is None:
+        matcher = get_matcher({})
+    hits = len(matcher.hits(article.get("title", ""), BREAKING_GROUP))
     score = min(hits * 5, 10)
     if score >= 5:
         article["is_breaking"] = True
     return score
 
-def assign_topics(article, topics_config):
+def assign_topics(article, topics_config, matcher=None):
     """Ensure article has topic tags from config matching."""
     if article.get("matched_topics"):
         return
-    text = f"{article.get('title', '')} {article.get('summary', '')}".lower()
+    if matcher is None:
+        matcher = get_matcher({"topics": topics_config})
+    hits = matcher.match(f"{article.get('title', '')} {article.get('summary', '')}")
     article["matched_topics"] = []
     for topic in topics_config:
-        if any(kw.lower() in text for kw in topic["keywords"]):
+        if hits[topic["tag"]]:
             article["matched_topics"].append(topic["tag"])
     # Fallback: use original topics from RSS feed
     if not article["matched_topics"] and article.get("topics"):
         article["matched_topics"] = article["topics"][:2]
 
-def rank(articles, config):
+class _Ascending:
+    """Sort key wrapper that inverts ordering, so nlargest() picks the smallest."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+def rank_key(article, published_ts=None):
+    """Ordering key, larger is better: score, authority, recency, then URL (ascending)."""
+    if published_ts is None:
+        published_ts = published_timestamp(article.get("published"))
+    return (
+        article["score"],
+        article.get("authority", 10),
+        float("-inf") if published_ts is None else published_ts,
+        _Ascending(article.get("url", "")),
+    )
+
+def top_k(keyed_articles, k):
+    """Select the k best (key, article) pairs from an iterable, best first.
+
+    Keeps a bounded heap of k items while consuming the iterable, so scored
+    articles can be streamed from a generator without materializing the pool.
+    """
+    if k <= 0:
+        return []
+    return [article for _, article in heapq.nlargest(k, keyed_articles, key=lambda pair: pair[0])]
+
+def rank(articles, config, max_candidates=None):
     """Score all articles and return top N sorted by score.
 
     Scoring: recency(0-30) + authority(0-25) + depth(0-15) + breaking(0-10) = max 80.
     topic_relevance_score is NOT included — topic matching is too naive
     (keyword-based) and lets irrelevant articles rank high. The LLM
     editorial phase handles intelligent selection instead.
+
+    articles may be a list or any iterable (e.g. a generator); ties are
+    broken by rank_key. max_candidates defaults to RP_MAX_CANDIDATES, then
+    edition.max_articles.
     """
     topics_config = config.get("topics", [])
-    max_candidates = int(os.environ.get(
-        "RP_MAX_CANDIDATES",
-        config.get("edition", {}).get("max_articles", 15),
-    ))
-
-    logger.debug(f"max_candidates={max_candidates}, {len(articles)} articles to rank")
-
-    for article in articles:
-        s1 = recency_score(article.get("published"))
-        s2 = authority_score(article)
-        s4 = depth_score(article)
-        s5 = breaking_score(article)
-        article["score"] = s1 + s2 + s4 + s5
-        assign_topics(article, topics_config)
-        logger.debug(f"Score {article['score']:3d} | recency={s1:2d} authority={s2:2d} depth={s4:2d} breaking={s5:2d} | {article.get('title', '')[:60]}")
-
-    articles.sort(key=lambda a: a["score"], reverse=True)
-    return articles[:max_candidates]
+    matcher = get_matcher(config)
+    if max_candidates is None:
+        max_candidates = int(os.environ.get(
+            "RP_MAX_CANDIDATES",
+            config.get("edition", {}).get("max_articles", 15),
+        ))
+
+    if isinstance(articles, list):
+        logger.debug(f"max_candidates={max_candidates}, {len(articles)} articles to rank")
+        if np is not None and len(articles) >= BATCH_MIN_ARTICLES:
+            return _rank_batch(articles, topics_config, matcher, max_candidates)
+    else:
+        logger.debug(f"max_candidates={max_candidates}, streaming articles to rank")
+
+    now = datetime.now(timezone.utc).timestamp()
+
+    def scored():
+        for article in articles:
+            published_ts = published_timestamp(article.get("published"))
+            s1 = recency_score(article.get("published"), now)
+            s2 = authority_score(article)
+            s4 = depth_score(article)
+            s5 = breaking_score(article, matcher)
+            article["score"] = s1 + s2 + s4 + s5
+            logger.debug(f"Score {article['score']:3d} | recency={s1:2d} authority={s2:2d} depth={s4:2d} breaking={s5:2d} | {article.get('title', '')[:60]}")
+            yield rank_key(article, published_ts), article
+
+    ranked = top_k(scored(), max_candidates)
+    for article in ranked:
+        assign_topics(article, topics_config, matcher)
+    return ranked
+
+def _rank_batch(articles, topics_config, matcher, max_candidates):
+    """NumPy scoring path: columnar component scores + top-N by np.partition threshold.
+
+    The k-th best score is found with np.partition; articles above it are kept,
+    plus the best-ranked ties at that score, then only those are sorted.
+
+    Same scores and order as the scalar path (ties broken as in rank_key). Only the
+    selected articles get their score/is_breaking/matched_topics fields set.
+    """
+    n = len(articles)
+    now = datetime.now(timezone.utc).timestamp()
+
+    published = np.array(
+        [published_timestamp(a.get("published")) for a in articles], dtype=float,
+    )  # None -> nan
+    authority = np.array([a.get("authority", 10) for a in articles], dtype=float)
+    research = np.array([bool(a.get("research_context")) for a in articles])
+    summary_len = np.array([len(a.get("summary") or "") for a in articles])
+    breaking_hits = np.array(
+        [len(matcher.hits(a.get("title", ""), BREAKING_GROUP)) for a in articles],
+    )
+
+    age_hours = (now - published) / 3600
+    with np.errstate(invalid="ignore"):
+        recency = np.select(
+            [np.isnan(age_hours)] + [age_hours < h for h, _ in RECENCY_BANDS],
+            [RECENCY_UNKNOWN] + [score for _, score in RECENCY_BANDS],
+            default=RECENCY_OLD,
+        )
+    depth = np.where(research, 15, np.where(summary_len > 200, 5, 0))
+    breaking = np.minimum(breaking_hits * 5, 10)
+    scores = recency + np.minimum(authority, 25) + depth + breaking
+
+    k = min(max_candidates, n)
+    if k <= 0:
+        return []
+    # Tie-break columns of rank_key; lexsort takes the primary key last
+    newest = np.where(np.isnan(published), -np.inf, published)
+    urls = np.array([a.get("url", "") for a in articles], dtype=str)
+
+    def by_rank_key(idx):
+        return idx[np.lexsort((urls[idx], -newest[idx], -authority[idx], -scores[idx]))]
+
+    # k-th best score, then everything above it plus the best-ranked ties
+    kth = np.partition(scores, n - k)[n - k]
+    above = np.flatnonzero(scores > kth)
+    ties = by_rank_key(np.flatnonzero(scores == kth))[:k - len(above)]
+    order = by_rank_key(np.concatenate([above, ties]))
+
+    ranked = []
+    for i in order:
+        article = articles[i]
+        score = scores[i]
+        article["score"] = int(score) if float(score).is_integer() else float(score)
+        if breaking[i] >= 5:
+            article["is_breaking"] = True
+        assign_topics(article, topics_config, matcher)
+        ranked.append(article)
+    logger.debug(f"Batch-ranked {n} articles with NumPy, kept {len(ranked)}")
+    return ranked
 
 def main():
     config = load_config()
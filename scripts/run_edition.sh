@@ -4,6 +4,14 @@
 # Usage:
 #   bash scripts/run_edition.sh              # Full pipeline with deploy
 #   bash scripts/run_edition.sh --no-deploy  # Skip deploy step
+#   bash scripts/run_edition.sh --fresh      # Recompute every phase from scratch
+#   bash scripts/run_edition.sh --start-at=editorial               # Reuse the latest run's candidates
+#   bash scripts/run_edition.sh --from-run=<run_id> --start-at=html
+#
+# Phases, their dependencies and inputs/outputs are declared in phase_graph.py:
+# a phase whose inputs did not change since its last success is skipped, and
+# independent phases (html, linkedin) run concurrently.
+# Each run is snapshotted into .pipeline/runs/<run_id>/ on exit (see artifact_store.py).
 #
 set -euo pipefail
 
@@ -17,6 +25,9 @@ LINKEDIN=true
 EDITO_STYLE=""
 EDITION_DATE=""
 PROMPT_VERSION=""
+FROM_RUN=""
+START_AT=""
+FRESH=false
 for arg in "$@"; do
   case "$arg" in
     --no-deploy) DEPLOY=false ;;
@@ -25,14 +36,30 @@ for arg in "$@"; do
     --prompt-version=*) PROMPT_VERSION="${arg#*=}" ;;
     --tomorrow) EDITION_DATE=$(date -v+1d '+%Y-%m-%d') ;;
     --date=*) EDITION_DATE="${arg#*=}" ;;
+    --from-run=*) FROM_RUN="${arg#*=}" ;;
+    --start-at=*) START_AT="${arg#*=}" ;;
+    --fresh) FRESH=true ;;
     *) echo "[ERROR] Unknown argument: $arg" >&2; exit 1 ;;
   esac
 done
 
-# Export edition date override if set
+if [ -n "$FROM_RUN" ] && [ -z "$START_AT" ]; then
+  START_AT="editorial"
+fi
+if [ -n "$START_AT" ] && [ -z "$FROM_RUN" ]; then
+  FROM_RUN="latest"
+fi
+
+# Export edition date / style / prompt overrides if set
 if [ -n "$EDITION_DATE" ]; then
   export RP_EDITION_DATE="$EDITION_DATE"
 fi
+if [ -n "$EDITO_STYLE" ]; then
+  export EDITO_STYLE
+fi
+if [ -n "$PROMPT_VERSION" ]; then
+  export PROMPT_VERSION
+fi
 
 echo "=========================================="
 echo " RevuePresse — Pipeline Edition"
@@ -45,67 +72,41 @@ if [ -n "$PROMPT_VERSION" ]; then
 fi
 echo "=========================================="
 
-# Clean pipeline directory
-rm -rf "$PIPELINE_DIR"
+# --fresh: clean the pipeline directory (stored runs in .pipeline/runs are kept);
+# otherwise phases already up to date in .pipeline/ are reused
 mkdir -p "$PIPELINE_DIR"
-
-# ── Phase 0: WebSearch collect (tolerant) ──
-echo ""
-echo "── Phase 0: WebSearch ──"
-if python3 "$SCRIPT_DIR/websearch_collect.py"; then
-  echo "[OK] Phase 0 complete"
-else
-  echo "[WARN] Phase 0 failed, continuing with RSS only"
+if [ "$FRESH" = true ]; then
+  find "$PIPELINE_DIR" -mindepth 1 -maxdepth 1 ! -name runs -exec rm -rf {} +
 fi
 
-# ── Phase 1: RSS + merge + dedup + rank ──
-echo ""
-echo "── Phase 1: Collect (RSS + dedup + rank) ──"
-python3 "$SCRIPT_DIR/collect.py"
-python3 "$SCRIPT_DIR/validate.py" "$PIPELINE_DIR/01_candidates.json" --phase candidates
-echo "[OK] Phase 1 complete"
+# Snapshot this run's artifacts on exit, even after a failed phase
+trap 'python3 "$SCRIPT_DIR/artifact_store.py" snapshot --label run_edition || echo "[WARN] Run snapshot failed"' EXIT
 
-# ── Phase 2: Editorial (LLM) ──
-echo ""
-echo "── Phase 2: Editorial (claude -p) ──"
-if [ -n "$EDITO_STYLE" ] || [ -n "$PROMPT_VERSION" ]; then
-  EDITO_STYLE="${EDITO_STYLE}" PROMPT_VERSION="${PROMPT_VERSION}" python3 "$SCRIPT_DIR/write_editorial.py"
-else
-  python3 "$SCRIPT_DIR/write_editorial.py"
+if [ -n "$FROM_RUN" ]; then
+  echo ""
+  echo "── Restore: artifacts of run $FROM_RUN before phase $START_AT ──"
+  python3 "$SCRIPT_DIR/artifact_store.py" restore "$FROM_RUN" --start-at "$START_AT"
+  echo "[OK] Restored"
 fi
-python3 "$SCRIPT_DIR/validate.py" "$PIPELINE_DIR/02_editorial.json" --phase editorial
-echo "[OK] Phase 2 complete"
-
-# ── Phase 3: Generate HTML ──
-echo ""
-echo "── Phase 3: Generate HTML ──"
-python3 "$SCRIPT_DIR/generate_edition.py" "$PIPELINE_DIR/02_editorial.json"
-echo "[OK] Phase 3 complete"
 
-# ── Phase 3b: LinkedIn post (tolerant) ──
-if [ "$LINKEDIN" = true ]; then
-  echo ""
-  echo "── Phase 3b: LinkedIn post ──"
-  if python3 "$SCRIPT_DIR/linkedin_post.py"; then
-    echo "[OK] Phase 3b complete"
-  else
-    echo "[WARN] Phase 3b failed (LinkedIn), continuing"
-  fi
-else
-  echo ""
+# ── Phases 0-4: websearch → collect → editorial → html + linkedin → deploy ──
+GRAPH_ARGS=()
+if [ -n "$START_AT" ]; then
+  GRAPH_ARGS+=(--start-at "$START_AT")
+fi
+SKIP=""
+if [ "$LINKEDIN" = false ]; then
+  SKIP="linkedin"
   echo "── Phase 3b: LinkedIn (skipped: --no-linkedin) ──"
 fi
-
-# ── Phase 4: Deploy ──
-if [ "$DEPLOY" = true ]; then
-  echo ""
-  echo "── Phase 4: Deploy ──"
-  python3 "$SCRIPT_DIR/deploy.py"
-  echo "[OK] Phase 4 complete"
-else
-  echo ""
+if [ "$DEPLOY" = false ]; then
+  SKIP="${SKIP:+$SKIP,}deploy"
   echo "── Phase 4: Deploy (skipped: --no-deploy) ──"
 fi
+if [ -n "$SKIP" ]; then
+  GRAPH_ARGS+=(--skip "$SKIP")
+fi
+python3 "$SCRIPT_DIR/phase_graph.py" run ${GRAPH_ARGS[@]+"${GRAPH_ARGS[@]}"}
 
 echo ""
 echo "=========================================="
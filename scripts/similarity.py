@@ -0,0 +1,77 @@
+"""Near-duplicate title detection: character-shingle MinHash with LSH banding.
+
+The index only proposes candidate pairs (roughly linear time overall); callers
+confirm each candidate with their exact check (SequenceMatcher ratio), so the
+thresholds keep their current meaning.
+
+Signatures are deterministic across processes (crc32 + fixed-seed
+permutations) and can therefore be persisted.
+"""
+
+import random
+import re
+import zlib
+
+SHINGLE_SIZE = 3
+NUM_PERM = 32
+BANDS = 16  # 2 rows per band: pairs down to ~0.3 Jaccard are likely candidates
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+_WS_RE = re.compile(r"\s+")
+
+
+def shingles(text, k=SHINGLE_SIZE):
+    """Return the set of lowercase character k-grams of text."""
+    text = _WS_RE.sub(" ", text.lower()).strip()
+    if len(text) <= k:
+        return {text}
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+def minhash(text):
+    """Compute the MinHash signature (tuple of NUM_PERM ints) of a title."""
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles(text)]
+    return tuple(
+        min([(a * h + b) % _MERSENNE_PRIME for h in hashes])
+        for a, b in _PERMUTATIONS
+    )
+
+
+class LSHIndex:
+    """Banded LSH over MinHash signatures, mapping signatures to caller keys."""
+
+    def __init__(self, bands=BANDS):
+        if NUM_PERM % bands:
+            raise ValueError(f"bands ({bands}) must divide NUM_PERM ({NUM_PERM})")
+        self.bands = bands
+        self.rows = NUM_PERM // bands
+        self._buckets = [{} for _ in range(bands)]
+
+    def _bands(self, signature):
+        r = self.rows
+        for i in range(self.bands):
+            yield i, tuple(signature[i * r:(i + 1) * r])
+
+    def add(self, key, signature):
+        """Register key under each band of signature."""
+        for i, band in self._bands(signature):
+            self._buckets[i].setdefault(band, []).append(key)
+
+    def query(self, signature):
+        """Return candidate keys sharing at least one band, in insertion order."""
+        seen = set()
+        candidates = []
+        for i, band in self._bands(signature):
+            for key in self._buckets[i].get(band, ()):
+                if key not in seen:
+                    seen.add(key)
+                    candidates.append(key)
+        return candidates
+
+    def __len__(self):
+        return sum(len(keys) for keys in self._buckets[0].values())
@@ -0,0 +1,52 @@
+"""Minimal compiled templates for the HTML pages (editions, archive indexes).
+
+A template is plain HTML with {{NAME}} placeholders (upper-case names). It is
+split once into literal and slot segments; rendering fills the slots and joins
+the segments in a single pass, instead of one full-document str.replace per
+placeholder. Compiled templates are cached per file and recompiled when the
+file's mtime changes.
+"""
+
+import re
+import threading
+
+from log_utils import PROJECT_DIR
+
+TEMPLATES_DIR = PROJECT_DIR / "templates"
+SLOT_RE = re.compile(r"\{\{([A-Z][A-Z0-9_]*)\}\}")
+
+_cache = {}  # path -> (mtime_ns, Template)
+_cache_lock = threading.Lock()
+
+
+class Template:
+    """Compiled template: literals at even indexes, slot names at odd indexes."""
+
+    def __init__(self, source, name="<string>"):
+        self.name = name
+        self.segments = SLOT_RE.split(source)
+        self.slots = frozenset(self.segments[1::2])
+
+    def render(self, values):
+        """Fill every slot from values (str() applied); raises KeyError for a missing one."""
+        missing = self.slots - values.keys()
+        if missing:
+            raise KeyError(f"Template {self.name}: no value for {', '.join(sorted(missing))}")
+        parts = self.segments[:]
+        for i in range(1, len(parts), 2):
+            parts[i] = str(values[parts[i]])
+        return "".join(parts)
+
+
+def load(name):
+    """Compiled template for a file of templates/ (or a path), cached on its mtime."""
+    path = TEMPLATES_DIR / name
+    mtime_ns = path.stat().st_mtime_ns
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+    template = Template(path.read_text(encoding="utf-8"), path.name)
+    with _cache_lock:
+        _cache[path] = (mtime_ns, template)
+    return template
@@ -6,93 +6,132 @@ Models reference: config/image-models.yaml
 Usage:
     python scripts/test_image.py                  # use prompt from .pipeline/linkedin/image_prompt.txt
     python scripts/test_image.py "a cute robot"   # use custom prompt
+
+Benchmark mode: fires the same prompt at every model concurrently, K times,
+and writes a JSON + markdown report (latency percentiles, output size,
+failures) to .pipeline/linkedin/benchmark/:
+    python scripts/test_image.py --benchmark --reps 5
+    python scripts/test_image.py --benchmark --models gemini-2.5-flash-image,imagen-4.0-fast-generate-001
+    python scripts/test_image.py --benchmark --mock    # offline, fake GenAI client
 """
 
+import argparse
+import json
 import os
+import random
+import struct
 import sys
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
+from types import SimpleNamespace
 
-from google import genai
-from google.genai import types
+import yaml
 
-from log_utils import setup_logging
+from log_utils import setup_logging, PROJECT_DIR
 
 logger = setup_logging("test_image")
 
-api_key = os.environ.get("GOOGLE_API_KEY")
-if not api_key:
-    print("GOOGLE_API_KEY not set")
-    sys.exit(1)
-
-# Prompt: argument > file > default
-if len(sys.argv) > 1:
-    prompt = " ".join(sys.argv[1:])
-else:
-    prompt_path = Path(__file__).parent.parent / ".pipeline" / "linkedin" / "image_prompt.txt"
-    if prompt_path.exists():
-        prompt = prompt_path.read_text(encoding="utf-8").strip()
-    else:
-        prompt = "a futuristic cityscape at sunset, digital art style"
+OUTPUT_DIR = PROJECT_DIR / ".pipeline" / "linkedin"
+BENCHMARK_DIR = OUTPUT_DIR / "benchmark"
+PROMPT_PATH = OUTPUT_DIR / "image_prompt.txt"
+MODELS_PATH = PROJECT_DIR / "config" / "image-models.yaml"
+DEFAULT_PROMPT = "a futuristic cityscape at sunset, digital art style"
+PERCENTILES = (50, 90, 95)
 
-print(f"Prompt ({len(prompt)} chars): {prompt[:200]}")
-print()
+# (name, family, model_id, filename, aspect_ratio) for the default test run
+TESTS = [
+    # Gemini family
+    ("Nano Banana — gemini-2.5-flash-image",
+     "gemini", "gemini-2.5-flash-image", "test_nano_banana.png", None),
 
-client = genai.Client(api_key=api_key)
-output_dir = Path(__file__).parent.parent / ".pipeline" / "linkedin"
-output_dir.mkdir(parents=True, exist_ok=True)
+    ("Nano Banana Pro — gemini-3-pro-image-preview",
+     "gemini", "gemini-3-pro-image-preview", "test_nano_banana_pro.png", None),
 
-results = []
+    ("Nano Banana 2 — gemini-3.1-flash-image-preview",
+     "gemini", "gemini-3.1-flash-image-preview", "test_nano_banana_2.png", None),
 
+    # Imagen family
+    ("Imagen 4 Fast — imagen-4.0-fast-generate-001",
+     "imagen", "imagen-4.0-fast-generate-001", "test_imagen4_fast.png", None),
 
-def run_test(name, func):
-    """Run a test and collect results."""
-    print("=" * 60)
-    print(f"  {name}")
-    print("=" * 60)
-    t0 = time.time()
-    try:
-        path = func()
-        elapsed = time.time() - t0
-        print(f"  OK -> {path}")
-        logger.debug(f"{name}: OK in {elapsed:.1f}s -> {path}")
-        results.append((name, "OK", str(path)))
-    except Exception as e:
-        elapsed = time.time() - t0
-        err = str(e).split("\n")[0][:120]
-        print(f"  ERREUR: {err}")
-        logger.debug(f"{name}: ERREUR in {elapsed:.1f}s: {err}")
-        results.append((name, "ERREUR", err))
-    print()
+    ("Imagen 4 — imagen-4.0-generate-001",
+     "imagen", "imagen-4.0-generate-001", "test_imagen4.png", None),
 
+    ("Imagen 4 (16:9) — imagen-4.0-generate-001",
+     "imagen", "imagen-4.0-generate-001", "test_imagen4_16x9.png", "16:9"),
 
-# ── Gemini models (generate_content API) ─────────────────────
+    ("Imagen 4 Ultra — imagen-4.0-ultra-generate-001",
+     "imagen", "imagen-4.0-ultra-generate-001", "test_imagen4_ultra.png", None),
+]
 
-def test_gemini(model_id, filename):
-    """Test a Gemini model via generate_content."""
-    def _run():
-        response = client.models.generate_content(
-            model=model_id,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                response_modalities=["IMAGE", "TEXT"],
-            ),
-        )
-        for part in response.candidates[0].content.parts:
-            if part.inline_data and part.inline_data.mime_type.startswith("image/"):
-                out = output_dir / filename
-                with open(out, "wb") as f:
-                    f.write(part.inline_data.data)
-                return out
-        raise RuntimeError("Aucune image dans la reponse")
-    return _run
 
+# ── Clients ───────────────────────────────────────────────────
 
-# ── Imagen models (generate_images API) ──────────────────────
+def real_client():
+    """Return (client, types) for the Google GenAI SDK."""
+    api_key = os.environ.get("GOOGLE_API_KEY")
+    if not api_key:
+        print("GOOGLE_API_KEY not set")
+        sys.exit(1)
 
-def test_imagen(model_id, filename, aspect_ratio=None):
-    """Test an Imagen model via generate_images."""
-    def _run():
+    from google import genai
+    from google.genai import types
+
+    return genai.Client(api_key=api_key), types
+
+
+def _fake_png(width, height, seed):
+    """Build a small valid PNG (noise rows) so mock outputs have a realistic shape."""
+    rng = random.Random(seed)
+    rows = b"".join(b"\x00" + rng.randbytes(width * 3) for _ in range(height))
+
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(rows))
+            + chunk(b"IEND", b""))
+
+
+class MockGenAIClient:
+    """Offline stand-in for genai.Client: same call shapes, simulated latency/failures."""
+
+    def __init__(self, latency=0.2, fail_rate=0.0, seed=0):
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self._rng = random.Random(seed)
+        self.models = self
+
+    def _simulate(self, model):
+        # Per-model base latency (deterministic) with some jitter
+        base = self.latency * (1 + (zlib.crc32(model.encode()) % 5) / 2)
+        time.sleep(base * self._rng.uniform(0.7, 1.5))
+        if self._rng.random() < self.fail_rate:
+            raise RuntimeError(f"mock failure for {model}")
+        return _fake_png(64, 32, self._rng.random())
+
+    def generate_content(self, model, contents, config=None):
+        data = self._simulate(model)
+        part = SimpleNamespace(inline_data=SimpleNamespace(mime_type="image/png", data=data))
+        return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+
+    def generate_images(self, model, prompt, config=None):
+        data = self._simulate(model)
+        return SimpleNamespace(generated_images=[SimpleNamespace(image=SimpleNamespace(image_bytes=data))])
+
+
+MOCK_TYPES = SimpleNamespace(GenerateContentConfig=SimpleNamespace, GenerateImagesConfig=SimpleNamespace)
+
+
+# ── Generation ────────────────────────────────────────────────
+
+def generate(client, types, family, model_id, prompt, aspect_ratio=None):
+    """Generate one image and return its bytes."""
+    if family == "imagen":
         config = types.GenerateImagesConfig(
             number_of_images=1,
             output_mime_type="image/png",
@@ -105,54 +144,249 @@ def test_imagen(model_id, filename, aspect_ratio=None):
             config=config,
         )
         if response.generated_images:
-            out = output_dir / filename
-            response.generated_images[0].image.save(str(out))
-            return out
+            return response.generated_images[0].image.image_bytes
         raise RuntimeError("Aucune image retournee")
-    return _run
 
+    response = client.models.generate_content(
+        model=model_id,
+        contents=prompt,
+        config=types.GenerateContentConfig(
+            response_modalities=["IMAGE", "TEXT"],
+        ),
+    )
+    for part in response.candidates[0].content.parts:
+        if part.inline_data and part.inline_data.mime_type.startswith("image/"):
+            return part.inline_data.data
+    raise RuntimeError("Aucune image dans la reponse")
 
-# ── All tests ─────────────────────────────────────────────────
 
-TESTS = [
-    # Gemini family
-    ("Nano Banana — gemini-2.5-flash-image",
-     test_gemini("gemini-2.5-flash-image", "test_nano_banana.png")),
+def load_models(selected=None):
+    """Return [(model_id, family, alias)] from image-models.yaml, optionally filtered."""
+    with open(MODELS_PATH, encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    models = []
+    for family in ("gemini", "imagen"):
+        for model_id, info in (data.get(family) or {}).items():
+            if isinstance(info, dict) and "alias" in info:
+                models.append((model_id, family, info["alias"]))
+    if selected:
+        unknown = set(selected) - {m[0] for m in models}
+        if unknown:
+            raise SystemExit(f"Modeles inconnus : {', '.join(sorted(unknown))}")
+        models = [m for m in models if m[0] in selected]
+    return models
 
-    ("Nano Banana Pro — gemini-3-pro-image-preview",
-     test_gemini("gemini-3-pro-image-preview", "test_nano_banana_pro.png")),
 
-    ("Nano Banana 2 — gemini-3.1-flash-image-preview",
-     test_gemini("gemini-3.1-flash-image-preview", "test_nano_banana_2.png")),
+def load_prompt(words):
+    """Prompt: argument > file > default."""
+    if words:
+        return " ".join(words)
+    if PROMPT_PATH.exists():
+        return PROMPT_PATH.read_text(encoding="utf-8").strip()
+    return DEFAULT_PROMPT
 
-    # Imagen family
-    ("Imagen 4 Fast — imagen-4.0-fast-generate-001",
-     test_imagen("imagen-4.0-fast-generate-001", "test_imagen4_fast.png")),
 
-    ("Imagen 4 — imagen-4.0-generate-001",
-     test_imagen("imagen-4.0-generate-001", "test_imagen4.png")),
+# ── Default mode: one image per model, sequential ────────────
 
-    ("Imagen 4 (16:9) — imagen-4.0-generate-001",
-     test_imagen("imagen-4.0-generate-001", "test_imagen4_16x9.png", aspect_ratio="16:9")),
+def run_tests(client, types, prompt):
+    """Run every entry of TESTS once and print a summary."""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    results = []
+
+    for name, family, model_id, filename, aspect_ratio in TESTS:
+        print("=" * 60)
+        print(f"  {name}")
+        print("=" * 60)
+        t0 = time.time()
+        try:
+            out = OUTPUT_DIR / filename
+            out.write_bytes(generate(client, types, family, model_id, prompt, aspect_ratio))
+            elapsed = time.time() - t0
+            print(f"  OK -> {out}")
+            logger.debug(f"{name}: OK in {elapsed:.1f}s -> {out}")
+            results.append((name, "OK", str(out)))
+        except Exception as e:
+            elapsed = time.time() - t0
+            err = str(e).split("\n")[0][:120]
+            print(f"  ERREUR: {err}")
+            logger.debug(f"{name}: ERREUR in {elapsed:.1f}s: {err}")
+            results.append((name, "ERREUR", err))
+        print()
+
+    print("=" * 60)
+    print("  RESULTATS")
+    print("=" * 60)
+    ok = sum(1 for _, s, _ in results if s == "OK")
+    print(f"  {ok}/{len(results)} tests OK\n")
+    for name, status, detail in results:
+        icon = "OK" if status == "OK" else "!!"
+        print(f"  [{icon}] {name}")
+        if status != "OK":
+            print(f"       {detail}")
+    print()
+    print(f"Images dans {OUTPUT_DIR}/")
+
+
+# ── Benchmark mode ────────────────────────────────────────────
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-pct * len(ordered) // 100))  # ceil(pct/100 * n)
+    return ordered[rank - 1]
+
+
+def _timed_call(client, types, model, prompt, rep, save_dir):
+    model_id, family, _ = model
+    t0 = time.perf_counter()
+    try:
+        data = generate(client, types, family, model_id, prompt)
+        latency = time.perf_counter() - t0
+        if save_dir is not None:
+            (save_dir / f"{model_id}_{rep}.png").write_bytes(data)
+        return {"model": model_id, "rep": rep, "ok": True, "latency_s": latency, "bytes": len(data)}
+    except Exception as e:
+        latency = time.perf_counter() - t0
+        return {"model": model_id, "rep": rep, "ok": False, "latency_s": latency,
+                "error": str(e).split("\n")[0][:200]}
+
+
+def run_benchmark(client, types, models, prompt, reps, concurrency, save_dir=None):
+    """Fire the prompt at all models concurrently, reps times. Returns the raw samples."""
+    samples = []
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for rep in range(1, reps + 1):
+            t0 = time.perf_counter()
+            round_samples = list(pool.map(
+                lambda m: _timed_call(client, types, m, prompt, rep, save_dir), models,
+            ))
+            samples.extend(round_samples)
+            failed = sum(1 for s in round_samples if not s["ok"])
+            print(f"  Repetition {rep}/{reps} : {time.perf_counter() - t0:.1f}s"
+                  f"{f', {failed} echec(s)' if failed else ''}")
+    return samples
+
+
+def summarize(models, samples):
+    """Aggregate samples per model: latency percentiles, sizes, failures."""
+    summary = []
+    for model_id, family, alias in models:
+        mine = [s for s in samples if s["model"] == model_id]
+        ok = [s for s in mine if s["ok"]]
+        latencies = [s["latency_s"] for s in ok]
+        sizes = [s["bytes"] for s in ok]
+        stats = {
+            "model": model_id,
+            "family": family,
+            "alias": alias,
+            "runs": len(mine),
+            "ok": len(ok),
+            "failures": len(mine) - len(ok),
+            "errors": sorted({s["error"] for s in mine if not s["ok"]}),
+        }
+        if latencies:
+            stats.update({f"p{p}_s": round(percentile(latencies, p), 3) for p in PERCENTILES})
+            stats.update({
+                "min_s": round(min(latencies), 3),
+                "max_s": round(max(latencies), 3),
+                "mean_s": round(sum(latencies) / len(latencies), 3),
+                "mean_bytes": round(sum(sizes) / len(sizes)),
+            })
+        summary.append(stats)
+    return summary
+
+
+def render_markdown(report):
+    """Render the benchmark report as a markdown table."""
+    lines = [
+        f"# Benchmark generation d'image — {report['generated_at']}",
+        "",
+        f"- Prompt ({len(report['prompt'])} chars) : {report['prompt'][:200]}",
+        f"- Repetitions : {report['reps']}, concurrence : {report['concurrency']}"
+        f"{' (mock)' if report['mock'] else ''}",
+        f"- Duree totale : {report['wall_time_s']:.1f}s",
+        "",
+        "| Modele | Alias | OK | Echecs | " + " | ".join(f"p{p} (s)" for p in PERCENTILES)
+        + " | Max (s) | Taille moy. (Ko) |",
+        "|---|---|---|---|" + "---|" * len(PERCENTILES) + "---|---|",
+    ]
+    for s in report["models"]:
+        if s["ok"]:
+            cells = [f"{s[f'p{p}_s']:.2f}" for p in PERCENTILES] + [
+                f"{s['max_s']:.2f}", f"{s['mean_bytes'] / 1024:.0f}"]
+        else:
+            cells = ["—"] * (len(PERCENTILES) + 2)
+        lines.append(f"| `{s['model']}` | {s['alias']} | {s['ok']}/{s['runs']} | {s['failures']} | "
+                     + " | ".join(cells) + " |")
+    errors = [(s["model"], e) for s in report["models"] for e in s["errors"]]
+    if errors:
+        lines += ["", "## Erreurs", ""] + [f"- `{m}` : {e}" for m, e in errors]
+    return "\n".join(lines) + "\n"
+
+
+def write_report(report, output_dir):
+    """Write report.json and report.md; return their paths."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    json_path = output_dir / "report.json"
+    md_path = output_dir / "report.md"
+    json_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    md_path.write_text(render_markdown(report), encoding="utf-8")
+    return json_path, md_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test / benchmark image generation models")
+    parser.add_argument("prompt", nargs="*", help="Prompt (default: image_prompt.txt, then a stock prompt)")
+    parser.add_argument("--benchmark", action="store_true", help="Concurrent latency benchmark")
+    parser.add_argument("--models", help="Comma-separated model ids (default: all of image-models.yaml)")
+    parser.add_argument("--reps", type=int, default=3, help="Repetitions per model (default: 3)")
+    parser.add_argument("--concurrency", type=int, help="Max concurrent requests (default: number of models)")
+    parser.add_argument("--output", type=Path, default=BENCHMARK_DIR, help="Report directory")
+    parser.add_argument("--save-images", action="store_true", help="Keep benchmark images in the report directory")
+    parser.add_argument("--mock", action="store_true", help="Use an offline mock GenAI client")
+    parser.add_argument("--mock-latency", type=float, default=0.2, help="Mock base latency in seconds")
+    parser.add_argument("--mock-fail-rate", type=float, default=0.0, help="Mock failure probability")
+    args = parser.parse_args()
+
+    prompt = load_prompt(args.prompt)
+    if args.mock:
+        client, types = MockGenAIClient(args.mock_latency, args.mock_fail_rate), MOCK_TYPES
+    else:
+        client, types = real_client()
+
+    print(f"Prompt ({len(prompt)} chars): {prompt[:200]}")
+    print()
+
+    if not args.benchmark:
+        run_tests(client, types, prompt)
+        return
+
+    models = load_models(args.models.split(",") if args.models else None)
+    concurrency = max(1, args.concurrency or len(models))
+    print(f"Benchmark : {len(models)} modeles x {args.reps} repetitions, concurrence {concurrency}")
+
+    save_dir = None
+    if args.save_images:
+        save_dir = args.output / "images"
+        save_dir.mkdir(parents=True, exist_ok=True)
+
+    t0 = time.perf_counter()
+    samples = run_benchmark(client, types, models, prompt, args.reps, concurrency, save_dir)
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "prompt": prompt,
+        "reps": args.reps,
+        "concurrency": concurrency,
+        "mock": args.mock,
+        "wall_time_s": round(time.perf_counter() - t0, 3),
+        "models": summarize(models, samples),
+        "samples": samples,
+    }
+    json_path, md_path = write_report(report, args.output)
+    print()
+    print(render_markdown(report))
+    logger.info(f"[BENCHMARK] Report -> {json_path}, {md_path}")
 
-    ("Imagen 4 Ultra — imagen-4.0-ultra-generate-001",
-     test_imagen("imagen-4.0-ultra-generate-001", "test_imagen4_ultra.png")),
-]
 
-for name, func in TESTS:
-    run_test(name, func)
-
-# ── Summary ───────────────────────────────────────────────────
-
-print("=" * 60)
-print("  RESULTATS")
-print("=" * 60)
-ok = sum(1 for _, s, _ in results if s == "OK")
-print(f"  {ok}/{len(results)} tests OK\n")
-for name, status, detail in results:
-    icon = "OK" if status == "OK" else "!!"
-    print(f"  [{icon}] {name}")
-    if status != "OK":
-        print(f"       {detail}")
-print()
-print(f"Images dans {output_dir}/")
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,16 @@
 Reads .pipeline/01_candidates.json (25 candidates),
 calls claude -p to select top 10 + write editorials + synthesis,
 validates output, retries on failure (max 2 attempts).
-Writes .pipeline/02_editorial.json.
+Writes .pipeline/02_editorial.json, or the path given by --output (the
+dashboard gives each style variant its own file so variants can run in
+parallel).
+
+Responses that pass validation are cached in .cache/llm (see llm_cache.py):
+a rerun with the same candidates and prompt reuses them. --no-cache or
+RP_NO_LLM_CACHE=1 forces a fresh call.
 """
 
+import argparse
 import json
 import os
 import re
@@ -15,6 +22,7 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+import llm_cache
 from log_utils import setup_logging, load_config, PROJECT_DIR, PIPELINE_DIR
 
 logger = setup_logging("editorial")
@@ -80,6 +88,14 @@ PROMPT_PATH = PROJECT_DIR / "scripts" / "prompts" / "editorial.md"
 CANDIDATES_PATH = PIPELINE_DIR / "01_candidates.json"
 OUTPUT_PATH = PIPELINE_DIR / "02_editorial.json"
 MAX_ATTEMPTS = 2
+CLAUDE_CMD = [
+    "claude", "-p",
+    "--model", "opus",
+    "--permission-mode", "default",
+    "--tools", "",
+    "--output-format", "text",
+    "--no-session-persistence",
+]
 
 
 def _repair_json_quotes(text):
@@ -202,17 +218,18 @@ def validate_editorial(data):
     return errors
 
 
+def check_response(raw_response):
+    """Parsed editorial of a raw response and its errors (empty when valid)."""
+    data = extract_json(raw_response)
+    if data is None:
+        return None, ["Could not parse JSON from response. Make sure to return ONLY a JSON array."]
+    return data, validate_editorial(data)
+
+
 def call_claude(prompt, timeout=480):
     """Call claude -p and return stdout."""
     result = subprocess.run(
-        [
-            "claude", "-p",
-            "--model", "opus",
-            "--permission-mode", "default",
-            "--tools", "",
-            "--output-format", "text",
-            "--no-session-persistence",
-        ],
+        CLAUDE_CMD,
         input=prompt,
         capture_output=True,
         text=True,
@@ -225,8 +242,20 @@ def call_claude(prompt, timeout=480):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Phase 2: editorial via claude -p")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore and do not update the LLM response cache")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH,
+                        help=f"Output JSON path (default: {OUTPUT_PATH})")
+    args = parser.parse_args()
+    output_path = args.output
+    # Raw attempts are named after the output so parallel variants don't collide
+    raw_prefix = "02_raw" if output_path == OUTPUT_PATH else f"{output_path.stem}_raw"
+
     PIPELINE_DIR.mkdir(exist_ok=True)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
     config = load_config()
+    cache = llm_cache.from_config(config, enabled=not args.no_cache)
     timeout = config.get("edition", {}).get("timeouts", {}).get("editorial", 480)
     today = os.environ.get("RP_EDITION_DATE") or datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
@@ -281,28 +310,35 @@ def main():
                 + f"Corrige ces erreurs dans ta reponse :\n{error_feedback}\n"
             )
 
-        try:
-            raw_response = call_claude(prompt, timeout=timeout)
-        except Exception as e:
-            logger.error(f"[ERROR] claude -p call failed: {e}")
-            last_errors = [str(e)]
-            continue
+        cache_key = llm_cache.cache_key(CLAUDE_CMD, prompt)
+        raw_response = cache.get(cache_key)
+        if raw_response is not None:
+            data, errors = check_response(raw_response)
+            if errors:
+                # Stale entry (e.g. validation rules changed): does not use up the attempt
+                logger.warning(f"[CACHE] Cached response rejected ({errors[0]}), calling claude -p")
+                cache.discard(cache_key)
+                raw_response = None
+        from_cache = raw_response is not None
+        if not from_cache:
+            try:
+                raw_response = call_claude(prompt, timeout=timeout)
+            except Exception as e:
+                logger.error(f"[ERROR] claude -p call failed: {e}")
+                last_errors = [str(e)]
+                continue
+            data, errors = check_response(raw_response)
 
         # Save raw response for debugging
-        raw_path = PIPELINE_DIR / f"02_raw_attempt_{attempt}.txt"
+        raw_path = output_path.parent / f"{raw_prefix}_attempt_{attempt}.txt"
         raw_path.write_text(raw_response, encoding="utf-8")
 
         logger.debug(f"Raw response: {len(raw_response)} chars, saved to {raw_path}")
 
-        # Extract JSON
-        data = extract_json(raw_response)
         if data is None:
             logger.error(f"[ERROR] Could not extract JSON from response (attempt {attempt})")
-            last_errors = ["Could not parse JSON from response. Make sure to return ONLY a JSON array."]
+            last_errors = errors
             continue
-
-        # Validate
-        errors = validate_editorial(data)
         if errors:
             logger.error(f"[ERROR] Validation failed ({len(errors)} errors, attempt {attempt}):")
             for err in errors:
@@ -310,12 +346,17 @@ def main():
             last_errors = errors
             continue
 
-        # Success
-        with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        # Success: only validated responses are cached
+        if not from_cache:
+            cache.put(cache_key, raw_response, style=edito_style, prompt_version=prompt_version)
+
+        with open(output_path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
-        logger.info(f"[EDITORIAL] Success: {len(data)} articles (1 synthesis + {len(data)-1} articles) -> {OUTPUT_PATH}")
-        print(str(OUTPUT_PATH))
+        logger.info(f"[EDITORIAL] Success: {len(data)} articles (1 synthesis + {len(data)-1} articles) -> {output_path}")
+        if cache.enabled:
+            logger.info(f"[EDITORIAL] LLM cache: {cache.summary()}")
+        print(str(output_path))
         return
 
     # All attempts failed